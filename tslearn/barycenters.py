@@ -8,11 +8,13 @@ import numpy
 from scipy.interpolate import interp1d
 from scipy.optimize import minimize
 from sklearn.exceptions import ConvergenceWarning
+from sklearn.externals.joblib import Parallel, delayed, effective_n_jobs
 import warnings
 
-from tslearn.utils import to_time_series_dataset, check_equal_size, to_time_series
+from tslearn.utils import to_time_series_dataset, check_equal_size, to_time_series, ts_size
 from tslearn.preprocessing import TimeSeriesResampler
-from tslearn.metrics import dtw_path, SquaredEuclidean, SoftDTW
+from tslearn.metrics import SquaredEuclidean, SoftDTW, _dtw_mask
+from tslearn.cydtw import dtw_path as cydtw_path
 
 
 __author__ = 'Romain Tavenard romain.tavenard[at]univ-rennes2.fr'
@@ -176,11 +178,11 @@ class DTWBarycenterAveraging(EuclideanBarycenter):
             barycenter = self.init_barycenter
         cost_prev, cost = numpy.inf, numpy.inf
         for it in range(self.max_iter):
-            assign = self._petitjean_assignment(X_, barycenter)
-            cost = self._petitjean_cost(X_, barycenter, assign)
+            assign, dists = _petitjean_assignment(X_, barycenter)
+            cost = _petitjean_cost(dists, self.weights)
             if self.verbose:
                 print("[DBA] epoch %d, cost: %.3f" % (it + 1, cost))
-            barycenter = self._petitjean_update_barycenter(X_, assign)
+            barycenter = _petitjean_update_barycenter(X_, assign, self.barycenter_size, self.weights)
             if abs(cost_prev - cost) < self.tol:
                 break
             elif cost_prev < cost:
@@ -198,30 +200,6 @@ class DTWBarycenterAveraging(EuclideanBarycenter):
             f = interp1d(numpy.linspace(0, 1, X_avg.shape[0]), X_avg, kind="linear", axis=0)
             return f(xnew)
 
-    def _petitjean_assignment(self, X, barycenter):
-        n = X.shape[0]
-        assign = ([[] for _ in range(self.barycenter_size)], [[] for _ in range(self.barycenter_size)])
-        for i in range(n):
-            path, _ = dtw_path(X[i], barycenter)
-            for pair in path:
-                assign[0][pair[1]].append(i)
-                assign[1][pair[1]].append(pair[0])
-        return assign
-
-    def _petitjean_update_barycenter(self, X, assign):
-        barycenter = numpy.zeros((self.barycenter_size, X.shape[-1]))
-        for t in range(self.barycenter_size):
-            barycenter[t] = numpy.average(X[assign[0][t], assign[1][t]], axis=0, weights=self.weights[assign[0][t]])
-        return barycenter
-
-    def _petitjean_cost(self, X, barycenter, assign):
-        cost = 0.
-        for t_barycenter in range(self.barycenter_size):
-            for i_ts, t_ts in zip(assign[0][t_barycenter], assign[1][t_barycenter]):
-                cost += self.weights[i_ts] * numpy.linalg.norm(X[i_ts, t_ts] - barycenter[t_barycenter]) ** 2
-        return cost / self.weights.sum()
-
-
 def _init_avg(X, barycenter_size):
     if X.shape[1] == barycenter_size:
         return numpy.nanmean(X, axis=0)
@@ -232,36 +210,74 @@ def _init_avg(X, barycenter_size):
         return f(xnew)
 
 
-def _petitjean_assignment(X, barycenter):
+def _dtw_paths(X, barycenter, masks):
+    return [cydtw_path(X[i], barycenter, masks[ts_size(X[i])]) for i in range(X.shape[0])]
+
+
+def _petitjean_assignment(X, barycenter, global_constraint=None, sakoe_chiba_radius=1, n_jobs=None):
+    """Align all time series in X to the barycenter.
+
+    Alignments are returned as three index arrays that list, for all pairs of all DTW paths, the index of the time
+    series, the timestamp in that time series and the matching barycenter timestamp. DTW scores are returned too.
+
+    Masks of admissible alignments are built once per time series length (so that global constraints are defined
+    with respect to the actual length of each time series rather than the padded one). Time series are split into as
+    many chunks as there are jobs, so that masks are only sent once to each worker.
+
+    Examples
+    --------
+    >>> X = to_time_series_dataset([[1, 2, 3], [1, 3]])
+    >>> (i_ts, t_ts, t_bar), dists = _petitjean_assignment(X, numpy.array([[1.], [2.], [3.]]))
+    >>> i_ts
+    array([0, 0, 0, 1, 1, 1])
+    >>> t_ts
+    array([0, 1, 2, 0, 1, 1])
+    >>> t_bar
+    array([0, 1, 2, 0, 1, 2])
+    >>> dists
+    array([ 0.,  1.])
+    >>> X = to_time_series_dataset([[1, 2, 3, 4, 3, 2], [0, 1, 2, 4, 5, 4, 3, 2]])
+    >>> barycenter = numpy.linspace(0., 4., 10).reshape((-1, 1))
+    >>> (i_ts, t_ts, t_bar), dists = _petitjean_assignment(X, barycenter, global_constraint="sakoe_chiba",
+    ...                                                    sakoe_chiba_radius=1)
+    >>> from tslearn.metrics import dtw_path
+    >>> numpy.allclose(dists, [dtw_path(to_time_series(ts, remove_nans=True), barycenter,
+    ...                                 global_constraint="sakoe_chiba", sakoe_chiba_radius=1)[1] for ts in X])
+    True
+    >>> t_bar[i_ts == 0].max(), t_ts[i_ts == 0].max()
+    (9, 5)
+    """
     n = X.shape[0]
-    barycenter_size = barycenter.shape[0]
-    assign = ([[] for _ in range(barycenter_size)], [[] for _ in range(barycenter_size)])
-    for i in range(n):
-        path, _ = dtw_path(X[i], barycenter)
-        for pair in path:
-            assign[0][pair[1]].append(i)
-            assign[1][pair[1]].append(pair[0])
-    return assign
+    barycenter = to_time_series(barycenter)
+    masks = dict((sz, _dtw_mask(sz, barycenter.shape[0], global_constraint, sakoe_chiba_radius))
+                 for sz in set(ts_size(ts) for ts in X))
+    chunks = [chunk for chunk in numpy.array_split(numpy.arange(n), min(effective_n_jobs(n_jobs), n)) if len(chunk)]
+    results = Parallel(n_jobs=n_jobs)(delayed(_dtw_paths)(X[chunk], barycenter, masks) for chunk in chunks)
+    results = [res for chunk_results in results for res in chunk_results]
+    paths = [numpy.array(path, dtype=numpy.int) for path, _ in results]
+    dists = numpy.array([dist for _, dist in results])
+    pairs = numpy.vstack(paths)
+    i_ts = numpy.repeat(numpy.arange(n), [len(path) for path in paths])
+    return (i_ts, pairs[:, 0], pairs[:, 1]), dists
 
 
 def _petitjean_update_barycenter(X, assign, barycenter_size, weights):
-    barycenter = numpy.zeros((barycenter_size, X.shape[-1]))
-    for t in range(barycenter_size):
-        barycenter[t] = numpy.average(X[assign[0][t], assign[1][t]], axis=0, weights=weights[assign[0][t]])
-    return barycenter
+    i_ts, t_ts, t_bar = assign
+    pair_weights = weights[i_ts]
+    values = X[i_ts, t_ts]
+    barycenter = numpy.empty((barycenter_size, X.shape[-1]))
+    for di in range(X.shape[-1]):
+        barycenter[:, di] = numpy.bincount(t_bar, weights=pair_weights * values[:, di], minlength=barycenter_size)
+    return barycenter / numpy.bincount(t_bar, weights=pair_weights, minlength=barycenter_size).reshape((-1, 1))
 
 
-def _petitjean_cost(X, barycenter, assign, weights):
-    cost = 0.
-    barycenter_size = barycenter.shape[0]
-    for t_barycenter in range(barycenter_size):
-        for i_ts, t_ts in zip(assign[0][t_barycenter], assign[1][t_barycenter]):
-            cost += weights[i_ts] * numpy.linalg.norm(X[i_ts, t_ts] - barycenter[t_barycenter]) ** 2
-    return cost / weights.sum()
+def _petitjean_cost(dists, weights):
+    # Squared DTW is the sum of squared distances between aligned pairs
+    return numpy.sum(weights * dists ** 2) / weights.sum()
 
 
 def dtw_barycenter_averaging(X, barycenter_size=None, init_barycenter=None, max_iter=30, tol=1e-5, weights=None,
-                             verbose=False):
+                             verbose=False, n_jobs=None, global_constraint=None, sakoe_chiba_radius=1):
     """DTW Barycenter Averaging (DBA) method.
 
     DBA was originally presented in [1]_.
@@ -284,6 +300,13 @@ def dtw_barycenter_averaging(X, barycenter_size=None, init_barycenter=None, max_
         Weights of each X[i]. Must be the same size as len(X).
     verbose : boolean (default: False)
         Whether to print information about the cost at each iteration or not.
+    n_jobs : int or None, optional (default=None)
+        The number of jobs to use to compute the DTW alignments of the time series to the barycenter in parallel.
+        ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context. ``-1`` means using all processors.
+    global_constraint : {"itakura", "sakoe_chiba"} or None (default: None)
+        Global constraint to restrict admissible DTW alignments between the time series and the barycenter.
+    sakoe_chiba_radius : int (default: 1)
+        Radius to be used for Sakoe-Chiba band global constraint. Used only if global_constraint is "sakoe_chiba".
 
     Returns
     -------
@@ -307,6 +330,11 @@ def dtw_barycenter_averaging(X, barycenter_size=None, init_barycenter=None, max_
     >>> dba_bar = dtw_barycenter_averaging(time_series)  # doctest: +ELLIPSIS
     >>> X = to_time_series_dataset([[1, 2, 3, 4], [1, 2, 3], [2, 5, 6, 7, 8, 9]])
     >>> bar = dtw_barycenter_averaging(X, barycenter_size=3)
+    >>> bar_band = dtw_barycenter_averaging(time_series, global_constraint="sakoe_chiba", sakoe_chiba_radius=1, \
+                                            n_jobs=2)
+    >>> numpy.alltrue(bar_band == dtw_barycenter_averaging(time_series, global_constraint="sakoe_chiba", \
+                                                           sakoe_chiba_radius=1))
+    True
 
     References
     ----------
@@ -324,8 +352,9 @@ def dtw_barycenter_averaging(X, barycenter_size=None, init_barycenter=None, max_
         barycenter = init_barycenter
     cost_prev, cost = numpy.inf, numpy.inf
     for it in range(max_iter):
-        assign = _petitjean_assignment(X_, barycenter)
-        cost = _petitjean_cost(X_, barycenter, assign, weights)
+        assign, dists = _petitjean_assignment(X_, barycenter, global_constraint=global_constraint,
+                                              sakoe_chiba_radius=sakoe_chiba_radius, n_jobs=n_jobs)
+        cost = _petitjean_cost(dists, weights)
         if verbose:
             print("[DBA] epoch %d, cost: %.3f" % (it + 1, cost))
         barycenter = _petitjean_update_barycenter(X_, assign, barycenter_size, weights)
@@ -5,16 +5,24 @@ The :mod:`tslearn.clustering` module gathers time series specific clustering alg
 from __future__ import print_function
 from sklearn.base import BaseEstimator, ClusterMixin
 from sklearn.cluster.k_means_ import _k_init
-from sklearn.metrics.cluster import silhouette_score as sklearn_silhouette_score
-from sklearn.utils import check_random_state
+from sklearn.metrics.cluster.unsupervised import check_number_of_labels
+from sklearn.preprocessing import LabelEncoder
+from sklearn.utils import check_random_state, get_chunk_n_rows
+from sklearn.utils.extmath import safe_sparse_dot
+from sklearn.externals.joblib import Parallel, delayed, effective_n_jobs
 from scipy.spatial.distance import cdist
+from scipy.sparse import csr_matrix
+from scipy.sparse.linalg import LinearOperator, eigsh
 import numpy
+import copy
 
-from tslearn.metrics import cdist_gak, cdist_dtw, cdist_soft_dtw, cdist_soft_dtw_normalized, dtw
-from tslearn.barycenters import EuclideanBarycenter, dtw_barycenter_averaging, SoftDTWBarycenter
+from tslearn.metrics import cdist_gak, cdist_dtw, cdist_soft_dtw, soft_dtw, dtw, cdist_lb_keogh, \
+    _cdist_lb_first_last, _dtw_mask, _nystroem_landmarks
+from tslearn.barycenters import EuclideanBarycenter, dtw_barycenter_averaging, SoftDTWBarycenter, _softdtw_func
 from tslearn.preprocessing import TimeSeriesScalerMeanVariance
-from tslearn.utils import to_time_series_dataset, to_time_series, ts_size
-from tslearn.cycc import cdist_normalized_cc, y_shifted_sbd_vec
+from tslearn.utils import to_time_series_dataset, to_time_series, ts_size, check_equal_size
+from tslearn.cydtw import dtw as cydtw
+from tslearn.cycc import cdist_normalized_cc, y_shifted_sbd_vec, rfft_dataset
 
 
 __author__ = 'Romain Tavenard romain.tavenard[at]univ-rennes2.fr'
@@ -99,10 +107,116 @@ def _compute_inertia(distances, assignments, squared=True):
         return numpy.sum(distances[numpy.arange(n_ts), assignments]) / n_ts
 
 
+def _fit_one_init_or_none(estimator, i_init, seed, inner_n_jobs, *args):
+    """Run a single initialization of `estimator` on a shallow copy of it, so that concurrent runs do not share
+    state. The copy gets `inner_n_jobs` as the number of jobs to use within the run. Returns None if the run led to an
+    empty cluster."""
+    estimator = copy.copy(estimator)
+    estimator._inner_n_jobs = inner_n_jobs
+    try:
+        if estimator.verbose and estimator.n_init > 1:
+            print("Init %d" % (i_init + 1))
+        return estimator._fit_one_init(*args, rs=check_random_state(seed))
+    except EmptyClusterError:
+        if estimator.verbose:
+            print("Resumed because of empty cluster")
+        return None
+
+
+def _fit_best_of_n_init(estimator, args, rs):
+    """Run `estimator._fit_one_init(*args, rs=...)` until `n_init` runs succeed (or `max_attempts` is reached), in
+    parallel using `estimator.n_jobs` jobs.
+
+    Each run gets its own random seed drawn from `rs` beforehand, so that results do not depend on `n_jobs`. Large
+    arrays in `args` are memory-mapped by joblib and shared between worker processes instead of being copied. When
+    several runs are executed in parallel, each of them runs sequentially (`_inner_n_jobs=1`) so that nested
+    parallelism does not oversubscribe the processors.
+
+    Returns the fitted copy of the estimator with lowest inertia, or None if no run succeeded.
+    """
+    best_run = None
+    n_successful = 0
+    n_attempts = 0
+    while n_successful < estimator.n_init and n_attempts < estimator.max_attempts:
+        n_runs = min(estimator.n_init - n_successful, estimator.max_attempts - n_attempts)
+        seeds = rs.randint(numpy.iinfo(numpy.int32).max, size=n_runs)
+        inner_n_jobs = 1 if n_runs > 1 and effective_n_jobs(estimator.n_jobs) > 1 else estimator.n_jobs
+        runs = Parallel(n_jobs=estimator.n_jobs)(
+            delayed(_fit_one_init_or_none)(estimator, n_successful + i, seed, inner_n_jobs, *args)
+            for i, seed in enumerate(seeds)
+        )
+        n_attempts += n_runs
+        for run in runs:
+            if run is not None:
+                n_successful += 1
+                if best_run is None or run.inertia_ < best_run.inertia_:
+                    best_run = run
+    return best_run
+
+
+def _top_eigenvector_centered_gram(X, v0, max_iter=100, tol=1e-6):
+    """Top eigenvector of :math:`Q X^T X Q` (where :math:`Q` is the centering matrix) computed by power iteration,
+    warm-started from `v0`.
+
+    The matrix is never built: it is applied implicitly, hence each iteration costs O(n_ts * sz). If power iteration
+    has not converged after `max_iter` iterations (e.g. when the two leading eigenvalues are close), the eigenvector
+    is obtained from the Lanczos method (`scipy.sparse.linalg.eigsh`) applied to the same implicit operator and
+    started from the last iterate, with the sign that best matches that iterate.
+
+    Examples
+    --------
+    >>> rng = numpy.random.RandomState(0)
+    >>> X = rng.randn(20, 8) + numpy.linspace(-2., 2., 8)
+    >>> Q = numpy.eye(8) - numpy.ones((8, 8)) / 8
+    >>> _, vecs = numpy.linalg.eigh(Q.dot(X.T.dot(X)).dot(Q))
+    >>> v = _top_eigenvector_centered_gram(X, v0=rng.randn(8), max_iter=1000, tol=1e-12)
+    >>> numpy.allclose(numpy.abs(v.dot(vecs[:, -1])), 1.)
+    True
+    >>> v = _top_eigenvector_centered_gram(X, v0=rng.randn(8), max_iter=1)
+    >>> numpy.allclose(numpy.abs(v.dot(vecs[:, -1])), 1.)
+    True
+    """
+    v = v0 - v0.mean()
+    norm_v = numpy.linalg.norm(v)
+    if norm_v < 1e-9:  # Degenerate warm start (eg. constant series): start from a ramp instead
+        v = numpy.arange(v0.shape[0]) - (v0.shape[0] - 1) / 2.
+        norm_v = numpy.linalg.norm(v)
+    if norm_v < 1e-9:  # Series of length 1: Q is null
+        return numpy.ones(v0.shape)
+    v = v / norm_v
+    for _ in range(max_iter):
+        w = X.T.dot(X.dot(v))
+        w -= w.mean()
+        norm_w = numpy.linalg.norm(w)
+        if norm_w < 1e-12:  # v lies in the null space of the matrix, which is then null on centered vectors
+            return v
+        w /= norm_w
+        converged = numpy.linalg.norm(w - v) < tol
+        v = w
+        if converged:
+            return v
+    sz = X.shape[1]
+
+    def matvec(u):
+        u = numpy.ravel(u)
+        w = X.T.dot(X.dot(u - u.mean()))
+        return w - w.mean()
+
+    _, vecs = eigsh(LinearOperator((sz, sz), matvec=matvec, dtype=X.dtype), k=1, which="LA", v0=v)
+    top = vecs[:, 0]
+    return top if top.dot(v) >= 0. else -top
+
+
 def silhouette_score(X, labels, metric=None, sample_size=None, metric_params=None,
-                     random_state=None, **kwds):
+                     random_state=None, n_jobs=None, **kwds):
     """Compute the mean Silhouette Coefficient of all samples (cf.  [1]_ and  [2]_).
 
+    The distance matrix is never stored as a whole: blocks of its upper
+    triangle are computed (possibly in parallel) and reduced to per-cluster
+    sums of distances, the size of blocks being set by scikit-learn's
+    `working_memory` configuration. If ``sample_size`` is given, only
+    distances between sampled time series are computed.
+
     Read more in the `scikit-learn documentation
     <http://scikit-learn.org/stable/modules/clustering.html#silhouette-coefficient>`_.
 
@@ -134,8 +248,13 @@ def silhouette_score(X, labels, metric=None, sample_size=None, metric_params=Non
         RandomState instance, random_state is the random number generator; If
         None, the random number generator is the RandomState instance used by
         `np.random`. Used when ``sample_size is not None``.
+    n_jobs : int or None, optional (default=None)
+        The number of jobs to use to compute blocks of the distance matrix in
+        parallel. ``None`` means 1 unless in a :obj:`joblib.parallel_backend`
+        context. ``-1`` means using all processors.
     **kwds : optional keyword parameters
         Any further parameters are passed directly to the distance function.
+
     Returns
     -------
     silhouette : float
@@ -159,38 +278,93 @@ def silhouette_score(X, labels, metric=None, sample_size=None, metric_params=Non
     >>> s_sc3 = silhouette_score(X, labels, metric="softdtw")
     >>> s_sc3b = silhouette_score(X, labels, metric="softdtw", metric_params={"gamma_sdtw": 2.})
     >>> s_sc4 = silhouette_score(cdist_dtw(X), labels, metric="precomputed")
+    >>> s_sc == s_sc4
+    True
+    >>> s_sc5 = silhouette_score(X, labels, metric="dtw", n_jobs=2)
+    >>> abs(s_sc - s_sc5) < 1e-9
+    True
+    >>> s_sc6 = silhouette_score(X, labels, metric="dtw", sample_size=20, random_state=0)
+    >>> s_sc7 = silhouette_score(cdist_dtw(X), labels, metric="precomputed", sample_size=20, random_state=0)
+    >>> abs(s_sc6 - s_sc7) < 1e-9
+    True
     """
-    sklearn_metric = None
     if metric_params is None:
         metric_params = {}
     if metric == "precomputed":
-        sklearn_X = X
-    elif metric == "dtw":
-        sklearn_X = cdist_dtw(X)
-    elif metric == "softdtw":
-        gamma = metric_params.get("gamma_sdtw", None)
-        if gamma is not None:
-            sklearn_X = cdist_soft_dtw_normalized(X, gamma=gamma)
-        else:
-            sklearn_X = cdist_soft_dtw_normalized(X)
-    elif metric == "euclidean":
-        X_ = to_time_series_dataset(X)
-        X_ = X_.reshape((X.shape[0], -1))
-        sklearn_X = cdist(X_, X_, metric="euclidean")
+        X_ = numpy.asarray(X)
     else:
         X_ = to_time_series_dataset(X)
-        n, sz, d = X_.shape
-        sklearn_X = X_.reshape((n, -1))
+    labels = numpy.asarray(labels)
+    if sample_size is not None:
+        indices = check_random_state(random_state).permutation(X_.shape[0])[:sample_size]
+        X_, labels = X_[indices], labels[indices]
+        if metric == "precomputed":
+            X_ = X_[:, indices]
+    le = LabelEncoder()
+    labels = le.fit_transform(labels)
+    n_ts = labels.shape[0]
+    label_freqs = numpy.bincount(labels)
+    check_number_of_labels(len(le.classes_), n_ts)
+
+    gamma = metric_params.get("gamma_sdtw", 1.)
+    self_sdtw = None
+    if metric == "softdtw":
+        self_sdtw = numpy.array([soft_dtw(ts[:ts_size(ts)], ts[:ts_size(ts)], gamma=gamma) for ts in X_])
+    elif metric not in ["precomputed", "dtw", "euclidean"]:
         if metric is None:
             metric = dtw
-        sklearn_metric = lambda x, y: metric(to_time_series(x.reshape((sz, d)), remove_nans=True),
-                                             to_time_series(y.reshape((sz, d)), remove_nans=True))
-    return sklearn_silhouette_score(X=sklearn_X,
-                                    labels=labels,
-                                    metric="precomputed" if sklearn_metric is None else sklearn_metric,
-                                    sample_size=sample_size,
-                                    random_state=random_state,
-                                    **kwds)
+        X_ = [to_time_series(ts, remove_nans=True) for ts in X_]
+
+    # Blocks of rows of the upper triangle, sized to the working memory and spread over available workers
+    n_workers = effective_n_jobs(n_jobs)
+    block_size = min(get_chunk_n_rows(row_bytes=8 * n_ts), -(-n_ts // n_workers))
+    starts = list(range(0, n_ts, block_size))
+    one_hot = numpy.zeros((n_ts, len(label_freqs)))
+    one_hot[numpy.arange(n_ts), labels] = 1.
+    cluster_sums = numpy.zeros((n_ts, len(label_freqs)))
+    for i in range(0, len(starts), n_workers):
+        blocks = [(start, min(start + block_size, n_ts)) for start in starts[i:i + n_workers]]
+        results = Parallel(n_jobs=n_jobs)(delayed(_silhouette_block_sums)(X_, start, end, one_hot, metric, gamma,
+                                                                          self_sdtw, kwds)
+                                          for start, end in blocks)
+        for (start, end), (row_sums, col_sums) in zip(blocks, results):
+            cluster_sums[start:end] += row_sums
+            cluster_sums[end:] += col_sums
+
+    intra_clust_dists = cluster_sums[numpy.arange(n_ts), labels]
+    cluster_sums[numpy.arange(n_ts), labels] = numpy.inf
+    inter_clust_dists = (cluster_sums / label_freqs).min(axis=1)
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        intra_clust_dists /= (label_freqs - 1).take(labels, mode='clip')
+        sil_samples = inter_clust_dists - intra_clust_dists
+        sil_samples /= numpy.maximum(intra_clust_dists, inter_clust_dists)
+    # nan values are for clusters of size 1, and should be 0
+    return numpy.mean(numpy.nan_to_num(sil_samples))
+
+
+def _silhouette_block_dists(X, start, end, metric, gamma, self_sdtw, kwds):
+    """Distances between time series X[start:end] and X[start:] (or the matching block if X is precomputed)."""
+    if metric == "precomputed":
+        return X[start:end, start:]
+    elif metric == "dtw":
+        return cdist_dtw(X[start:end], X[start:])
+    elif metric == "softdtw":
+        return cdist_soft_dtw(X[start:end], X[start:], gamma=gamma) - .5 * (self_sdtw[start:end].reshape((-1, 1)) +
+                                                                           self_sdtw[start:].reshape((1, -1)))
+    elif metric == "euclidean":
+        return cdist(X[start:end].reshape((end - start, -1)), X[start:].reshape((X.shape[0] - start, -1)),
+                     metric="euclidean")
+    return numpy.array([[metric(ts1, ts2, **kwds) for ts2 in X[start:]] for ts1 in X[start:end]])
+
+
+def _silhouette_block_sums(X, start, end, one_hot, metric, gamma, self_sdtw, kwds):
+    """Per-cluster sums of distances for the block of rows [start, end) of the upper triangle of the distance matrix.
+
+    Sums are returned both for rows of the block (over columns start and after) and, by symmetry, for rows after the
+    block (over columns of the block).
+    """
+    dists = _silhouette_block_dists(X, start, end, metric, gamma, self_sdtw, kwds)
+    return numpy.dot(dists, one_hot[start:]), numpy.dot(dists[:, end - start:].T, one_hot[start:end])
 
 
 def _check_initial_guess(init, n_clusters):
@@ -221,6 +395,15 @@ class GlobalAlignmentKernelKMeans(BaseEstimator, ClusterMixin):
     random_state : integer or numpy.RandomState, optional
         Generator used to initialize the centers. If an integer is given, it fixes the seed. Defaults to the global
         numpy random number generator.
+    n_jobs : int or None, optional (default=None)
+        The number of jobs to use to run the n_init initializations in parallel. ``None`` means 1 unless in a
+        :obj:`joblib.parallel_backend` context. ``-1`` means using all processors. Results do not depend on the
+        number of jobs used.
+    n_landmarks : int or None (default: None)
+        If given (and smaller than the number of training time series), the Gram matrix is approximated using the
+        Nystroem method: the kernel is only evaluated against `n_landmarks` time series sampled from the training
+        set and k-means is run in the induced feature space. Only landmarks and cluster centers in the feature space
+        are stored for prediction.
 
     Attributes
     ----------
@@ -228,6 +411,10 @@ class GlobalAlignmentKernelKMeans(BaseEstimator, ClusterMixin):
         Labels of each point
     inertia_ : float
         Sum of distances of samples to their closest cluster center (computed using the kernel trick).
+    X_fit_ : numpy.ndarray or None
+        Training time series. None if the fit failed or if `n_landmarks` is used.
+    landmarks_ : numpy.ndarray or None
+        Landmark time series used for the Nystroem approximation. None if `n_landmarks` is not used.
 
     Examples
     --------
@@ -240,6 +427,11 @@ class GlobalAlignmentKernelKMeans(BaseEstimator, ClusterMixin):
     True
     >>> GlobalAlignmentKernelKMeans(n_clusters=101, verbose=False, random_state=0).fit(X).X_fit_ is None
     True
+    >>> gak_km_nys = GlobalAlignmentKernelKMeans(n_clusters=3, n_landmarks=20, verbose=False, random_state=0).fit(X)
+    >>> gak_km_nys.landmarks_.shape
+    (20, 32, 1)
+    >>> numpy.alltrue(gak_km_nys.labels_ == gak_km_nys.predict(X))
+    True
 
     References
     ----------
@@ -250,9 +442,14 @@ class GlobalAlignmentKernelKMeans(BaseEstimator, ClusterMixin):
     Fast Global Alignment Kernels.
     Marco Cuturi.
     ICML 2011.
+
+    Using the Nystroem Method to Speed Up Kernel Machines.
+    Christopher Williams, Matthias Seeger.
+    NIPS 2001.
     """
 
-    def __init__(self, n_clusters=3, max_iter=50, tol=1e-6, n_init=1, sigma=1., verbose=True, random_state=None):
+    def __init__(self, n_clusters=3, max_iter=50, tol=1e-6, n_init=1, sigma=1., verbose=True, random_state=None,
+                 n_jobs=None, n_landmarks=None):
         self.n_clusters = n_clusters
         self.max_iter = max_iter
         self.tol = tol
@@ -260,12 +457,18 @@ class GlobalAlignmentKernelKMeans(BaseEstimator, ClusterMixin):
         self.sigma = sigma
         self.n_init = n_init
         self.verbose = verbose
+        self.n_jobs = n_jobs
+        self.n_landmarks = n_landmarks
         self.max_attempts = max(self.n_init, 10)
 
         self.labels_ = None
         self.inertia_ = None
         self.sample_weight_ = None
         self.X_fit_ = None
+        self.landmarks_ = None
+        self._nystroem_map = None
+        self._embedded_centers = None
+        self._self_similarity = None
 
     def _get_kernel(self, X, Y=None):
         return cdist_gak(X, Y, sigma=self.sigma)
@@ -277,9 +480,9 @@ class GlobalAlignmentKernelKMeans(BaseEstimator, ClusterMixin):
 
         dist = numpy.empty((n_samples, self.n_clusters))
         old_inertia = numpy.inf
+        old_labels = self.labels_
 
         for it in range(self.max_iter):
-            dist.fill(0)
             self._compute_dist(K, dist)
             self.labels_ = dist.argmin(axis=1)
             _check_no_empty_cluster(self.labels_, self.n_clusters)
@@ -287,9 +490,10 @@ class GlobalAlignmentKernelKMeans(BaseEstimator, ClusterMixin):
             if self.verbose:
                 print("%.3f" % self.inertia_, end=" --> ")
 
-            if numpy.abs(old_inertia - self.inertia_) < self.tol:
+            if numpy.array_equal(self.labels_, old_labels) or numpy.abs(old_inertia - self.inertia_) < self.tol:
                 break
             old_inertia = self.inertia_
+            old_labels = self.labels_
         if self.verbose:
             print("")
 
@@ -307,48 +511,66 @@ class GlobalAlignmentKernelKMeans(BaseEstimator, ClusterMixin):
         """
 
         n_samples = X.shape[0]
-        K = self._get_kernel(X)
         sw = sample_weight if sample_weight else numpy.ones(n_samples)
         self.sample_weight_ = sw
         rs = check_random_state(self.random_state)
 
-        last_correct_labels = None
-        min_inertia = numpy.inf
-        n_attempts = 0
-        n_successful = 0
-        while n_successful < self.n_init and n_attempts < self.max_attempts:
-            try:
-                if self.verbose and self.n_init > 1:
-                    print("Init %d" % (n_successful + 1))
-                n_attempts += 1
-                self._fit_one_init(K, rs)
-                if self.inertia_ < min_inertia:
-                    last_correct_labels = self.labels_
-                    min_inertia = self.inertia_
-                n_successful += 1
-            except EmptyClusterError:
-                if self.verbose:
-                    print("Resumed because of empty cluster")
-        if n_successful > 0:
-            self.X_fit_ = X
-            self.labels_ = last_correct_labels
-            self.inertia_ = min_inertia
+        self.landmarks_ = None
+        self._nystroem_map = None
+        if self.n_landmarks is not None and self.n_landmarks < n_samples:
+            # In landmark mode, k-means is run on the Nystroem embeddings rather than on the Gram matrix
+            landmark_indices, self._nystroem_map = _nystroem_landmarks(X, self.n_landmarks, self._get_kernel,
+                                                                       random_state=rs)
+            self.landmarks_ = X[landmark_indices]
+            K = self._embed(X)
+        else:
+            K = self._get_kernel(X)
+
+        best_run = _fit_best_of_n_init(self, (K, ), rs)
+        if best_run is not None:
+            self.labels_ = best_run.labels_
+            self.inertia_ = best_run.inertia_
+            # Cache quantities that depend on the final assignments only (centers or self-similarities)
+            self._compute_dist(K, numpy.empty((n_samples, self.n_clusters)))
+            self.X_fit_ = None if self._nystroem_map is not None else X
         else:
             self.X_fit_ = None
+            self.landmarks_ = None
         return self
 
-    def _compute_dist(self, K, dist):
-        """Compute a n_samples x n_clusters distance matrix using the kernel trick."""
-        sw = self.sample_weight_
-
-        for j in range(self.n_clusters):
-            mask = (self.labels_ == j)
-
-            if numpy.sum(mask) == 0:
-                raise EmptyClusterError("try smaller n_cluster or better kernel parameters")
-
-            # NB: we use a normalized kernel so k(x,x) = 1 for all x (including the centroid)
-            dist[:, j] = 2 - 2 * numpy.sum(sw[mask] * K[:, mask], axis=1) / sw[mask].sum()
+    def _embed(self, X):
+        """Nystroem embeddings of the time series in X, whose dot products approximate the kernel."""
+        return numpy.dot(self._get_kernel(X, self.landmarks_), self._nystroem_map)
+
+    def _membership_matrix(self):
+        """Sparse n_samples x n_clusters matrix of sample weights, normalized to sum to one in each cluster."""
+        n_samples = self.labels_.shape[0]
+        if numpy.any(numpy.bincount(self.labels_, minlength=self.n_clusters) == 0):
+            raise EmptyClusterError("try smaller n_cluster or better kernel parameters")
+        cluster_weights = numpy.bincount(self.labels_, weights=self.sample_weight_, minlength=self.n_clusters)
+        return csr_matrix((self.sample_weight_ / cluster_weights[self.labels_], (numpy.arange(n_samples), self.labels_)),
+                          shape=(n_samples, self.n_clusters))
+
+    def _compute_dist(self, K, dist, training=True):
+        """Compute a n_samples x n_clusters distance matrix using the kernel trick.
+
+        If `training` is True, K is the Gram matrix of the training set and per-cluster self-similarities of the
+        centroids are computed (and cached) along the way, otherwise cached values are used.
+        In landmark mode, K holds Nystroem embeddings rather than kernel values and cluster centers are cached instead.
+        """
+        if self._nystroem_map is not None:
+            if training:
+                self._embedded_centers = safe_sparse_dot(self._membership_matrix().T, K, dense_output=True)
+            dist[:] = cdist(K, self._embedded_centers, metric="sqeuclidean")
+            return
+
+        W = self._membership_matrix()
+        # K W is computed as (W^T K^T)^T so that scipy reads K in memory order (K is symmetric at training time)
+        KW = safe_sparse_dot(W.T, K if training else numpy.ascontiguousarray(K.T), dense_output=True).T
+        if training:
+            self._self_similarity = numpy.asarray(W.multiply(KW).sum(axis=0)).ravel()
+        # NB: we use a normalized kernel so k(x,x) = 1 for all x
+        dist[:] = 1. - 2. * KW + self._self_similarity.reshape((1, -1))
 
     @staticmethod
     def _compute_inertia(dist_sq):
@@ -384,10 +606,13 @@ class GlobalAlignmentKernelKMeans(BaseEstimator, ClusterMixin):
         labels : array of shape=(n_ts, )
             Index of the cluster each sample belongs to.
         """
-        K = self._get_kernel(X, self.X_fit_)
+        if self._nystroem_map is not None:
+            K = self._embed(X)
+        else:
+            K = self._get_kernel(X, self.X_fit_)
         n_samples = X.shape[0]
         dist = numpy.zeros((n_samples, self.n_clusters))
-        self._compute_dist(K, dist)
+        self._compute_dist(K, dist, training=False)
         return dist.argmin(axis=1)
 
 
@@ -425,7 +650,9 @@ class TimeSeriesKMeans(BaseEstimator, ClusterMixin, TimeSeriesCentroidBasedClust
         Number of iterations for the barycenter computation process. Only used if `metric="dtw"` or `metric="softdtw"`.
     metric_params : dict or None
         Parameter values for the chosen metric. Value associated to the `"gamma_sdtw"` key corresponds to the gamma
-        parameter in Soft-DTW.
+        parameter in Soft-DTW. If `metric="dtw"`, values associated to the `"global_constraint"` and
+        `"sakoe_chiba_radius"` keys restrict admissible alignments, both for cluster assignment and for DBA (see
+        :func:`tslearn.metrics.dtw`).
     dtw_inertia: bool
         Whether to compute DTW inertia even if DTW is not the chosen metric.
     verbose : bool (default: True)
@@ -439,6 +666,12 @@ class TimeSeriesKMeans(BaseEstimator, ClusterMixin, TimeSeriesCentroidBasedClust
         <https://github.com/scikit-learn/scikit-learn/blob/master/sklearn/cluster/k_means_.py>`_ for more.
         'random': choose k observations (rows) at random from data for the initial centroids.
         If an ndarray is passed, it should be of shape (n_clusters, ts_size, d) and gives the initial centers.
+    n_jobs : int or None, optional (default=None)
+        The number of jobs to use to run the n_init initializations in parallel and, if `metric="dtw"`, to compute DTW
+        alignments in DBA. DBA only uses several jobs when initializations are not run in parallel (e.g. if
+        `n_init=1`), so that processors are not oversubscribed. ``None`` means 1 unless in a
+        :obj:`joblib.parallel_backend` context. ``-1`` means using all processors. Results do not depend on the number
+        of jobs used.
 
     Attributes
     ----------
@@ -497,10 +730,16 @@ class TimeSeriesKMeans(BaseEstimator, ClusterMixin, TimeSeriesCentroidBasedClust
     >>> km_init = TimeSeriesKMeans(n_clusters=2, verbose=False, max_iter=5, metric="dtw", random_state=0, init="random").fit(X_bis)
     >>> km_init = TimeSeriesKMeans(n_clusters=2, verbose=False, max_iter=5, metric="dtw", random_state=0, init="k-means++").fit(X_bis)
     >>> km_init = TimeSeriesKMeans(n_clusters=2, verbose=False, max_iter=5, metric="dtw", init=X_bis[:2]).fit(X_bis)
+    >>> km_band = TimeSeriesKMeans(n_clusters=3, metric="dtw", max_iter=5, verbose=False, random_state=0, \
+                                   metric_params={"global_constraint": "sakoe_chiba", "sakoe_chiba_radius": 3}).fit(X)
+    >>> dists = cdist_dtw(X, km_band.cluster_centers_, global_constraint="sakoe_chiba", sakoe_chiba_radius=3)
+    >>> numpy.alltrue(km_band.labels_ == dists.argmin(axis=1))
+    True
     """
 
     def __init__(self, n_clusters=3, max_iter=50, tol=1e-6, n_init=1, metric="euclidean", max_iter_barycenter=100,
-                 metric_params=None, dtw_inertia=False, verbose=True, random_state=None, init='k-means++'):
+                 metric_params=None, dtw_inertia=False, verbose=True, random_state=None, init='k-means++',
+                 n_jobs=None):
         self.n_clusters = n_clusters
         self.max_iter = max_iter
         self.tol = tol
@@ -512,18 +751,24 @@ class TimeSeriesKMeans(BaseEstimator, ClusterMixin, TimeSeriesCentroidBasedClust
         self.max_attempts = max(self.n_init, 10)
         self.dtw_inertia = dtw_inertia
         self.init = init
+        self.n_jobs = n_jobs
 
         self.labels_ = None
         self.inertia_ = numpy.inf
         self.cluster_centers_ = None
         self.X_fit_ = None
+        self._inner_n_jobs = n_jobs
         self._squared_inertia = True
+        self._dtw_cache = None
+        self._prev_labels = None
 
         if metric_params is None:
             metric_params = {}
         self.gamma_sdtw = metric_params.get("gamma_sdtw", 1.)
+        self.global_constraint = metric_params.get("global_constraint", None)
+        self.sakoe_chiba_radius = metric_params.get("sakoe_chiba_radius", 1)
 
-    def _fit_one_init(self, X, x_squared_norms, rs):
+    def _init_centroids(self, X, x_squared_norms, rs):
         n_ts, _, d = X.shape
         sz = min([ts_size(ts) for ts in X])
         if hasattr(self.init, '__array__'):
@@ -537,10 +782,15 @@ class TimeSeriesKMeans(BaseEstimator, ClusterMixin, TimeSeriesCentroidBasedClust
         else:
             raise ValueError("Value %r for parameter 'init' is invalid" % self.init)
         self.cluster_centers_ = _check_full_length(self.cluster_centers_)
+        self._dtw_cache = None
+        self._prev_labels = None
+
+    def _fit_one_init(self, X, x_squared_norms, rs):
+        self._init_centroids(X, x_squared_norms, rs)
         old_inertia = numpy.inf
 
         for it in range(self.max_iter):
-            self._assign(X)
+            self._assign(X, use_dtw_cache=True)
             if self.verbose:
                 print("%.3f" % self.inertia_, end=" --> ")
             self._update_centroids(X)
@@ -551,18 +801,22 @@ class TimeSeriesKMeans(BaseEstimator, ClusterMixin, TimeSeriesCentroidBasedClust
         if self.verbose:
             print("")
 
+        self._dtw_cache = None
         return self
 
-    def _assign(self, X, update_class_attributes=True):
+    def _cross_dists(self, X, use_dtw_cache=False):
         if self.metric == "euclidean":
-            dists = cdist(X.reshape((X.shape[0], -1)), self.cluster_centers_.reshape((self.n_clusters, -1)),
-                          metric="euclidean")
+            return cdist(X.reshape((X.shape[0], -1)), self.cluster_centers_.reshape((self.n_clusters, -1)),
+                         metric="euclidean")
         elif self.metric == "dtw":
-            dists = cdist_dtw(X, self.cluster_centers_)
+            return self._cdist_dtw_pruned(X, use_cache=use_dtw_cache)
         elif self.metric == "softdtw":
-            dists = cdist_soft_dtw(X, self.cluster_centers_, gamma=self.gamma_sdtw)
+            return cdist_soft_dtw(X, self.cluster_centers_, gamma=self.gamma_sdtw)
         else:
             raise ValueError("Incorrect metric: %s (should be one of 'dtw', 'softdtw', 'euclidean')" % self.metric)
+
+    def _assign(self, X, update_class_attributes=True, use_dtw_cache=False):
+        dists = self._cross_dists(X, use_dtw_cache=use_dtw_cache)
         matched_labels = dists.argmin(axis=1)
         if update_class_attributes:
             self.labels_ = matched_labels
@@ -574,23 +828,87 @@ class TimeSeriesKMeans(BaseEstimator, ClusterMixin, TimeSeriesCentroidBasedClust
             self.inertia_ = _compute_inertia(inertia_dists, self.labels_, self._squared_inertia)
         return matched_labels
 
+    def _cdist_dtw_pruned(self, X, use_cache=False):
+        """DTW between time series in X and cluster centers, computed only where needed to find the closest center.
+
+        For each time series, centers are visited by increasing lower bound (LB_Keogh on the full-width envelope of
+        the center, combined with the first/last points bound) and DTW computations stop as soon as the lower bound
+        exceeds the best DTW found so far. The remaining entries are set to inf, so that the argmin of each row is the
+        same as for `cdist_dtw(X, self.cluster_centers_)`.
+
+        DTW is not a metric, hence distance bounds cannot be carried across centroid updates as in Elkan's k-means.
+        Instead, if `use_cache` is True (which is only the case during the iterations of `fit`, on the training set),
+        DTW values computed at the previous call against centers that have not changed since then are reused, and the
+        previously closest center is evaluated first to get a tight initial upper bound.
+        """
+        centers = self.cluster_centers_
+        n_ts, sz, d = X.shape
+        if centers.shape[1] != sz or not check_equal_size(X):
+            return cdist_dtw(X, centers, global_constraint=self.global_constraint,
+                             sakoe_chiba_radius=self.sakoe_chiba_radius)
+
+        dists = numpy.empty((n_ts, self.n_clusters))
+        dists.fill(numpy.inf)
+        known = numpy.zeros((n_ts, self.n_clusters), dtype=bool)
+        prev_labels = None
+        if use_cache and self._dtw_cache is not None:
+            prev_centers, prev_dists, prev_known = self._dtw_cache
+            unchanged = numpy.array([numpy.array_equal(prev_centers[k], centers[k]) for k in range(self.n_clusters)])
+            known[:, unchanged] = prev_known[:, unchanged]
+            dists[known] = prev_dists[known]
+            prev_labels = prev_dists.argmin(axis=1)
+
+        # Bounds for unconstrained DTW are also valid under global constraints, LB_Keogh is tighter with the band
+        radius = self.sakoe_chiba_radius if self.global_constraint == "sakoe_chiba" else sz
+        # Slightly shrink lower bounds to be robust to rounding errors
+        lbs = numpy.maximum(cdist_lb_keogh(X, centers, radius=radius), _cdist_lb_first_last(X, centers)) * (1. - 1e-9)
+        mask = _dtw_mask(sz, sz, self.global_constraint, self.sakoe_chiba_radius)
+        for i in range(n_ts):
+            if prev_labels is not None and not known[i, prev_labels[i]]:
+                dists[i, prev_labels[i]] = cydtw(X[i], centers[prev_labels[i]], mask)
+                known[i, prev_labels[i]] = True
+            best = dists[i].min()
+            for k in numpy.argsort(lbs[i]):
+                if lbs[i, k] > best:
+                    break
+                if not known[i, k]:
+                    dists[i, k] = cydtw(X[i], centers[k], mask)
+                    known[i, k] = True
+                    best = min(best, dists[i, k])
+        if use_cache:
+            self._dtw_cache = (centers.copy(), dists, known)
+        return dists
+
     def _update_centroids(self, X):
+        prev_labels = self._prev_labels
         for k in range(self.n_clusters):
+            members = self.labels_ == k
+            if prev_labels is not None:
+                prev_members = prev_labels == k
+                if numpy.array_equal(members, prev_members):
+                    # Same members as at the previous iteration: the barycenter computed then is kept
+                    continue
             if self.metric == "dtw":
-                self.cluster_centers_[k] = dtw_barycenter_averaging(X=X[self.labels_ == k],
+                self.cluster_centers_[k] = dtw_barycenter_averaging(X=X[members],
                                                                     barycenter_size=None,
                                                                     init_barycenter=self.cluster_centers_[k],
-                                                                    verbose=False)
-                    # DTWBarycenterAveraging(max_iter=self.max_iter_barycenter,
-                    #                                               barycenter_size=None,
-                    #                                               init_barycenter=self.cluster_centers_[k],
-                    #                                               verbose=False).fit(X[self.labels_ == k])
+                                                                    verbose=False,
+                                                                    n_jobs=self._inner_n_jobs,
+                                                                    global_constraint=self.global_constraint,
+                                                                    sakoe_chiba_radius=self.sakoe_chiba_radius)
             elif self.metric == "softdtw":
                 self.cluster_centers_[k] = SoftDTWBarycenter(max_iter=self.max_iter_barycenter,
                                                              gamma=self.gamma_sdtw,
-                                                             init=self.cluster_centers_[k]).fit(X[self.labels_ == k])
+                                                             init=self.cluster_centers_[k]).fit(X[members])
+            elif prev_labels is not None and numpy.sum(members != prev_members) < numpy.sum(members):
+                # Few membership changes: the previous center is the mean of previous members, update it in place
+                added = numpy.logical_and(members, ~prev_members)
+                removed = numpy.logical_and(prev_members, ~members)
+                self.cluster_centers_[k] = (numpy.sum(prev_members) * self.cluster_centers_[k] +
+                                            X[added].sum(axis=0) - X[removed].sum(axis=0)) / numpy.sum(members)
             else:
-                self.cluster_centers_[k] = EuclideanBarycenter().fit(X[self.labels_ == k])
+                self.cluster_centers_[k] = EuclideanBarycenter().fit(X[members])
+        self._prev_labels = self.labels_.copy()
 
     def fit(self, X, y=None):
         """Compute k-means clustering.
@@ -606,24 +924,11 @@ class TimeSeriesKMeans(BaseEstimator, ClusterMixin, TimeSeriesCentroidBasedClust
                                 metric="sqeuclidean").reshape((1, -1))
         _check_initial_guess(self.init, self.n_clusters)
 
-        best_correct_centroids = None
-        min_inertia = numpy.inf
-        n_successful = 0
-        n_attempts = 0
-        while n_successful < self.n_init and n_attempts < self.max_attempts:
-            try:
-                if self.verbose and self.n_init > 1:
-                    print("Init %d" % (n_successful + 1))
-                n_attempts += 1
-                self._fit_one_init(X_, x_squared_norms, rs)
-                if self.inertia_ < min_inertia:
-                    best_correct_centroids = self.cluster_centers_.copy()
-                    min_inertia = self.inertia_
-                n_successful += 1
-            except EmptyClusterError:
-                if self.verbose:
-                    print("Resumed because of empty cluster")
-        self._post_fit(X_, best_correct_centroids, min_inertia)
+        best_run = _fit_best_of_n_init(self, (X_, x_squared_norms), rs)
+        if best_run is not None:
+            self._post_fit(X_, best_run.cluster_centers_, best_run.inertia_)
+        else:
+            self._post_fit(X_, None, numpy.inf)
         return self
 
     def fit_predict(self, X, y=None):
@@ -660,6 +965,186 @@ class TimeSeriesKMeans(BaseEstimator, ClusterMixin, TimeSeriesCentroidBasedClust
         return self._assign(X_, update_class_attributes=False)
 
 
+class MiniBatchTimeSeriesKMeans(TimeSeriesKMeans):
+    """Mini-batch K-means clustering for time-series data.
+
+    Cluster centers are updated from random mini-batches of the dataset, following [1]_: each center moves towards
+    the barycenter of its members in the mini-batch with a learning rate that decreases as the number of time series
+    it has been assigned grows. Only one mini-batch has to be held in memory at a time.
+
+    Parameters
+    ----------
+    n_clusters : int (default: 3)
+        Number of clusters to form.
+    max_iter : int (default: 100)
+        Number of mini-batches drawn from the dataset when `fit` is called on an array-like dataset.
+    batch_size : int (default: 100)
+        Number of time series in each mini-batch.
+    metric : {"euclidean", "dtw", "softdtw"} (default: "euclidean")
+        Metric to be used for both cluster assignment and center updates. If "dtw", centers are moved towards the
+        result of a single DBA iteration on their mini-batch members. If "softdtw", centers follow a gradient step on
+        the average Soft-DTW to their mini-batch members.
+    metric_params : dict or None
+        Parameter values for the chosen metric. Value associated to the `"gamma_sdtw"` key corresponds to the gamma
+        parameter in Soft-DTW.
+    verbose : bool (default: True)
+        Whether or not to print information about the mini-batch inertia while learning the model.
+    random_state : integer or numpy.RandomState, optional
+        Generator used to initialize the centers and to draw mini-batches. If an integer is given, it fixes the seed.
+        Defaults to the global numpy random number generator.
+    init : {'k-means++', 'random' or an ndarray} (default: 'k-means++')
+        Method for initialization, applied to the first mini-batch (see :class:`TimeSeriesKMeans`).
+
+    Attributes
+    ----------
+    labels_ : numpy.ndarray
+        Labels of each point (only set when `fit` is called on an array-like dataset).
+    cluster_centers_ : numpy.ndarray
+        Cluster centers.
+    counts_ : numpy.ndarray
+        Number of time series assigned to each cluster so far during training.
+    inertia_ : float
+        Sum of distances of samples to their closest cluster center (only set when `fit` is called on an array-like
+        dataset).
+
+    Note
+    ----
+        If `metric` is set to `"euclidean"`, the algorithm expects a dataset of equal-sized time series.
+
+    Examples
+    --------
+    >>> from tslearn.generators import random_walks
+    >>> X = random_walks(n_ts=50, sz=32, d=1)
+    >>> km = MiniBatchTimeSeriesKMeans(n_clusters=3, batch_size=10, max_iter=20, verbose=False, random_state=0).fit(X)
+    >>> km.cluster_centers_.shape
+    (3, 32, 1)
+    >>> int(km.counts_.sum())
+    200
+    >>> numpy.alltrue(km.labels_ == km.predict(X))
+    True
+    >>> km_dba = MiniBatchTimeSeriesKMeans(n_clusters=3, batch_size=10, max_iter=5, metric="dtw", verbose=False, \
+                                           random_state=0).fit(X)
+    >>> numpy.alltrue(km_dba.labels_ == cdist_dtw(X, km_dba.cluster_centers_).argmin(axis=1))
+    True
+    >>> km_sdtw = MiniBatchTimeSeriesKMeans(n_clusters=3, batch_size=10, max_iter=5, metric="softdtw", \
+                                            metric_params={"gamma_sdtw": .5}, verbose=False, random_state=0).fit(X)
+    >>> km_sdtw.cluster_centers_.shape
+    (3, 32, 1)
+    >>> stream = (X[i:i + 10] for i in range(0, 50, 10))
+    >>> km_stream = MiniBatchTimeSeriesKMeans(n_clusters=3, verbose=False, random_state=0).fit(stream)
+    >>> int(km_stream.counts_.sum())
+    50
+    >>> int(km_stream.partial_fit(X[:10]).counts_.sum())
+    60
+
+    References
+    ----------
+    .. [1] D. Sculley. Web-Scale K-Means Clustering. WWW 2010.
+    """
+
+    def __init__(self, n_clusters=3, max_iter=100, batch_size=100, metric="euclidean", metric_params=None,
+                 verbose=True, random_state=None, init='k-means++'):
+        TimeSeriesKMeans.__init__(self, n_clusters=n_clusters, max_iter=max_iter, metric=metric,
+                                  metric_params=metric_params, verbose=verbose, random_state=random_state, init=init)
+        self.batch_size = batch_size
+        self.metric_params = metric_params
+        self.counts_ = None
+
+    def _mini_batch_step(self, X):
+        dists = self._cross_dists(X)
+        labels = dists.argmin(axis=1)
+        if self.verbose:
+            print("%.3f" % _compute_inertia(dists, labels, self._squared_inertia), end=" --> ")
+        for k in numpy.unique(labels):
+            X_k = X[labels == k]
+            n_k = X_k.shape[0]
+            self.counts_[k] += n_k
+            lr = float(n_k) / self.counts_[k]
+            center = self.cluster_centers_[k]
+            if self.metric == "dtw":
+                target = dtw_barycenter_averaging(X=X_k, init_barycenter=center, max_iter=1, verbose=False,
+                                                  global_constraint=self.global_constraint,
+                                                  sakoe_chiba_radius=self.sakoe_chiba_radius)
+                self.cluster_centers_[k] = center + lr * (target - center)
+            elif self.metric == "softdtw":
+                X_k = [to_time_series(ts, remove_nans=True) for ts in X_k]
+                _, grad = _softdtw_func(center.ravel(), X_k, numpy.ones(n_k) / n_k, center, self.gamma_sdtw)
+                # Half the gradient, so that the step matches the Euclidean update for gamma -> 0 and a diagonal path
+                self.cluster_centers_[k] = center - .5 * lr * grad.reshape(center.shape)
+            else:
+                self.cluster_centers_[k] = center + lr * (X_k.mean(axis=0) - center)
+        return labels
+
+    def partial_fit(self, X, y=None):
+        """Update cluster centers from a single mini-batch.
+
+        The first mini-batch ever seen is used to initialize centers, hence it should contain at least `n_clusters`
+        time series.
+
+        Parameters
+        ----------
+        X : array-like of shape=(n_ts, sz, d)
+            Mini-batch of time series.
+        """
+        X_ = to_time_series_dataset(X)
+        if not hasattr(self, "_random_state"):
+            self._random_state = check_random_state(self.random_state)
+        if self.cluster_centers_ is None:
+            _check_initial_guess(self.init, self.n_clusters)
+            x_squared_norms = cdist(X_.reshape((X_.shape[0], -1)), numpy.zeros((1, X_.shape[1] * X_.shape[2])),
+                                    metric="sqeuclidean").reshape((1, -1))
+            self._init_centroids(X_, x_squared_norms, self._random_state)
+            self.counts_ = numpy.zeros(self.n_clusters)
+        self._mini_batch_step(X_)
+        return self
+
+    def fit(self, X, y=None):
+        """Compute mini-batch k-means clustering.
+
+        Parameters
+        ----------
+        X : array-like of shape=(n_ts, sz, d) or iterable of such arrays
+            Time series dataset. Mini-batches are drawn from it by fancy indexing, so that a `numpy.memmap` is never
+            loaded in memory as a whole. An iterable of mini-batches (e.g. a generator) can also be given, in which
+            case each of them is used for a single center update, `max_iter` and `batch_size` are ignored and neither
+            `labels_` nor `inertia_` are computed.
+        """
+        self.cluster_centers_ = None
+        self.counts_ = None
+        self.labels_ = None
+        self.inertia_ = numpy.inf
+        self.X_fit_ = None
+        self._random_state = check_random_state(self.random_state)
+        if not hasattr(X, "shape") and not isinstance(X, list):
+            for X_batch in X:
+                self.partial_fit(X_batch)
+            if self.verbose:
+                print("")
+            return self
+
+        if isinstance(X, list):
+            X = to_time_series_dataset(X)
+        n_ts = X.shape[0]
+        for it in range(self.max_iter):
+            # Sorted indices make reads from on-disk datasets sequential
+            indices = numpy.sort(self._random_state.choice(n_ts, size=min(self.batch_size, n_ts), replace=False))
+            self.partial_fit(X[indices])
+        if self.verbose:
+            print("")
+
+        labels = numpy.empty((n_ts, ), dtype=numpy.int)
+        inertia = 0.
+        for start in range(0, n_ts, self.batch_size):
+            X_batch = to_time_series_dataset(X[start:start + self.batch_size])
+            dists = self._cross_dists(X_batch)
+            labels[start:start + X_batch.shape[0]] = dists.argmin(axis=1)
+            inertia += _compute_inertia(dists, dists.argmin(axis=1), self._squared_inertia) * X_batch.shape[0]
+        self.labels_ = labels
+        self.inertia_ = inertia / n_ts
+        self.X_fit_ = X
+        return self
+
+
 class KShape(BaseEstimator, ClusterMixin, TimeSeriesCentroidBasedClusteringMixin):
     """KShape clustering for time series.
 
@@ -686,6 +1171,10 @@ class KShape(BaseEstimator, ClusterMixin, TimeSeriesCentroidBasedClusteringMixin
         Method for initialization.
         'random': choose k observations (rows) at random from data for the initial centroids.
         If an ndarray is passed, it should be of shape (n_clusters, ts_size, d) and gives the initial centers.
+    n_jobs : int or None, optional (default=None)
+        The number of jobs to use to run the n_init initializations in parallel. ``None`` means 1 unless in a
+        :obj:`joblib.parallel_backend` context. ``-1`` means using all processors. Results do not depend on the
+        number of jobs used.
 
     Attributes
     ----------
@@ -717,13 +1206,17 @@ class KShape(BaseEstimator, ClusterMixin, TimeSeriesCentroidBasedClusteringMixin
     True
     >>> KShape(n_clusters=101, verbose=False, random_state=0).fit(X).X_fit_ is None
     True
+    >>> ks_par = KShape(n_clusters=3, n_init=2, n_jobs=2, verbose=False, random_state=0).fit(X)
+    >>> numpy.alltrue(ks_par.labels_ == KShape(n_clusters=3, n_init=2, verbose=False, random_state=0).fit(X).labels_)
+    True
 
     References
     ----------
     .. [1] J. Paparrizos & L. Gravano. k-Shape: Efficient and Accurate Clustering of Time Series. SIGMOD 2015.
        pp. 1855-1870.
     """
-    def __init__(self, n_clusters=3, max_iter=100, tol=1e-6, n_init=1, verbose=True, random_state=None, init='random'):
+    def __init__(self, n_clusters=3, max_iter=100, tol=1e-6, n_init=1, verbose=True, random_state=None, init='random',
+                 n_jobs=None):
         self.n_clusters = n_clusters
         self.max_iter = max_iter
         self.tol = tol
@@ -732,6 +1225,7 @@ class KShape(BaseEstimator, ClusterMixin, TimeSeriesCentroidBasedClusteringMixin
         self.verbose = verbose
         self.max_attempts = max(self.n_init, 10)
         self.init = init
+        self.n_jobs = n_jobs
 
         self.labels_ = None
         self.inertia_ = numpy.inf
@@ -739,16 +1233,16 @@ class KShape(BaseEstimator, ClusterMixin, TimeSeriesCentroidBasedClusteringMixin
 
         self._norms = 0.
         self._norms_centroids = 0.
+        self._fft = None
 
     def _shape_extraction(self, X, k):
         sz = X.shape[1]
         Xp = y_shifted_sbd_vec(self.cluster_centers_[k], X[self.labels_ == k], norm_ref=-1,
-                               norms_dataset=self._norms[self.labels_ == k])
-        S = numpy.dot(Xp[:, :, 0].T, Xp[:, :, 0])
-        Q = numpy.eye(sz) - numpy.ones((sz, sz)) / sz
-        M = numpy.dot(Q.T, numpy.dot(S, Q))
-        _, vec = numpy.linalg.eigh(M)
-        mu_k = vec[:, -1].reshape((sz, 1))
+                               norms_dataset=self._norms[self.labels_ == k],
+                               fft_dataset=self._fft[self.labels_ == k])
+        # mu_k is the top eigenvector of M = Q^T . Xp^T . Xp . Q, with Q = I - 1/sz: it is computed without building M
+        # and warm-started from the current centroid
+        mu_k = _top_eigenvector_centered_gram(Xp[:, :, 0], v0=self.cluster_centers_[k, :, 0]).reshape((sz, 1))
 
         # The way the optimization problem is (ill-)formulated, both mu_k and -mu_k are candidates for barycenters
         # In the following, we check which one is best candidate
@@ -765,9 +1259,13 @@ class KShape(BaseEstimator, ClusterMixin, TimeSeriesCentroidBasedClusteringMixin
         self.cluster_centers_ = TimeSeriesScalerMeanVariance(mu=0., std=1.).fit_transform(self.cluster_centers_)
         self._norms_centroids = numpy.linalg.norm(self.cluster_centers_, axis=(1, 2))
 
-    def _cross_dists(self, X):
-        return 1. - cdist_normalized_cc(X, self.cluster_centers_, norms1=self._norms,
-                                        norms2=self._norms_centroids, self_similarity=False)
+    def _cross_dists(self, X, norms=None, fft=None):
+        if norms is None:
+            norms, fft = self._norms, self._fft
+        # Centroid FFTs are computed once per call, ie. once per k-Shape iteration
+        return 1. - cdist_normalized_cc(X, self.cluster_centers_, norms1=norms,
+                                        norms2=self._norms_centroids, self_similarity=False,
+                                        fft1=fft, fft2=rfft_dataset(self.cluster_centers_))
 
     def _assign(self, X):
         dists = self._cross_dists(X)
@@ -819,30 +1317,18 @@ class KShape(BaseEstimator, ClusterMixin, TimeSeriesCentroidBasedClusteringMixin
 
         X_ = to_time_series_dataset(X)
         self._norms = numpy.linalg.norm(X_, axis=(1, 2))
+        self._fft = rfft_dataset(X_)
 
         _check_initial_guess(self.init, self.n_clusters)
 
         rs = check_random_state(self.random_state)
 
-        best_correct_centroids = None
-        min_inertia = numpy.inf
-        n_successful = 0
-        n_attempts = 0
-        while n_successful < self.n_init and n_attempts < self.max_attempts:
-            try:
-                if self.verbose and self.n_init > 1:
-                    print("Init %d" % (n_successful + 1))
-                n_attempts += 1
-                self._fit_one_init(X_, rs)
-                if self.inertia_ < min_inertia:
-                    best_correct_centroids = self.cluster_centers_.copy()
-                    min_inertia = self.inertia_
-                n_successful += 1
-            except EmptyClusterError:
-                if self.verbose:
-                    print("Resumed because of empty cluster")
-        self._post_fit(X_, best_correct_centroids, min_inertia)
-        self._norms_centroids = numpy.linalg.norm(self.cluster_centers_, axis=(1, 2))
+        best_run = _fit_best_of_n_init(self, (X_, ), rs)
+        if best_run is not None:
+            self._norms_centroids = numpy.linalg.norm(best_run.cluster_centers_, axis=(1, 2))
+            self._post_fit(X_, best_run.cluster_centers_, best_run.inertia_)
+        else:
+            self._post_fit(X_, None, numpy.inf)
         return self
 
     def fit_predict(self, X, y=None):
@@ -877,5 +1363,5 @@ class KShape(BaseEstimator, ClusterMixin, TimeSeriesCentroidBasedClusteringMixin
         """
         X_ = to_time_series_dataset(X)
         X_ = TimeSeriesScalerMeanVariance(mu=0., std=1.).fit_transform(X_)
-        dists = self._cross_dists(X_)
+        dists = self._cross_dists(X_, norms=numpy.linalg.norm(X_, axis=(1, 2)), fft=rfft_dataset(X_))
         return dists.argmin(axis=1)
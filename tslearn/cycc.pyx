@@ -12,20 +12,30 @@ __author__ = 'Romain Tavenard romain.tavenard[at]univ-rennes2.fr'
 DTYPE = numpy.float
 ctypedef numpy.float_t DTYPE_t
 
+def fft_size(int sz):
+    """Size of the zero-padded FFT used to compute cross-correlations between time series of length sz."""
+    # Compute fft size based on tip from
+    # https://stackoverflow.com/questions/14267555/how-can-i-find-the-smallest-power-of-2-greater-than-n-in-python
+    return 1 << bit_length(2 * sz - 1)
+
+
+def rfft_dataset(numpy.ndarray[DTYPE_t, ndim=3] dataset):
+    """Real FFTs (along the time axis) of all time series in a dataset, zero-padded to `fft_size(sz)`.
+
+    These can be computed once and passed to `cdist_normalized_cc` to avoid recomputing them at each call."""
+    return numpy.fft.rfft(dataset, fft_size(dataset.shape[1]), axis=1)
+
+
 @cython.boundscheck(False) # turn off bounds-checking for entire function
 @cython.wraparound(False)  # turn off negative index wrapping for entire function
 def normalized_cc(numpy.ndarray[DTYPE_t, ndim=2] s1, numpy.ndarray[DTYPE_t, ndim=2] s2,
                   float norm1=-1., float norm2=-1.):
     assert s1.dtype == DTYPE and s2.dtype == DTYPE
     assert s1.shape[1] == s2.shape[1]
-    cdef DTYPE_t s = 0.
     cdef int sz = s1.shape[0]
-    cdef int d = s1.shape[1]
-    # Compute fft size based on tip from
-    # https://stackoverflow.com/questions/14267555/how-can-i-find-the-smallest-power-of-2-greater-than-n-in-python
-    cdef int fft_sz = 1 << bit_length(2 * sz - 1)
+    cdef int fft_sz = fft_size(sz)
     cdef float denom = 0.
-    cdef numpy.ndarray[DTYPE_t, ndim=2] cc
+    cdef numpy.ndarray[DTYPE_t, ndim=1] cc
 
     if norm1 < 0.:
         norm1 = numpy.linalg.norm(s1)
@@ -36,63 +46,90 @@ def normalized_cc(numpy.ndarray[DTYPE_t, ndim=2] s1, numpy.ndarray[DTYPE_t, ndim
     if denom < 1e-9:  # To avoid NaNs
         denom = numpy.inf
 
-    cc = numpy.real(numpy.fft.ifft(numpy.fft.fft(s1, fft_sz, axis=0) *
-                                   numpy.conj(numpy.fft.fft(s2, fft_sz, axis=0)), axis=0))
-    cc = numpy.vstack((cc[-(sz-1):], cc[:sz]))
-    return numpy.real(cc).sum(axis=-1) / denom
+    # Summing over dimensions before the inverse transform gives the same result (by linearity) with a single irfft
+    cc = numpy.fft.irfft((numpy.fft.rfft(s1, fft_sz, axis=0) *
+                          numpy.conj(numpy.fft.rfft(s2, fft_sz, axis=0))).sum(axis=-1), fft_sz)
+    cc = numpy.concatenate((cc[-(sz-1):], cc[:sz]))
+    return cc / denom
 
 @cython.boundscheck(False) # turn off bounds-checking for entire function
 @cython.wraparound(False)  # turn off negative index wrapping for entire function
 def cdist_normalized_cc(numpy.ndarray[DTYPE_t, ndim=3] dataset1, numpy.ndarray[DTYPE_t, ndim=3] dataset2,
                         numpy.ndarray[DTYPE_t, ndim=1] norms1, numpy.ndarray[DTYPE_t, ndim=1] norms2,
-                        bool self_similarity):
+                        bool self_similarity, fft1=None, fft2=None):
+    """Maximum normalized cross-correlation between all pairs of time series from dataset1 and dataset2.
+
+    If given, fft1 and fft2 should be the outputs of `rfft_dataset` for dataset1 and dataset2 respectively.
+    Cross-correlations between all time series in dataset1 and a given time series in dataset2 are obtained from a
+    single batched irfft."""
     assert dataset1.dtype == DTYPE and dataset2.dtype == DTYPE
     assert dataset1.shape[2] == dataset2.shape[2]
-    cdef int i = 0
     cdef int j = 0
+    cdef int n_rows = 0
+    cdef int sz = dataset1.shape[1]
+    cdef int fft_sz = fft_size(sz)
     cdef numpy.ndarray[DTYPE_t, ndim=2] dists = numpy.empty((dataset1.shape[0], dataset2.shape[0]))
+    cdef numpy.ndarray[DTYPE_t, ndim=2] denoms
+    cdef numpy.ndarray[DTYPE_t, ndim=2] cc
 
     if (norms1 < 0.).any():
         norms1 = numpy.linalg.norm(dataset1, axis=(1, 2))
     if (norms2 < 0.).any():
         norms2 = numpy.linalg.norm(dataset2, axis=(1, 2))
-
-    for i in range(dataset1.shape[0]):
-        for j in range(dataset2.shape[0]):
-            if self_similarity and j < i:
-                dists[i, j] = dists[j, i]
-            elif self_similarity and i == j:
-                dists[i, j] = 0.
-            else:
-                dists[i, j] = normalized_cc(dataset1[i], dataset2[j], norm1=norms1[i], norm2=norms2[j]).max()
+    if fft1 is None:
+        fft1 = rfft_dataset(dataset1)
+    if fft2 is None:
+        fft2 = fft1 if self_similarity else rfft_dataset(dataset2)
+
+    denoms = norms1.reshape((-1, 1)) * norms2.reshape((1, -1))
+    denoms[denoms < 1e-9] = numpy.inf  # To avoid NaNs
+
+    for j in range(dataset2.shape[0]):
+        # In the self-similarity case, only the upper triangle is computed
+        n_rows = j if self_similarity else dataset1.shape[0]
+        if n_rows == 0:
+            continue
+        cc = numpy.fft.irfft((fft1[:n_rows] * numpy.conj(fft2[j])).sum(axis=-1), fft_sz, axis=1)
+        cc = numpy.hstack((cc[:, -(sz-1):], cc[:, :sz]))
+        dists[:n_rows, j] = cc.max(axis=1) / denoms[:n_rows, j]
+    if self_similarity:
+        dists[numpy.tril_indices(dataset1.shape[0])] = 0.
+        dists += dists.T
     return dists
 
 
 @cython.boundscheck(False) # turn off bounds-checking for entire function
 @cython.wraparound(False)  # turn off negative index wrapping for entire function
 def y_shifted_sbd_vec(numpy.ndarray[DTYPE_t, ndim=2] ref_ts, numpy.ndarray[DTYPE_t, ndim=3] dataset, float norm_ref,
-                      numpy.ndarray[DTYPE_t, ndim=1] norms_dataset):
+                      numpy.ndarray[DTYPE_t, ndim=1] norms_dataset, fft_dataset=None):
+    """Shift all time series in dataset so that they are best aligned (in the SBD sense) with ref_ts.
+
+    If given, fft_dataset should be the output of `rfft_dataset` for dataset. Cross-correlations for the whole
+    dataset are computed in a single batched irfft and shifts are then applied through a single gather."""
     assert dataset.dtype == DTYPE and ref_ts.dtype == DTYPE
     assert dataset.shape[1] == ref_ts.shape[0] and dataset.shape[2] == ref_ts.shape[1]
-    cdef int i = 0
+    cdef int n_ts = dataset.shape[0]
     cdef int sz = dataset.shape[1]
-    cdef numpy.ndarray[DTYPE_t, ndim=3] dataset_shifted = numpy.zeros((dataset.shape[0], dataset.shape[1],
-                                                                       dataset.shape[2]))
+    cdef int fft_sz = fft_size(sz)
+    cdef numpy.ndarray[DTYPE_t, ndim=2] cc
 
     if norm_ref < 0:
         norm_ref = numpy.linalg.norm(ref_ts)
     if (norms_dataset < 0.).any():
         norms_dataset = numpy.linalg.norm(dataset, axis=(1, 2))
-
-    for i in range(dataset.shape[0]):
-        cc = normalized_cc(ref_ts, dataset[i], norm1=norm_ref, norm2=norms_dataset[i])
-        idx = numpy.argmax(cc)
-        shift = idx - sz
-        if shift > 0:
-            dataset_shifted[i, shift:] = dataset[i, :-shift, :]
-        elif shift < 0:
-            dataset_shifted[i, :shift] = dataset[i, -shift:, :]
-        else:
-            dataset_shifted[i] = dataset[i]
-
+    if fft_dataset is None:
+        fft_dataset = rfft_dataset(dataset)
+
+    cc = numpy.fft.irfft((numpy.fft.rfft(ref_ts, fft_sz, axis=0) * numpy.conj(fft_dataset)).sum(axis=-1), fft_sz,
+                         axis=1)
+    cc = numpy.hstack((cc[:, -(sz-1):], cc[:, :sz]))
+    # Denominators only rescale each row, except for degenerate (zero-norm) pairs that get an all-zero cc
+    cc[norm_ref * norms_dataset < 1e-9] = 0.
+    shifts = numpy.argmax(cc, axis=1) - sz
+
+    # dataset_shifted[i, t] = dataset[i, t - shifts[i]], with zero padding outside of the original series
+    indices = numpy.arange(sz).reshape((1, -1)) - shifts.reshape((-1, 1))
+    valid = numpy.logical_and(indices >= 0, indices < sz)
+    dataset_shifted = dataset[numpy.arange(n_ts).reshape((-1, 1)), numpy.clip(indices, 0, sz - 1)]
+    dataset_shifted[~valid] = 0.
     return dataset_shifted
@@ -65,6 +65,59 @@ def ts_size(numpy.ndarray[DTYPE_t, ndim=2] ts):
     return sz
 
 
+def _mask_row_bounds(numpy.ndarray[DTYPE_t, ndim=2] mask):
+    """First and last (excluded) admissible column for each row of a mask, so that DTW loops can skip the others."""
+    finite = numpy.isfinite(mask)
+    starts = finite.argmax(axis=1)
+    ends = mask.shape[1] - finite[:, ::-1].argmax(axis=1)
+    empty_rows = ~finite.any(axis=1)
+    starts[empty_rows] = 0
+    ends[empty_rows] = 0
+    return starts.astype(numpy.int), ends.astype(numpy.int)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef numpy.ndarray _cumulated_costs(numpy.ndarray[DTYPE_t, ndim=2] s1, numpy.ndarray[DTYPE_t, ndim=2] s2,
+                                    numpy.ndarray[DTYPE_t, ndim=2] mask, int l1, int l2, DTYPE_t max_cost=numpy.inf):
+    """Matrix of cumulated DTW costs, padded with an extra first row and column.
+
+    Local costs are computed on the fly and only for admissible cells, so that the cost of a band-constrained DTW
+    grows with the band width rather than with the product of time series lengths.
+    Since every path crosses every row, computations are abandoned as soon as all cumulated costs of a row exceed
+    max_cost, in which case the last cell is set to inf."""
+    cdef int i = 0
+    cdef int j = 0
+    cdef int di = 0
+    cdef int d = s1.shape[1]
+    cdef DTYPE_t diff = 0.
+    cdef DTYPE_t local_cost = 0.
+    cdef DTYPE_t row_min = 0.
+    cdef DTYPE_t inf = numpy.inf
+    cdef numpy.ndarray[DTYPE_t, ndim=2] cum_sum = numpy.empty((l1 + 1, l2 + 1), dtype=DTYPE)
+    cdef numpy.ndarray[numpy.int_t, ndim=1] starts
+    cdef numpy.ndarray[numpy.int_t, ndim=1] ends
+    cum_sum.fill(numpy.inf)
+    cum_sum[0, 0] = 0.
+
+    # Cells outside of [starts[i], ends[i]) are not admissible and keep an infinite cumulated cost
+    starts, ends = _mask_row_bounds(mask[:l1, :l2])
+    for i in range(l1):
+        row_min = inf
+        for j in range(starts[i], ends[i]):
+            if mask[i, j] < inf:
+                local_cost = 0.
+                for di in range(d):
+                    diff = s1[i, di] - s2[j, di]
+                    local_cost += diff * diff
+                cum_sum[i + 1, j + 1] = local_cost + min(cum_sum[i, j + 1], cum_sum[i + 1, j], cum_sum[i, j])
+                row_min = min(row_min, cum_sum[i + 1, j + 1])
+        if row_min > max_cost:
+            cum_sum[l1, l2] = inf
+            break
+    return cum_sum
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def dtw_path(numpy.ndarray[DTYPE_t, ndim=2] s1, numpy.ndarray[DTYPE_t, ndim=2] s2, numpy.ndarray[DTYPE_t, ndim=2] mask):
@@ -74,50 +127,30 @@ def dtw_path(numpy.ndarray[DTYPE_t, ndim=2] s1, numpy.ndarray[DTYPE_t, ndim=2] s
     cdef int l2 = ts_size(s2)
     assert l1 <= mask.shape[0] and l2 <= mask.shape[1]
 
-    cdef int i = 0
-    cdef int j = 0
-    cdef int argmin_pred = -1
-    cdef numpy.ndarray[DTYPE_t, ndim=2] cross_dist = cdist(s1[:l1], s2[:l2], "sqeuclidean").astype(DTYPE)
-    cdef numpy.ndarray[DTYPE_t, ndim=2] cum_sum = numpy.zeros((l1 + 1, l2 + 1), dtype=DTYPE)
-    cum_sum[1:, 0] = numpy.inf
-    cum_sum[0, 1:] = numpy.inf
-    cdef numpy.ndarray[numpy.int_t, ndim=3] predecessors = numpy.zeros((l1, l2, 2), dtype=numpy.int) - 1
-    cdef numpy.ndarray[DTYPE_t, ndim=1] candidates = numpy.zeros((3, ), dtype=DTYPE)
-    cdef list best_path
-
-    cross_dist[~numpy.isfinite(mask[:l1, :l2])] = numpy.inf
-
-    for i in range(l1):
-        for j in range(l2):
-            cum_sum[i + 1, j + 1] = cross_dist[i, j]
-            if numpy.isfinite(cum_sum[i + 1, j + 1]):
-                candidates[0] = cum_sum[i, j + 1]
-                candidates[1] = cum_sum[i + 1, j]
-                candidates[2] = cum_sum[i, j]
-                if candidates[0] <= candidates[1] and candidates[0] <= candidates[2]:
-                    argmin_pred = 0
-                elif candidates[1] <= candidates[2]:
-                    argmin_pred = 1
-                else:
-                    argmin_pred = 2
-                cum_sum[i + 1, j + 1] += candidates[argmin_pred]
-                if i + j > 0:
-                    if argmin_pred == 0:
-                        predecessors[i, j, 0] = i - 1
-                        predecessors[i, j, 1] = j
-                    elif argmin_pred == 1:
-                        predecessors[i, j, 0] = i
-                        predecessors[i, j, 1] = j - 1
-                    else:
-                        predecessors[i, j, 0] = i - 1
-                        predecessors[i, j, 1] = j - 1
-
-    i = l1 - 1
-    j = l2 - 1
-    best_path = [(i, j)]
-    while predecessors[i, j, 0] >= 0 and predecessors[i, j, 1] >= 0:
-        i, j = predecessors[i, j, 0], predecessors[i, j, 1]
-        best_path.insert(0, (i, j))
+    cdef int i = l1 - 1
+    cdef int j = l2 - 1
+    cdef DTYPE_t up = 0.
+    cdef DTYPE_t left = 0.
+    cdef DTYPE_t diag = 0.
+    cdef numpy.ndarray[DTYPE_t, ndim=2] cum_sum = _cumulated_costs(s1, s2, mask, l1, l2)
+    cdef list best_path = [(i, j)]
+
+    # Backtrack from the last cell, breaking ties the same way as when the path is built forward
+    while i + j > 0:
+        up = cum_sum[i, j + 1]
+        left = cum_sum[i + 1, j]
+        diag = cum_sum[i, j]
+        if up <= left and up <= diag:
+            i -= 1
+        elif left <= diag:
+            j -= 1
+        else:
+            i -= 1
+            j -= 1
+        if i < 0 or j < 0:
+            break
+        best_path.append((i, j))
+    best_path.reverse()
 
     return best_path, numpy.sqrt(cum_sum[l1, l2])
 
@@ -130,22 +163,21 @@ def dtw(numpy.ndarray[DTYPE_t, ndim=2] s1, numpy.ndarray[DTYPE_t, ndim=2] s2, nu
     cdef int l2 = ts_size(s2)
     assert l1 <= mask.shape[0] and l2 <= mask.shape[1]
 
-    cdef int i = 0
-    cdef int j = 0
-    cdef numpy.ndarray[DTYPE_t, ndim=2] cross_dist = cdist(s1[:l1], s2[:l2], "sqeuclidean").astype(DTYPE)
-    cdef numpy.ndarray[DTYPE_t, ndim=2] cum_sum = numpy.zeros((l1 + 1, l2 + 1), dtype=DTYPE)
-    cum_sum[1:, 0] = numpy.inf
-    cum_sum[0, 1:] = numpy.inf
+    return numpy.sqrt(_cumulated_costs(s1, s2, mask, l1, l2)[l1, l2])
 
-    cross_dist[~numpy.isfinite(mask[:l1, :l2])] = numpy.inf
 
-    for i in range(l1):
-        for j in range(l2):
-            cum_sum[i + 1, j + 1] = cross_dist[i, j]
-            if numpy.isfinite(cum_sum[i + 1, j + 1]):
-                cum_sum[i + 1, j + 1] += min(cum_sum[i, j + 1], cum_sum[i + 1, j], cum_sum[i, j])
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def dtw_early_abandon(numpy.ndarray[DTYPE_t, ndim=2] s1, numpy.ndarray[DTYPE_t, ndim=2] s2,
+                      numpy.ndarray[DTYPE_t, ndim=2] mask, DTYPE_t max_dist):
+    """DTW score, or inf as soon as it is known to be larger than max_dist."""
+    assert s1.dtype == DTYPE and s2.dtype == DTYPE
+
+    cdef int l1 = ts_size(s1)
+    cdef int l2 = ts_size(s2)
+    assert l1 <= mask.shape[0] and l2 <= mask.shape[1]
 
-    return numpy.sqrt(cum_sum[l1, l2])
+    return numpy.sqrt(_cumulated_costs(s1, s2, mask, l1, l2, max_dist * max_dist)[l1, l2])
 
 @cython.boundscheck(False) # turn off bounds-checking for entire function
 @cython.wraparound(False)  # turn off negative index wrapping for entire function
@@ -2,9 +2,15 @@
 The :mod:`tslearn.metrics` module gathers time series similarity metrics.
 """
 
+import hashlib
+import numbers
+from collections import OrderedDict
+
 import numpy
-from scipy.spatial.distance import pdist
+from scipy.spatial.distance import pdist, cdist
+from scipy.ndimage import minimum_filter1d, maximum_filter1d
 from sklearn.utils import check_random_state
+from sklearn.externals.joblib import Parallel, delayed, effective_n_jobs
 from tslearn.soft_dtw_fast import _soft_dtw, _soft_dtw_grad, _jacobian_product_sq_euc
 from sklearn.metrics.pairwise import euclidean_distances
 
@@ -73,11 +79,7 @@ def dtw_path(s1, s2, global_constraint=None, sakoe_chiba_radius=1):
     s2 = to_time_series(s2)
     sz1 = s1.shape[0]
     sz2 = s2.shape[0]
-    if global_constraint == "sakoe_chiba":
-        return cydtw_path(s1, s2, mask=sakoe_chiba_mask(sz1, sz2, radius=sakoe_chiba_radius))
-    elif global_constraint == "itakura":
-        return cydtw_path(s1, s2, mask=itakura_mask(sz1, sz2))
-    return cydtw_path(s1, s2, mask=numpy.zeros((sz1, sz2)))
+    return cydtw_path(s1, s2, mask=_dtw_mask(sz1, sz2, global_constraint, sakoe_chiba_radius))
 
 
 def dtw(s1, s2, global_constraint=None, sakoe_chiba_radius=1):
@@ -127,11 +129,7 @@ def dtw(s1, s2, global_constraint=None, sakoe_chiba_radius=1):
     s2 = to_time_series(s2)
     sz1 = s1.shape[0]
     sz2 = s2.shape[0]
-    if global_constraint == "sakoe_chiba":
-        return cydtw(s1, s2, mask=sakoe_chiba_mask(sz1, sz2, radius=sakoe_chiba_radius))
-    elif global_constraint == "itakura":
-        return cydtw(s1, s2, mask=itakura_mask(sz1, sz2))
-    return cydtw(s1, s2, mask=numpy.zeros((sz1, sz2)))
+    return cydtw(s1, s2, mask=_dtw_mask(sz1, sz2, global_constraint, sakoe_chiba_radius))
 
 
 def dtw_subsequence_path(subseq, longseq):
@@ -212,6 +210,25 @@ def itakura_mask(sz1, sz2):
     return cyitakura_mask(sz1, sz2)
 
 
+def _dtw_mask(sz1, sz2, global_constraint=None, sakoe_chiba_radius=1):
+    """Mask of admissible DTW alignments (0 for admissible cells, inf otherwise) for a given global constraint.
+
+    Examples
+    --------
+    >>> _dtw_mask(3, 3)  # doctest: +NORMALIZE_WHITESPACE
+    array([[ 0., 0., 0.],
+           [ 0., 0., 0.],
+           [ 0., 0., 0.]])
+    >>> numpy.alltrue(_dtw_mask(4, 4, "sakoe_chiba", 1) == sakoe_chiba_mask(4, 4, 1))
+    True
+    """
+    if global_constraint == "sakoe_chiba":
+        return sakoe_chiba_mask(sz1, sz2, radius=sakoe_chiba_radius)
+    elif global_constraint == "itakura":
+        return itakura_mask(sz1, sz2)
+    return numpy.zeros((sz1, sz2))
+
+
 def cdist_dtw(dataset1, dataset2=None, global_constraint=None, sakoe_chiba_radius=1):
     """Compute cross-similarity matrix using Dynamic Time Warping (DTW) similarity measure.
 
@@ -263,12 +280,8 @@ def cdist_dtw(dataset1, dataset2=None, global_constraint=None, sakoe_chiba_radiu
         dataset2 = to_time_series_dataset(dataset2)
     sz1 = dataset1.shape[1]
     sz2 = dataset2.shape[1]
-    if global_constraint == "sakoe_chiba":
-        return cycdist_dtw(dataset1, dataset2, self_similarity=self_similarity,
-                           mask=sakoe_chiba_mask(sz1, sz2, radius=sakoe_chiba_radius))
-    elif global_constraint == "itakura":
-        return cycdist_dtw(dataset1, dataset2, self_similarity=self_similarity, mask=itakura_mask(sz1, sz2))
-    return cycdist_dtw(dataset1, dataset2, self_similarity=self_similarity, mask=numpy.zeros((sz1, sz2)))
+    return cycdist_dtw(dataset1, dataset2, self_similarity=self_similarity,
+                       mask=_dtw_mask(sz1, sz2, global_constraint, sakoe_chiba_radius))
 
 
 def gak(s1, s2, sigma=1.):
@@ -312,7 +325,7 @@ def gak(s1, s2, sigma=1.):
     return cynormalized_gak(s1, s2, sigma)
 
 
-def cdist_gak(dataset1, dataset2=None, sigma=1.):
+def cdist_gak(dataset1, dataset2=None, sigma=1., n_jobs=None):
     """Compute cross-similarity matrix using Global Alignment kernel (GAK).
 
     GAK was originally presented in [1]_.
@@ -325,6 +338,9 @@ def cdist_gak(dataset1, dataset2=None, sigma=1.):
         Another dataset of time series
     sigma : float (default 1.)
         Bandwidth of the internal gaussian kernel used for GAK
+    n_jobs : int or None, optional (default=None)
+        The number of jobs to run in parallel, each one computing a block of rows of the cross-similarity matrix.
+        ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context. ``-1`` means using all processors.
 
     Returns
     -------
@@ -339,6 +355,9 @@ def cdist_gak(dataset1, dataset2=None, sigma=1.):
     >>> cdist_gak([[1, 2, 2], [1., 2., 3., 4.]], [[1, 2, 2, 3], [1., 2., 3., 4.]], sigma=2.)  # doctest: +NORMALIZE_WHITESPACE +ELLIPSIS
     array([[ 0.710...,  0.297...],
            [ 0.656...,  1.        ]])
+    >>> numpy.allclose(cdist_gak([[1, 2, 2], [1., 2., 3., 4.]], sigma=2., n_jobs=2),
+    ...                cdist_gak([[1, 2, 2], [1., 2., 3., 4.]], sigma=2.))
+    True
 
     See Also
     --------
@@ -355,13 +374,113 @@ def cdist_gak(dataset1, dataset2=None, sigma=1.):
         self_similarity = True
     else:
         dataset2 = to_time_series_dataset(dataset2)
-    return cycdist_normalized_gak(dataset1, dataset2, sigma, self_similarity=self_similarity)
+    n_blocks = min(effective_n_jobs(n_jobs), dataset1.shape[0])
+    if n_blocks <= 1:
+        return cycdist_normalized_gak(dataset1, dataset2, sigma, self_similarity=self_similarity)
+    # Symmetry is not exploited across blocks, but each block is computed in its own job
+    blocks = numpy.array_split(numpy.arange(dataset1.shape[0]), n_blocks)
+    return numpy.vstack(Parallel(n_jobs=n_jobs)(
+        delayed(cycdist_normalized_gak)(dataset1[block], dataset2, sigma, self_similarity=False) for block in blocks
+    ))
+
+
+def _nystroem_landmarks(dataset, n_landmarks, kernel, random_state=None):
+    """Landmark selection and normalization for the Nystroem approximation of a kernel.
+
+    `n_landmarks` time series (at most the size of `dataset`) are drawn uniformly without replacement and
+    `normalization` is the inverse square root of their Gram matrix, so that `numpy.dot(kernel(X, landmarks),
+    normalization)` gives embeddings whose dot products approximate the kernel.
+
+    Parameters
+    ----------
+    dataset : array-like of shape (n_ts, sz, d)
+        Time series dataset.
+    n_landmarks : int
+        Number of landmarks.
+    kernel : callable
+        Function that returns the Gram matrix of a dataset given as its only argument.
+    random_state : integer or numpy.RandomState or None (default: None)
+        Generator used to draw the landmarks.
+
+    Returns
+    -------
+    numpy.ndarray of integers with shape (n_landmarks, )
+        Sorted indices of the landmarks in `dataset`.
+    numpy.ndarray of shape (n_landmarks, n_landmarks)
+        Normalization matrix.
+
+    Examples
+    --------
+    >>> X = to_time_series_dataset([[1, 2, 3], [2, 2, 3], [3, 2, 1]])
+    >>> indices, normalization = _nystroem_landmarks(X, 3, lambda Z: cdist_gak(Z, sigma=2.), random_state=0)
+    >>> indices
+    array([0, 1, 2])
+    >>> Z = numpy.dot(cdist_gak(X, X[indices], sigma=2.), normalization)
+    >>> numpy.allclose(numpy.dot(Z, Z.T), cdist_gak(X, sigma=2.))
+    True
+    """
+    rs = check_random_state(random_state)
+    n_ts = len(dataset)
+    indices = numpy.sort(rs.choice(n_ts, size=min(n_landmarks, n_ts), replace=False))
+    U, S, V = numpy.linalg.svd(kernel(dataset[indices]))
+    return indices, numpy.dot(U / numpy.sqrt(numpy.maximum(S, 1e-12)), V)
+
+
+# Bandwidths estimated by sigma_gak, keyed by a fingerprint of the dataset and by the sampling parameters
+_sigma_gak_cache = OrderedDict()
+_SIGMA_GAK_CACHE_SIZE = 16
+
+
+def _dataset_fingerprint(dataset):
+    """MD5 fingerprint of the content of a time series dataset (array-like or list of possibly ragged time series).
+
+    Examples
+    --------
+    >>> _dataset_fingerprint([[1, 2, 3]]) == _dataset_fingerprint(numpy.array([[[1.], [2.], [3.]]]))
+    False
+    >>> _dataset_fingerprint([[1, 2, 3]]) == _dataset_fingerprint([[1., 2., 3.]])
+    True
+    """
+    fingerprint = hashlib.md5()
+    if isinstance(dataset, numpy.ndarray):
+        dataset = numpy.ascontiguousarray(dataset, dtype=numpy.float)
+        fingerprint.update(str(dataset.shape).encode("ascii"))
+        fingerprint.update(dataset.view(numpy.uint8))
+    else:
+        for ts in dataset:
+            ts = numpy.ascontiguousarray(ts, dtype=numpy.float)
+            fingerprint.update(str(ts.shape).encode("ascii"))
+            fingerprint.update(ts.view(numpy.uint8))
+    return fingerprint.hexdigest()
+
+
+def _iter_time_series_blocks(dataset, block_size=1024):
+    """Iterate over blocks of a dataset, yielding the non-NaN observations of each block (as a 2d array) together with
+    the sizes of its time series. 3d arrays (including memory-mapped ones) are read block by block, other datasets
+    (e.g. lists of time series of different sizes) are read one time series at a time."""
+    if isinstance(dataset, numpy.ndarray) and dataset.ndim == 3:
+        for start in range(0, dataset.shape[0], block_size):
+            block = numpy.asarray(dataset[start:start + block_size], dtype=numpy.float)
+            # Sizes ignore trailing time steps for which all dimensions are NaN, as in ts_size
+            sizes = block.shape[1] - numpy.argmax(~numpy.isnan(block).all(axis=2)[:, ::-1], axis=1)
+            yield block[~numpy.isnan(block).any(axis=2)], sizes
+    else:
+        for ts in dataset:
+            ts = to_time_series(ts, remove_nans=True)
+            yield ts, numpy.array([ts.shape[0]])
 
 
 def sigma_gak(dataset, n_samples=100, random_state=None):
     """Compute sigma value to be used for GAK.
 
-    This method was originally presented in [1]_.
+    This method was originally presented in [1]_: sigma is estimated as the median distance between observations
+    sampled from the dataset, scaled by the square root of the (smallest) time series size.
+
+    Observations are sampled uniformly (without replacement) in a single pass over the dataset, through a reservoir
+    sample, so that the dataset does not need to be loaded in memory (memory-mapped arrays are read block by block) and
+    datasets of time series of different sizes can be given as lists. Estimates are cached, keyed by a fingerprint of
+    the dataset content, so that repeated calls on the same dataset (e.g. when fitting several models in a
+    hyper-parameter search) are cheap.
 
     Parameters
     ----------
@@ -370,8 +489,9 @@ def sigma_gak(dataset, n_samples=100, random_state=None):
     n_samples : int (default: 100)
         Number of samples on which median distance should be estimated
     random_state : integer or numpy.RandomState or None (default: None)
-        The generator used to draw the samples. If an integer is given, it fixes the seed. Defaults to the global
-        numpy random number generator.
+        The generator used to draw the samples. If an integer is given, it fixes the seed. None means a fixed seed
+        (0) is used, so that estimates are deterministic. Estimates are only cached if `random_state` is an integer or
+        None.
 
     Returns
     -------
@@ -383,6 +503,8 @@ def sigma_gak(dataset, n_samples=100, random_state=None):
     >>> dataset = [[1, 2, 2, 3], [1., 2., 3., 4.]]
     >>> sigma_gak(dataset=dataset, n_samples=200, random_state=0)  # doctest: +ELLIPSIS
     2.0...
+    >>> sigma_gak(dataset=[[1, 2, 2, 3], [1., 2., 3.]])  # doctest: +ELLIPSIS
+    1.7320...
 
     See Also
     --------
@@ -393,18 +515,34 @@ def sigma_gak(dataset, n_samples=100, random_state=None):
     ----------
     .. [1] M. Cuturi, "Fast global alignment kernels," ICML 2011.
     """
+    if random_state is None:
+        random_state = 0
+    key = None
+    if isinstance(random_state, numbers.Integral):
+        key = (_dataset_fingerprint(dataset), n_samples, random_state)
+        if key in _sigma_gak_cache:
+            _sigma_gak_cache[key] = _sigma_gak_cache.pop(key)  # Move to the end (most recently used)
+            return _sigma_gak_cache[key]
     random_state = check_random_state(random_state)
-    dataset = to_time_series_dataset(dataset)
-    n_ts, sz, d = dataset.shape
-    if not check_equal_size(dataset):
-        sz = numpy.min([ts_size(ts) for ts in dataset])
-    if n_ts * sz < n_samples:
-        replace = True
-    else:
-        replace = False
-    sample_indices = random_state.choice(n_ts * sz, size=n_samples, replace=replace)
-    dists = pdist(dataset[:, :sz, :].reshape((-1, d))[sample_indices], metric="euclidean")
-    return numpy.median(dists) * numpy.sqrt(sz)
+
+    # Reservoir sampling through random keys: the observations with the n_samples smallest keys are kept
+    sample, sample_keys = None, numpy.empty((0, ))
+    min_sz = numpy.inf
+    for observations, sizes in _iter_time_series_blocks(dataset):
+        min_sz = min(min_sz, sizes.min())
+        keys = numpy.concatenate((sample_keys, random_state.random_sample(observations.shape[0])))
+        observations = observations if sample is None else numpy.vstack((sample, observations))
+        if keys.shape[0] > n_samples:
+            kept = numpy.argpartition(keys, n_samples - 1)[:n_samples]
+            keys, observations = keys[kept], observations[kept]
+        sample, sample_keys = observations, keys
+    sigma = numpy.median(pdist(sample, metric="euclidean")) * numpy.sqrt(min_sz)
+
+    if key is not None:
+        _sigma_gak_cache[key] = sigma
+        while len(_sigma_gak_cache) > _SIGMA_GAK_CACHE_SIZE:
+            _sigma_gak_cache.popitem(last=False)
+    return sigma
 
 
 def gamma_soft_dtw(dataset, n_samples=100, random_state=None):
@@ -419,8 +557,9 @@ def gamma_soft_dtw(dataset, n_samples=100, random_state=None):
     n_samples : int (default: 100)
         Number of samples on which median distance should be estimated
     random_state : integer or numpy.RandomState or None (default: None)
-        The generator used to draw the samples. If an integer is given, it fixes the seed. Defaults to the global
-        numpy random number generator.
+        The generator used to draw the samples. If an integer is given, it fixes the seed. None means a fixed seed
+        (0) is used, so that estimates are deterministic. Estimates are only cached if `random_state` is an integer or
+        None.
 
     Returns
     -------
@@ -555,6 +694,112 @@ def lb_envelope(ts, radius=1):
     return cylb_envelope(to_time_series(ts), radius=radius)
 
 
+def _lb_envelope_dataset(dataset, radius=1):
+    """Compute LB_Keogh-related envelopes of all time series in an equal-sized dataset at once.
+
+    Examples
+    --------
+    >>> env_low, env_up = _lb_envelope_dataset([[1, 2, 3, 2, 1], [0, 0, 0, 0, 1]], radius=1)
+    >>> env_low.shape
+    (2, 5, 1)
+    >>> numpy.alltrue(env_up[0] == lb_envelope([1, 2, 3, 2, 1], radius=1)[1])
+    True
+    """
+    dataset = to_time_series_dataset(dataset)
+    sz = dataset.shape[1]
+    if radius >= sz - 1:
+        shape = dataset.shape
+        return (numpy.broadcast_to(dataset.min(axis=1, keepdims=True), shape),
+                numpy.broadcast_to(dataset.max(axis=1, keepdims=True), shape))
+    return (minimum_filter1d(dataset, size=2 * radius + 1, axis=1, mode="nearest"),
+            maximum_filter1d(dataset, size=2 * radius + 1, axis=1, mode="nearest"))
+
+
+def cdist_lb_keogh(dataset_query, dataset_candidate=None, radius=1, envelopes_candidate=None):
+    """Compute LB_Keogh between all pairs of time series from a query dataset and a candidate dataset.
+
+    LB_Keogh was originally presented in [1]_. Multidimensional time series are supported: squared contributions of
+    all dimensions are summed. LB_Keogh computed with a given `radius` lower bounds DTW with a Sakoe-Chiba band of
+    the same radius, hence using `radius >= sz - 1` gives a lower bound for unconstrained DTW.
+
+    Parameters
+    ----------
+    dataset_query : array-like
+        A dataset of query time series.
+    dataset_candidate : array-like or None (default: None)
+        A dataset of candidate time series. None means the envelopes are provided via `envelopes_candidate` parameter
+        and hence do not need to be computed again.
+    radius : int (default: 1)
+        Radius to be used for the envelope generation. Not used if `dataset_candidate` is None.
+    envelopes_candidate: pair of array-like (envelopes_down, envelopes_up) or None (default: None)
+        Pre-computed envelopes of the candidate time series, each of shape (n_candidates, sz, d).
+
+    Note
+    ----
+        This method requires all time series (queries and candidates) to be of equal size.
+
+    Returns
+    -------
+    numpy.ndarray of shape (n_queries, n_candidates)
+        LB_Keogh values.
+
+    Examples
+    --------
+    >>> cdist_lb_keogh([[0, 0, 0, 0, 0]], [[1, 2, 3, 2, 1], [0, 1, 0, -1, 0]], radius=1)  # doctest: +ELLIPSIS
+    array([[ 2.8284...,  0.        ]])
+    >>> dataset = [[1, 2, 3, 2, 1], [0, 1, 0, -1, 0], [2, 2, 2, 3, 1]]
+    >>> numpy.alltrue(cdist_lb_keogh(dataset, dataset, radius=4) <= cdist_dtw(dataset, dataset) + 1e-9)
+    True
+
+    See also
+    --------
+    lb_keogh : Compute LB_Keogh similarity between two time series
+
+    References
+    ----------
+    .. [1] Keogh, E. Exact indexing of dynamic time warping. In International Conference on Very Large Data Bases, 2002.
+       pp 406-417.
+    """
+    dataset_query = to_time_series_dataset(dataset_query)
+    if dataset_candidate is None:
+        envelopes_down, envelopes_up = envelopes_candidate
+    else:
+        envelopes_down, envelopes_up = _lb_envelope_dataset(dataset_candidate, radius=radius)
+    n_query, n_candidate = dataset_query.shape[0], envelopes_down.shape[0]
+    assert dataset_query.shape[1:] == envelopes_down.shape[1:], "LB_Keogh requires time series of equal sizes"
+    lb = numpy.empty((n_query, n_candidate))
+    # Loop over the smallest dataset, and broadcast over the other one
+    if n_query <= n_candidate:
+        for i in range(n_query):
+            lb[i] = _lb_keogh_broadcast(dataset_query[i:i + 1], envelopes_down, envelopes_up)
+    else:
+        for j in range(n_candidate):
+            lb[:, j] = _lb_keogh_broadcast(dataset_query, envelopes_down[j:j + 1], envelopes_up[j:j + 1])
+    return lb
+
+
+def _lb_keogh_broadcast(queries, envelopes_down, envelopes_up):
+    diff = numpy.maximum(queries - envelopes_up, 0.) + numpy.maximum(envelopes_down - queries, 0.)
+    return numpy.sqrt(numpy.sum(diff ** 2, axis=(1, 2)))
+
+
+def _cdist_lb_first_last(dataset1, dataset2):
+    """Lower bound for DTW between equal-sized time series based on their first and last elements only (as in
+    LB_Kim), since both (0, 0) and (sz - 1, sz - 1) belong to any DTW path.
+
+    Examples
+    --------
+    >>> _cdist_lb_first_last([[1, 2, 3, 4]], [[0, 5, 5, 5], [1, 0, 0, 4]])
+    array([[ 1.41421356,  0.        ]])
+    """
+    dataset1 = to_time_series_dataset(dataset1)
+    dataset2 = to_time_series_dataset(dataset2)
+    sq_dists = cdist(dataset1[:, 0], dataset2[:, 0], "sqeuclidean")
+    if dataset1.shape[1] > 1:
+        sq_dists += cdist(dataset1[:, -1], dataset2[:, -1], "sqeuclidean")
+    return numpy.sqrt(sq_dists)
+
+
 def soft_dtw(ts1, ts2, gamma=1.):
     """Compute Soft-DTW metric between two time series.
 
@@ -4,12 +4,129 @@ time series metrics.
 """
 
 import numpy
+import heapq
+import json
+import os
 from sklearn.neighbors import KNeighborsClassifier, NearestNeighbors
-from sklearn.neighbors.base import KNeighborsMixin
+from sklearn.neighbors.base import KNeighborsMixin, _get_weights
+from sklearn.utils import get_chunk_n_rows
+from sklearn.externals.joblib import Parallel, delayed, effective_n_jobs
 from scipy.spatial.distance import cdist as scipy_cdist
 
-from tslearn.metrics import cdist_dtw
-from tslearn.utils import to_time_series_dataset, to_sklearn_dataset
+from tslearn.metrics import (cdist_dtw, cdist_lb_keogh, _cdist_lb_first_last, _lb_envelope_dataset, _lb_keogh_broadcast,
+                             _dtw_mask)
+from tslearn.cydtw import dtw_early_abandon
+from tslearn.piecewise import _breakpoints
+from tslearn.utils import to_time_series_dataset, to_sklearn_dataset, check_equal_size
+
+
+def _kneighbors_dtw_pruned(X, fit_X, envelopes, n_neighbors, mask, query_indices=None):
+    """Exact DTW k-nearest neighbors search with lower bound pruning and early abandoning.
+
+    For each query, candidates are visited by increasing lower bound (maximum of LB_Keogh, computed from pre-computed
+    candidate envelopes, and of the first/last points bound, as in LB_Kim), see `_k_best_pruned`, and DTW
+    computations are abandoned as soon as they exceed the current k-th best distance.
+
+    If `query_indices` is given, queries are the time series of `fit_X` at these indices and are not considered their
+    own neighbors.
+
+    Examples
+    --------
+    >>> fit_X = to_time_series_dataset([[1, 2, 3, 4], [3, 3, 2, 0], [1, 2, 2, 4]])
+    >>> envelopes = _lb_envelope_dataset(fit_X, radius=4)
+    >>> dist, ind = _kneighbors_dtw_pruned(fit_X, fit_X, envelopes, 1, _dtw_mask(4, 4), query_indices=numpy.arange(3))
+    >>> ind
+    array([[2],
+           [2],
+           [0]])
+    """
+    n_queries = X.shape[0]
+    # Slightly shrink lower bounds to be robust to rounding errors
+    lbs = numpy.maximum(cdist_lb_keogh(X, None, envelopes_candidate=envelopes),
+                        _cdist_lb_first_last(X, fit_X)) * (1. - 1e-9)
+    dist = numpy.empty((n_queries, n_neighbors))
+    ind = numpy.empty((n_queries, n_neighbors), dtype=numpy.int)
+    for i in range(n_queries):
+        dist_fun = lambda j, max_dist: dtw_early_abandon(X[i], fit_X[j], mask, max_dist)
+        dist[i], ind[i] = _k_best_pruned(lbs[i], dist_fun, n_neighbors,
+                                         skip=query_indices[i] if query_indices is not None else None)
+    return dist, ind
+
+
+def _k_best_pruned(lbs, dist_fun, n_neighbors, skip=None):
+    """k smallest distances from a query to a set of candidates, visiting candidates by increasing lower bound.
+
+    `dist_fun(j, max_dist)` should return the distance to candidate `j`, or any value larger than `max_dist` if it
+    exceeds this threshold. A heap holds the k best candidates found so far and the search stops as soon as the lower
+    bound exceeds the current k-th best distance. Candidate `skip` is ignored and ties are broken by candidate index.
+
+    Examples
+    --------
+    >>> dists = numpy.array([3., 1., 2., 1.])
+    >>> _k_best_pruned(dists - .5, lambda j, max_dist: dists[j], 2)
+    (array([ 1.,  1.]), array([1, 3]))
+    """
+    heap = []  # (-distance, -index) pairs, so that heap[0] is the current k-th best neighbor
+    kth_dist = numpy.inf
+    for j in numpy.argsort(lbs, kind="mergesort"):
+        if j == skip:
+            continue
+        if lbs[j] > kth_dist:
+            break
+        # Abandon slightly above the k-th distance so that ties are kept and broken by index
+        d = dist_fun(j, kth_dist * (1. + 1e-9))
+        if len(heap) < n_neighbors:
+            heapq.heappush(heap, (-d, -j))
+        elif (-d, -j) > heap[0]:
+            heapq.heapreplace(heap, (-d, -j))
+        if len(heap) == n_neighbors:
+            kth_dist = -heap[0][0]
+    neighbors = sorted((-neg_d, -neg_j) for neg_d, neg_j in heap)
+    return numpy.array([d for d, _ in neighbors]), numpy.array([j for _, j in neighbors], dtype=numpy.int)
+
+
+def _k_smallest(dists, k):
+    """Values and indices of the k smallest entries in each row of a matrix, sorted by value then by index.
+
+    Examples
+    --------
+    >>> _k_smallest(numpy.array([[3., 1., 2., 1.], [0., 5., 4., 3.]]), 2)
+    (array([[ 1.,  1.],
+           [ 0.,  3.]]), array([[1, 3],
+           [0, 3]]))
+    """
+    if k < dists.shape[1]:
+        ind = numpy.sort(numpy.argpartition(dists, k - 1, axis=1)[:, :k], axis=1)
+    else:
+        ind = numpy.tile(numpy.arange(dists.shape[1]), (dists.shape[0], 1))
+    rows = numpy.arange(dists.shape[0]).reshape((-1, 1))
+    ind = ind[rows, numpy.argsort(dists[rows, ind], axis=1, kind="mergesort")]
+    return dists[rows, ind], ind
+
+
+def _kneighbors_brute(X, fit_X, n_neighbors, metric, query_indices=None, global_constraint=None,
+                      sakoe_chiba_radius=1):
+    """k-nearest neighbors search for a block of queries, computing all distances to the training time series.
+
+    If `query_indices` is given, queries are the time series of `fit_X` at these indices and are not considered their
+    own neighbors.
+
+    Examples
+    --------
+    >>> fit_X = to_time_series_dataset([[1, 2, 3, 4], [3, 3, 2, 0], [1, 2, 2, 4]])
+    >>> dist, ind = _kneighbors_brute(fit_X, fit_X, 1, "euclidean", query_indices=numpy.arange(3))
+    >>> ind
+    array([[2],
+           [2],
+           [0]])
+    """
+    if metric == "dtw":
+        dists = cdist_dtw(X, fit_X, global_constraint=global_constraint, sakoe_chiba_radius=sakoe_chiba_radius)
+    else:
+        dists = scipy_cdist(X.reshape((X.shape[0], -1)), fit_X.reshape((fit_X.shape[0], -1)), metric=metric)
+    if query_indices is not None:
+        dists[numpy.arange(X.shape[0]), query_indices] = numpy.inf
+    return _k_smallest(dists, n_neighbors)
 
 
 class KNeighborsTimeSeriesMixin(KNeighborsMixin):
@@ -22,6 +139,18 @@ class KNeighborsTimeSeriesMixin(KNeighborsMixin):
             self.metric = metric
         self.metric_params = metric_params
 
+    def _dtw_constraint(self):
+        metric_params = self.metric_params if self.metric_params is not None else {}
+        return metric_params.get("global_constraint", None), metric_params.get("sakoe_chiba_radius", 1)
+
+    def _precompute_envelopes(self):
+        """Pre-compute LB_Keogh envelopes of the training time series, used for pruned DTW searches."""
+        self._envelopes = None
+        if (self.metric == "dtw" or self.metric == cdist_dtw) and check_equal_size(self._fit_X):
+            global_constraint, sakoe_chiba_radius = self._dtw_constraint()
+            radius = sakoe_chiba_radius if global_constraint == "sakoe_chiba" else self._fit_X.shape[1]
+            self._envelopes = _lb_envelope_dataset(self._fit_X, radius=radius)
+
     def kneighbors(self, X=None, n_neighbors=None, return_distance=True):
         """Finds the K-neighbors of a point.
 
@@ -54,11 +183,9 @@ class KNeighborsTimeSeriesMixin(KNeighborsMixin):
             X = self._fit_X
             self_neighbors = True
         if self.metric == "dtw" or self.metric == cdist_dtw:
-            cdist_fun = cdist_dtw
+            metric = "dtw"
         elif self.metric in ["euclidean", "sqeuclidean", "cityblock"]:
-            cdist_fun = lambda X, Xp: scipy_cdist(X.reshape((X.shape[0], -1)),
-                                                  Xp.reshape((Xp.shape[0], -1)),
-                                                  metric=self.metric)
+            metric = self.metric
         else:
             raise ValueError("Unrecognized time series metric string: %s "
                              "(should be one of 'dtw', 'euclidean', "
@@ -70,18 +197,41 @@ class KNeighborsTimeSeriesMixin(KNeighborsMixin):
         else:
             fit_X = self._fit_X
 
-        full_dist_matrix = cdist_fun(X, fit_X)
-        ind = numpy.argsort(full_dist_matrix, axis=1)
+        n_ts, n_fit = X.shape[0], fit_X.shape[0]
+        n_neighbors = min(n_neighbors, n_fit - 1 if self_neighbors else n_fit)
+        n_jobs = getattr(self, "n_jobs", None)
+        global_constraint, sakoe_chiba_radius = self._dtw_constraint()
+        use_pruning = False
+        if metric == "dtw" and getattr(self, "_envelopes", None) is not None:
+            X = to_time_series_dataset(X)
+            use_pruning = X.shape[1:] == fit_X.shape[1:] and check_equal_size(X)
 
-        if self_neighbors:
-            ind = ind[:, 1:]
-        if n_neighbors > full_dist_matrix.shape[1]:
-            n_neighbors = full_dist_matrix.shape[1]
-        ind = ind[:, :n_neighbors]
-
-        n_ts = X.shape[0]
-        sample_range = numpy.arange(n_ts)[:, None]
-        dist = full_dist_matrix[sample_range, ind]
+        if use_pruning:
+            # Queries are split evenly across jobs, since pruning makes the cost of each query hard to predict
+            blocks = [block for block in numpy.array_split(numpy.arange(n_ts), min(effective_n_jobs(n_jobs), n_ts))
+                      if len(block)]
+            mask = _dtw_mask(X.shape[1], fit_X.shape[1], global_constraint, sakoe_chiba_radius)
+            results = Parallel(n_jobs=n_jobs)(
+                delayed(_kneighbors_dtw_pruned)(X[block], fit_X, self._envelopes, n_neighbors, mask,
+                                                query_indices=block if self_neighbors else None)
+                for block in blocks
+            )
+        else:
+            # Distances are computed for blocks of queries that fit in scikit-learn's working memory
+            block_size = get_chunk_n_rows(row_bytes=8 * n_fit)
+            blocks = [numpy.arange(start, min(start + block_size, n_ts)) for start in range(0, n_ts, block_size)]
+            results = Parallel(n_jobs=n_jobs)(
+                delayed(_kneighbors_brute)(X[block], fit_X, n_neighbors, metric,
+                                           query_indices=block if self_neighbors else None,
+                                           global_constraint=global_constraint, sakoe_chiba_radius=sakoe_chiba_radius)
+                for block in blocks
+            )
+        if len(results) > 0:
+            dist = numpy.vstack([block_dist for block_dist, _ in results])
+            ind = numpy.vstack([block_ind for _, block_ind in results])
+        else:
+            dist = numpy.empty((0, n_neighbors))
+            ind = numpy.empty((0, n_neighbors), dtype=numpy.int)
 
         if return_distance:
             return dist, ind
@@ -102,7 +252,18 @@ class KNeighborsTimeSeries(KNeighborsTimeSeriesMixin, NearestNeighbors):
         Other metrics are described in `scipy.spatial.distance doc
         <https://docs.scipy.org/doc/scipy/reference/spatial.distance.html>`_.
     metric_params : dict or None (default: None)
-        Dictionnary of metric parameters.
+        Dictionnary of metric parameters. For DTW, values associated to the `"global_constraint"` and
+        `"sakoe_chiba_radius"` keys restrict admissible alignments (see :func:`tslearn.metrics.dtw`).
+    n_jobs : int or None, optional (default=None)
+        The number of jobs to run in parallel for neighbors searches. ``None`` means 1 unless in a
+        :obj:`joblib.parallel_backend` context. ``-1`` means using all processors.
+
+    Note
+    ----
+        If `metric="dtw"` and all time series share the same length, neighbors are searched exactly but without
+        computing all DTW scores: candidates are ranked by lower bounds (LB_Keogh, first/last points), envelopes of
+        the training time series being computed at fit time, and DTW computations are abandoned as soon as they
+        cannot improve the current k nearest neighbors.
 
     Examples
     --------
@@ -117,11 +278,17 @@ class KNeighborsTimeSeries(KNeighborsTimeSeriesMixin, NearestNeighbors):
     >>> ind = knn2.kneighbors(return_distance=False)
     >>> ind.shape
     (3, 2)
+    >>> from tslearn.generators import random_walks
+    >>> X = random_walks(n_ts=40, sz=16, d=2, random_state=0)
+    >>> dist, ind = KNeighborsTimeSeries(n_neighbors=3).fit(X[:30]).kneighbors(X[30:])
+    >>> numpy.allclose(dist, numpy.sort(cdist_dtw(X[30:], X[:30]), axis=1)[:, :3])
+    True
     """
-    def __init__(self, n_neighbors=5, metric="dtw", metric_params=None):
+    def __init__(self, n_neighbors=5, metric="dtw", metric_params=None, n_jobs=None):
         NearestNeighbors.__init__(self,
                                   n_neighbors=n_neighbors,
-                                  algorithm='brute')
+                                  algorithm='brute',
+                                  n_jobs=n_jobs)
         self._set_metric(metric, metric_params)
 
     def fit(self, X, y=None):
@@ -133,6 +300,7 @@ class KNeighborsTimeSeries(KNeighborsTimeSeriesMixin, NearestNeighbors):
             Training data.
         """
         self._fit_X = to_time_series_dataset(X)
+        self._precompute_envelopes()
         return self
 
     def kneighbors(self, X=None, n_neighbors=None, return_distance=True):
@@ -189,24 +357,45 @@ class KNeighborsTimeSeriesClassifier(KNeighborsClassifier,
         (default: 'dtw')
         Metric to be used at the core of the nearest neighbor procedure
     metric_params : dict or None (default: None)
-        Dictionnary of metric parameters.
+        Dictionnary of metric parameters (see :class:`.KNeighborsTimeSeries`).
+    n_jobs : int or None, optional (default=None)
+        The number of jobs to run in parallel for neighbors searches. ``None`` means 1 unless in a
+        :obj:`joblib.parallel_backend` context. ``-1`` means using all processors.
+
+    Note
+    ----
+        Predictions rely on the same neighbors search as :class:`.KNeighborsTimeSeries`, hence DTW-based predictions
+        benefit from lower bound pruning when all time series share the same length.
 
     Examples
     --------
     >>> clf = KNeighborsTimeSeriesClassifier(n_neighbors=2, metric="dtw")
     >>> clf.fit([[1, 2, 3], [1, 1.2, 3.2], [3, 2, 1]], y=[0, 0, 1]).predict([1, 2.2, 3.5])
     array([0])
+    >>> clf = KNeighborsTimeSeriesClassifier(n_neighbors=1, metric="dtw")
+    >>> clf.fit([[1, 2, 3], [1, 1.2, 3.2], [3, 2, 1, 1]], y=[0, 0, 1]).predict([[1, 2.2, 3.5], [3, 3, 2, 1, 1]])
+    array([0, 1])
+    >>> from tslearn.generators import random_walk_blobs
+    >>> X, y = random_walk_blobs(n_ts_per_blob=20, sz=16, d=2, n_blobs=3, random_state=0)
+    >>> clf = KNeighborsTimeSeriesClassifier(n_neighbors=3, weights="distance").fit(X[::2], y[::2])
+    >>> dist = numpy.sort(cdist_dtw(X[1::2], X[::2]), axis=1)[:, :3]
+    >>> numpy.allclose(clf.kneighbors(X[1::2])[0], dist)
+    True
+    >>> clf.predict_proba(X[1::2]).shape
+    (30, 3)
     """
     def __init__(self,
                  n_neighbors=5,
                  weights='uniform',
                  metric="dtw",
                  metric_params=None,
-                 d=None):
+                 d=None,
+                 n_jobs=None):
         KNeighborsClassifier.__init__(self,
                                       n_neighbors=n_neighbors,
                                       weights=weights,
-                                      algorithm='brute')
+                                      algorithm='brute',
+                                      n_jobs=n_jobs)
         self._set_metric(metric, metric_params)
         self.d = d
 
@@ -221,7 +410,44 @@ class KNeighborsTimeSeriesClassifier(KNeighborsClassifier,
             Target values.
         """
         X_, self.d = to_sklearn_dataset(X, return_dim=True)
-        return super(KNeighborsTimeSeriesClassifier, self).fit(X_, y)
+        # scikit-learn only handles targets here: NaN padding is not a concern since training time series are then
+        # stored in tslearn format and are never used by scikit-learn
+        super(KNeighborsTimeSeriesClassifier, self).fit(numpy.nan_to_num(X_), y)
+        self._fit_X = to_time_series_dataset(X)
+        self._precompute_envelopes()
+        return self
+
+    def kneighbors(self, X=None, n_neighbors=None, return_distance=True):
+        """Finds the K-neighbors of a point.
+
+        Returns indices of and distances to the neighbors of each point.
+
+        Parameters
+        ----------
+        X : array-like, shape (n_ts, sz, d)
+            The query time series.
+            If not provided, neighbors of each indexed point are returned.
+            In this case, the query point is not considered its own neighbor.
+        n_neighbors : int
+            Number of neighbors to get (default is the value passed to the
+            constructor).
+        return_distance : boolean, optional. Defaults to True.
+            If False, distances will not be returned
+
+        Returns
+        -------
+        dist : array
+            Array representing the distance to points, only present if
+            return_distance=True
+        ind : array
+            Indices of the nearest points in the population matrix.
+        """
+        if X is not None:
+            X = to_time_series_dataset(X)
+        return KNeighborsTimeSeriesMixin.kneighbors(self,
+                                                    X=X,
+                                                    n_neighbors=n_neighbors,
+                                                    return_distance=return_distance)
 
     def predict(self, X):
         """Predict the class labels for the provided data
@@ -231,8 +457,11 @@ class KNeighborsTimeSeriesClassifier(KNeighborsClassifier,
         X : array-like, shape (n_ts, sz, d)
             Test samples.
         """
-        X_ = to_sklearn_dataset(X)
-        return super(KNeighborsTimeSeriesClassifier, self).predict(X_)
+        probabilities = self.predict_proba(X)
+        if not self.outputs_2d_:
+            return self.classes_.take(numpy.argmax(probabilities, axis=1))
+        return numpy.vstack([classes_k.take(numpy.argmax(proba_k, axis=1))
+                             for classes_k, proba_k in zip(self.classes_, probabilities)]).T
 
     def predict_proba(self, X):
         """Predict the class probabilities for the provided data
@@ -242,5 +471,875 @@ class KNeighborsTimeSeriesClassifier(KNeighborsClassifier,
         X : array-like, shape (n_ts, sz, d)
             Test samples.
         """
-        X_ = to_sklearn_dataset(X)
-        return super(KNeighborsTimeSeriesClassifier, self).predict_proba(X_)
+        neigh_dist, neigh_ind = self.kneighbors(X)
+        weights = _get_weights(neigh_dist, self.weights)
+        if weights is None:
+            weights = numpy.ones_like(neigh_dist)
+
+        classes_ = self.classes_
+        _y = self._y
+        if not self.outputs_2d_:
+            _y = self._y.reshape((-1, 1))
+            classes_ = [self.classes_]
+
+        rows = numpy.repeat(numpy.arange(neigh_ind.shape[0]), neigh_ind.shape[1])
+        probabilities = []
+        for k, classes_k in enumerate(classes_):
+            proba_k = numpy.zeros((neigh_ind.shape[0], classes_k.size))
+            numpy.add.at(proba_k, (rows, _y[neigh_ind, k].ravel()), weights.ravel())
+            normalizer = proba_k.sum(axis=1).reshape((-1, 1))
+            normalizer[normalizer == 0.] = 1.
+            probabilities.append(proba_k / normalizer)
+
+        if not self.outputs_2d_:
+            return probabilities[0]
+        return probabilities
+
+
+def _ts_sizes(dataset):
+    """Actual sizes of all time series in a NaN-padded dataset (see :func:`tslearn.utils.ts_size`).
+
+    Examples
+    --------
+    >>> _ts_sizes(to_time_series_dataset([[1, 2, 3], [1, 2], [4]]))
+    array([3, 2, 1])
+    """
+    is_valid = ~numpy.isnan(dataset).all(axis=2)
+    return dataset.shape[1] - numpy.argmax(is_valid[:, ::-1], axis=1)
+
+
+class TimeSeriesIndex(object):
+    """Persistent and incrementally updatable index for nearest neighbors searches on time series.
+
+    The index stores time series (padded with NaNs), their sizes, their LB_Keogh envelopes and their PAA summaries.
+    Time series can be added or removed without recomputing summaries of the other indexed time series, and the index
+    can be saved to a directory of `.npy` files. These files are memory-mapped when the index is loaded back, so that
+    loading does not depend on the number of indexed time series and several processes share a single page-cached
+    copy of the index.
+
+    Searches are exact: for DTW, candidates are visited by increasing lower bound (LB_Keogh for candidates of the same
+    size as the query, first/last points bound otherwise) and DTW computations are abandoned early. For other metrics,
+    PAA-based lower bounds are used to discard candidates before computing distances.
+
+    Parameters
+    ----------
+    metric : {'dtw', 'euclidean', 'sqeuclidean', 'cityblock'} (default: 'dtw')
+        Metric to be used for neighbors searches.
+    metric_params : dict or None (default: None)
+        Dictionnary of metric parameters (see :class:`.KNeighborsTimeSeries`).
+    n_segments : int (default: 8)
+        Number of PAA segments used to summarize time series (capped at the size of the time series).
+
+    Attributes
+    ----------
+    ids_ : numpy.ndarray of shape (n_ts, )
+        Identifiers of the indexed time series.
+    sz_ : int or None
+        Size of the indexed time series (None as long as no time series has been added).
+    d_ : int or None
+        Dimension of the indexed time series (None as long as no time series has been added).
+
+    Note
+    ----
+        For metrics other than DTW, all time series (indexed ones and queries) should share the same size. DTW between
+        time series of different sizes is computed as in :func:`tslearn.metrics.dtw`, global constraints being defined
+        with respect to the actual sizes of both time series.
+        Once an index is loaded, its memory-mapped files are never modified: adding or removing time series loads the
+        index in memory, and changes are persisted by calling `save` again.
+
+    Examples
+    --------
+    >>> from tslearn.generators import random_walks
+    >>> X = random_walks(n_ts=50, sz=32, d=1, random_state=0)
+    >>> index = TimeSeriesIndex(metric="dtw")
+    >>> index.add(X[:40])[-3:]
+    array([37, 38, 39])
+    >>> len(index)
+    40
+    >>> dist, ind = index.kneighbors(X[40:], n_neighbors=3)
+    >>> numpy.allclose(dist, numpy.sort(cdist_dtw(X[40:], X[:40]), axis=1)[:, :3])
+    True
+    >>> index.remove(numpy.arange(10))
+    >>> index.add(X[40:42])
+    array([40, 41])
+    >>> len(index)
+    32
+    >>> import tempfile
+    >>> path = tempfile.mkdtemp()
+    >>> index.save(path)
+    >>> loaded_index = TimeSeriesIndex.load(path)
+    >>> loaded_index.kneighbors(X[40:42], n_neighbors=1, return_distance=False)
+    array([[40],
+           [41]])
+    >>> loaded_index.radius_neighbors(X[40:41], radius=1e-6)
+    (array([array([ 0.])], dtype=object), array([array([40])], dtype=object))
+    >>> euclidean_index = TimeSeriesIndex(metric="euclidean")
+    >>> _ = euclidean_index.add(X[:40])
+    >>> dist, ind = euclidean_index.kneighbors(X[40:], n_neighbors=3)
+    >>> numpy.allclose(dist, numpy.sort(cdist_dtw(X[40:], X[:40], sakoe_chiba_radius=0,
+    ...                                           global_constraint="sakoe_chiba"), axis=1)[:, :3])
+    True
+    """
+    _array_names = ["series", "sizes", "envelopes_down", "envelopes_up", "paa", "ids"]
+
+    def __init__(self, metric="dtw", metric_params=None, n_segments=8):
+        if metric not in ["dtw", "euclidean", "sqeuclidean", "cityblock"]:
+            raise ValueError("Unrecognized time series metric string: %s "
+                             "(should be one of 'dtw', 'euclidean', "
+                             "'sqeuclidean' or 'cityblock')" % metric)
+        self.metric = metric
+        self.metric_params = metric_params
+        self.n_segments = n_segments
+        self.sz_ = None
+        self.d_ = None
+        self._data = None
+        self._n = 0
+        self._next_id = 0
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def ids_(self):
+        if self._data is None:
+            return numpy.empty((0, ), dtype=numpy.int)
+        return self._data["ids"][:self._n]
+
+    def _dtw_constraint(self):
+        return KNeighborsTimeSeriesMixin._dtw_constraint(self)
+
+    def _summaries(self, X, sizes):
+        n_ts = X.shape[0]
+        global_constraint, sakoe_chiba_radius = self._dtw_constraint()
+        radius = sakoe_chiba_radius if global_constraint == "sakoe_chiba" else self.sz_
+        envelopes_down = numpy.full(X.shape, numpy.nan)
+        envelopes_up = numpy.full(X.shape, numpy.nan)
+        # Envelopes are computed at once for all time series of the same size
+        for sz in numpy.unique(sizes):
+            rows = numpy.flatnonzero(sizes == sz)
+            envelopes_down[rows, :sz], envelopes_up[rows, :sz] = _lb_envelope_dataset(X[rows, :sz], radius=radius)
+        n_segments = min(self.n_segments, self.sz_)
+        sz_segment = self.sz_ // n_segments
+        paa = X[:, :n_segments * sz_segment].reshape((n_ts, n_segments, sz_segment, self.d_)).mean(axis=2)
+        return envelopes_down, envelopes_up, paa
+
+    def _reserve(self, n_new):
+        """Make sure stored arrays are writable and can hold `n_new` more time series, growing them geometrically."""
+        if self._data is not None and self._n + n_new <= self._data["ids"].shape[0] and \
+                self._data["ids"].flags.writeable:
+            return
+        capacity = max(2 * self._n, self._n + n_new, 16)
+        shapes = {"series": (capacity, self.sz_, self.d_),
+                  "sizes": (capacity, ),
+                  "envelopes_down": (capacity, self.sz_, self.d_),
+                  "envelopes_up": (capacity, self.sz_, self.d_),
+                  "paa": (capacity, min(self.n_segments, self.sz_), self.d_),
+                  "ids": (capacity, )}
+        data = {}
+        for name in self._array_names:
+            dtype = numpy.int if name in ["sizes", "ids"] else numpy.float
+            data[name] = numpy.empty(shapes[name], dtype=dtype)
+            if self._data is not None:
+                data[name][:self._n] = self._data[name][:self._n]
+        self._data = data
+
+    def _check_dataset(self, X):
+        X = to_time_series_dataset(X)
+        if self.sz_ is not None and X.shape[2] != self.d_:
+            raise ValueError("Time series of dimension %d cannot be used with an index of dimension %d"
+                             % (X.shape[2], self.d_))
+        sizes = _ts_sizes(X)
+        if self.metric != "dtw" and self.sz_ is not None and numpy.any(sizes != self.sz_):
+            raise ValueError("Metric %s requires time series of size %d" % (self.metric, self.sz_))
+        return X, sizes
+
+    def add(self, X, ids=None):
+        """Add time series to the index.
+
+        Parameters
+        ----------
+        X : array-like, shape (n_ts, sz, d)
+            Time series to be indexed. Their size should not exceed that of previously indexed time series.
+        ids : array-like of int, shape (n_ts, ) or None (default: None)
+            Identifiers of the new time series. If None, identifiers larger than all previous ones are generated.
+
+        Returns
+        -------
+        numpy.ndarray of shape (n_ts, )
+            Identifiers of the new time series.
+        """
+        X, sizes = self._check_dataset(X)
+        if self.sz_ is None:
+            self.sz_, self.d_ = X.shape[1], X.shape[2]
+            if self.metric != "dtw" and numpy.any(sizes != self.sz_):
+                raise ValueError("Metric %s requires time series of size %d" % (self.metric, self.sz_))
+        if X.shape[1] > self.sz_:
+            if sizes.max() > self.sz_:
+                raise ValueError("Time series of size %d cannot be added to an index of size %d"
+                                 % (sizes.max(), self.sz_))
+            X = X[:, :self.sz_]
+        elif X.shape[1] < self.sz_:
+            X = numpy.concatenate((X, numpy.full((X.shape[0], self.sz_ - X.shape[1], self.d_), numpy.nan)), axis=1)
+        n_new = X.shape[0]
+        if ids is None:
+            ids = numpy.arange(self._next_id, self._next_id + n_new)
+        else:
+            ids = numpy.asarray(ids, dtype=numpy.int).reshape((-1, ))
+            if ids.shape[0] != n_new or numpy.unique(ids).shape[0] != n_new or \
+                    numpy.any(numpy.in1d(ids, self.ids_)):
+                raise ValueError("Identifiers should be unique and not already used in the index")
+        if n_new == 0:
+            return ids
+        envelopes_down, envelopes_up, paa = self._summaries(X, sizes)
+
+        self._reserve(n_new)
+        new_rows = slice(self._n, self._n + n_new)
+        self._data["series"][new_rows] = X
+        self._data["sizes"][new_rows] = sizes
+        self._data["envelopes_down"][new_rows] = envelopes_down
+        self._data["envelopes_up"][new_rows] = envelopes_up
+        self._data["paa"][new_rows] = paa
+        self._data["ids"][new_rows] = ids
+        self._n += n_new
+        self._next_id = max(self._next_id, int(ids.max()) + 1)
+        return ids
+
+    def remove(self, ids):
+        """Remove time series from the index.
+
+        Parameters
+        ----------
+        ids : array-like of int
+            Identifiers of the time series to be removed.
+        """
+        ids = numpy.asarray(ids, dtype=numpy.int).reshape((-1, ))
+        if not numpy.all(numpy.in1d(ids, self.ids_)):
+            raise ValueError("Unknown time series identifiers: %s" % ids[~numpy.in1d(ids, self.ids_)])
+        if ids.shape[0] == 0:
+            return
+        keep = ~numpy.in1d(self.ids_, ids)
+        self._reserve(0)
+        n_kept = numpy.count_nonzero(keep)
+        for name in self._array_names:
+            self._data[name][:n_kept] = self._data[name][:self._n][keep]
+        self._n = n_kept
+
+    def _lower_bounds(self, ts, sz):
+        """Lower bounds of the distances between a query time series of size `sz` and all indexed time series."""
+        n = self._n
+        series, sizes = self._data["series"][:n], self._data["sizes"][:n]
+        if self.metric == "dtw":
+            # (0, 0) and (sz - 1, sz_candidate - 1) belong to any DTW path, and are distinct cells unless both sizes
+            # are 1
+            sq_lbs = numpy.sum((series[:, 0] - ts[0]) ** 2, axis=1)
+            sq_lbs += numpy.where(numpy.logical_and(sizes == 1, sz == 1), 0.,
+                                  numpy.sum((series[numpy.arange(n), sizes - 1] - ts[sz - 1]) ** 2, axis=1))
+            lbs = numpy.sqrt(sq_lbs)
+            same_size = numpy.flatnonzero(sizes == sz)
+            if sz <= self.sz_ and same_size.shape[0] > 0:
+                lbs[same_size] = numpy.maximum(
+                    lbs[same_size],
+                    _lb_keogh_broadcast(ts[numpy.newaxis, :sz], self._data["envelopes_down"][same_size, :sz],
+                                        self._data["envelopes_up"][same_size, :sz])
+                )
+        else:
+            n_segments = min(self.n_segments, self.sz_)
+            sz_segment = self.sz_ // n_segments
+            paa_ts = ts[:n_segments * sz_segment].reshape((n_segments, sz_segment, self.d_)).mean(axis=1)
+            diff = self._data["paa"][:n] - paa_ts
+            if self.metric == "cityblock":
+                lbs = sz_segment * numpy.sum(numpy.abs(diff), axis=(1, 2))
+            else:
+                lbs = sz_segment * numpy.sum(diff ** 2, axis=(1, 2))
+                if self.metric == "euclidean":
+                    lbs = numpy.sqrt(lbs)
+        # Slightly shrink lower bounds to be robust to rounding errors
+        return lbs * (1. - 1e-9)
+
+    def _dists(self, ts, rows):
+        """Distances between a query time series (of the index size) and some indexed time series."""
+        return scipy_cdist(ts.reshape((1, -1)), self._data["series"][rows].reshape((rows.shape[0], -1)),
+                           metric=self.metric)[0]
+
+    def _dtw_dist_fun(self, ts, sz):
+        global_constraint, sakoe_chiba_radius = self._dtw_constraint()
+        series, sizes = self._data["series"], self._data["sizes"]
+        masks = {}
+
+        def dist_fun(j, max_dist):
+            sz_j = sizes[j]
+            if sz_j not in masks:
+                masks[sz_j] = _dtw_mask(sz, sz_j, global_constraint, sakoe_chiba_radius)
+            return dtw_early_abandon(ts[:sz], series[j, :sz_j], masks[sz_j], max_dist)
+        return dist_fun
+
+    def kneighbors(self, X, n_neighbors=5, return_distance=True):
+        """Finds the K-neighbors of query time series.
+
+        Parameters
+        ----------
+        X : array-like, shape (n_ts, sz, d)
+            The query time series.
+        n_neighbors : int (default: 5)
+            Number of neighbors to get.
+        return_distance : boolean, optional. Defaults to True.
+            If False, distances will not be returned
+
+        Returns
+        -------
+        dist : array
+            Array representing the distance to points, only present if
+            return_distance=True
+        ind : array
+            Identifiers of the nearest time series in the index.
+        """
+        if self._n == 0:
+            raise ValueError("Cannot search for neighbors in an empty index")
+        X, sizes = self._check_dataset(X)
+        n_neighbors = min(n_neighbors, self._n)
+        dist = numpy.empty((X.shape[0], n_neighbors))
+        ind = numpy.empty((X.shape[0], n_neighbors), dtype=numpy.int)
+        for i in range(X.shape[0]):
+            lbs = self._lower_bounds(X[i], sizes[i])
+            if self.metric == "dtw":
+                dist[i], ind[i] = _k_best_pruned(lbs, self._dtw_dist_fun(X[i], sizes[i]), n_neighbors)
+            else:
+                # Exact distances to the candidates of smallest lower bounds give an upper bound for the k-th
+                # distance, then all candidates whose lower bound does not exceed it are considered
+                rows = numpy.argsort(lbs, kind="mergesort")[:n_neighbors]
+                max_dist = self._dists(X[i], rows).max() * (1. + 1e-9)
+                rows = numpy.flatnonzero(lbs <= max_dist)
+                block_dist, block_ind = _k_smallest(self._dists(X[i], rows).reshape((1, -1)), n_neighbors)
+                dist[i], ind[i] = block_dist[0], rows[block_ind[0]]
+        ind = self.ids_[ind]
+        if return_distance:
+            return dist, ind
+        else:
+            return ind
+
+    def radius_neighbors(self, X, radius, return_distance=True):
+        """Finds the indexed time series within a given radius of query time series.
+
+        Parameters
+        ----------
+        X : array-like, shape (n_ts, sz, d)
+            The query time series.
+        radius : float
+            Limiting distance of neighbors to return.
+        return_distance : boolean, optional. Defaults to True.
+            If False, distances will not be returned
+
+        Returns
+        -------
+        dist : array of arrays
+            Distances to the neighbors of each query, sorted by increasing distance, only present if
+            return_distance=True
+        ind : array of arrays
+            Identifiers of the neighbors of each query in the index.
+        """
+        X, sizes = self._check_dataset(X)
+        dist = numpy.empty((X.shape[0], ), dtype=object)
+        ind = numpy.empty((X.shape[0], ), dtype=object)
+        for i in range(X.shape[0]):
+            if self._n == 0:
+                rows, dists = numpy.empty((0, ), dtype=numpy.int), numpy.empty((0, ))
+            else:
+                rows = numpy.flatnonzero(self._lower_bounds(X[i], sizes[i]) <= radius)
+            if self._n == 0 or rows.shape[0] == 0:
+                dists = numpy.empty((0, ))
+            elif self.metric == "dtw":
+                dist_fun = self._dtw_dist_fun(X[i], sizes[i])
+                dists = numpy.array([dist_fun(j, radius * (1. + 1e-9)) for j in rows])
+            else:
+                dists = self._dists(X[i], rows)
+            within = dists <= radius
+            rows, dists = rows[within], dists[within]
+            order = numpy.argsort(dists, kind="mergesort")
+            dist[i], ind[i] = dists[order], self.ids_[rows[order]]
+        if return_distance:
+            return dist, ind
+        else:
+            return ind
+
+    def save(self, path):
+        """Save the index to a directory.
+
+        Each stored array is written to a temporary file that then replaces the previous version, hence an index can
+        safely be saved to the directory it has been loaded from, even if this directory is still memory-mapped.
+
+        Parameters
+        ----------
+        path : str
+            Path to the directory (created if needed).
+        """
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        replace = getattr(os, "replace", os.rename)
+        if self._data is not None:
+            for name in self._array_names:
+                fname = os.path.join(path, name + ".npy")
+                with open(fname + ".tmp", "wb") as f:
+                    numpy.save(f, self._data[name][:self._n])
+                replace(fname + ".tmp", fname)
+        params = {"metric": self.metric, "metric_params": self.metric_params, "n_segments": self.n_segments,
+                  "sz": self.sz_, "d": self.d_, "n_ts": self._n, "next_id": self._next_id}
+        with open(os.path.join(path, "params.json.tmp"), "w") as f:
+            json.dump(params, f)
+        replace(os.path.join(path, "params.json.tmp"), os.path.join(path, "params.json"))
+
+    @classmethod
+    def load(cls, path, mmap_mode="r"):
+        """Load an index saved with `save`.
+
+        Parameters
+        ----------
+        path : str
+            Path to the directory the index has been saved to.
+        mmap_mode : {'r', None} (default: 'r')
+            If 'r', stored arrays are memory-mapped in read-only mode, otherwise they are loaded in memory.
+
+        Returns
+        -------
+        TimeSeriesIndex
+            The loaded index.
+        """
+        with open(os.path.join(path, "params.json"), "r") as f:
+            params = json.load(f)
+        index = cls(metric=params["metric"], metric_params=params["metric_params"], n_segments=params["n_segments"])
+        index.sz_, index.d_ = params["sz"], params["d"]
+        index._n, index._next_id = params["n_ts"], params["next_id"]
+        if index._n > 0:
+            index._data = {}
+            for name in cls._array_names:
+                index._data[name] = numpy.load(os.path.join(path, name + ".npy"), mmap_mode=mmap_mode)
+        return index
+
+
+class _ISAXNode(object):
+    """Node of an iSAX tree: SAX word (symbols and their number of bits per segment), bounds of the PAA region covered
+    by this word, and either children (indexed by their SAX word) or rows of the indexed time series (leaves)."""
+    def __init__(self, symbols, bits, lower, upper):
+        self.symbols = symbols
+        self.bits = bits
+        self.lower = lower
+        self.upper = upper
+        self.child_bits = None
+        self.children = None
+        self.rows = []
+        self.children_bounds = None
+
+
+class ISAXIndex(object):
+    """iSAX tree index for nearest neighbors searches on time series.
+
+    iSAX was originally presented in [1]_. Time series are summarized by their PAA and SAX representations (see
+    :class:`tslearn.piecewise.SymbolicAggregateApproximation`) with an alphabet of `2 ** max_bits` symbols. Each node
+    of the tree is a SAX word in which each segment uses its own number of bits (hence its own cardinality, lower
+    cardinalities being obtained by dropping least significant bits). Children of the root use one bit per segment and
+    leaves holding more than `leaf_size` time series are split by adding a bit to the segment that best balances the
+    split, as in iSAX 2.0 [2]_.
+
+    Approximate searches visit the leaf whose word best matches the query (and following leaves in best-first order if
+    fewer than `n_neighbors` time series have been met). Exact searches visit nodes in best-first order of their
+    MINDIST lower bound and stop as soon as it exceeds the current k-th best distance. For DTW, MINDIST is computed
+    from the PAA of the envelope of the query (see :func:`tslearn.metrics.lb_envelope`), as in [3]_.
+
+    Parameters
+    ----------
+    n_segments : int (default: 8)
+        Number of PAA segments (per dimension) of SAX words.
+    max_bits : int (default: 8)
+        Maximum number of bits per symbol, that is base-2 logarithm of the maximum SAX cardinality.
+    leaf_size : int (default: 100)
+        Maximum number of time series in a leaf (leaves using `max_bits` bits for all segments are never split).
+    metric : {'euclidean', 'dtw'} (default: 'euclidean')
+        Metric to be used for neighbors searches.
+    metric_params : dict or None (default: None)
+        Dictionnary of metric parameters (see :class:`.KNeighborsTimeSeries`).
+
+    Attributes
+    ----------
+    ids_ : numpy.ndarray of shape (n_ts, )
+        Identifiers of the indexed time series.
+
+    Note
+    ----
+        This method requires a dataset of equal-sized time series. As for SAX, breakpoints assume z-normalized time
+        series (see :class:`tslearn.preprocessing.TimeSeriesScalerMeanVariance`): other time series can be indexed but
+        trees are then less balanced.
+        A saved index stores time series ordered by leaf, so that, once loaded with memory-mapping, each leaf is read
+        from a contiguous region of the disk.
+
+    Examples
+    --------
+    >>> from tslearn.generators import random_walks
+    >>> from tslearn.preprocessing import TimeSeriesScalerMeanVariance
+    >>> X = TimeSeriesScalerMeanVariance().fit_transform(random_walks(n_ts=250, sz=32, random_state=0))
+    >>> index = ISAXIndex(n_segments=4, leaf_size=10)
+    >>> index.add(X[:200])[-3:]
+    array([197, 198, 199])
+    >>> dist, ind = index.kneighbors(X[200:], n_neighbors=3)
+    >>> numpy.allclose(dist, numpy.sort(scipy_cdist(X[200:, :, 0], X[:200, :, 0]), axis=1)[:, :3])
+    True
+    >>> dist_approx, ind_approx = index.kneighbors(X[200:], n_neighbors=3, exact=False)
+    >>> bool(numpy.all(dist_approx >= dist - 1e-9))
+    True
+    >>> dtw_index = ISAXIndex(n_segments=4, leaf_size=10, metric="dtw")
+    >>> _ = dtw_index.add(X[:200])
+    >>> dist, ind = dtw_index.kneighbors(X[200:], n_neighbors=3)
+    >>> numpy.allclose(dist, numpy.sort(cdist_dtw(X[200:], X[:200]), axis=1)[:, :3])
+    True
+    >>> import tempfile
+    >>> path = tempfile.mkdtemp()
+    >>> dtw_index.save(path)
+    >>> loaded_index = ISAXIndex.load(path)
+    >>> numpy.alltrue(loaded_index.kneighbors(X[200:], n_neighbors=3, return_distance=False) == ind)
+    True
+
+    References
+    ----------
+    .. [1] J. Shieh & E. Keogh. iSAX: Indexing and Mining Terabyte Sized Time Series. SIGKDD 2008, pp. 623--631.
+    .. [2] A. Camerra, T. Palpanas, J. Shieh & E. Keogh. iSAX 2.0: Indexing and Mining One Billion Time Series.
+       ICDM 2010, pp. 58--67.
+    .. [3] Keogh, E. Exact indexing of dynamic time warping. In International Conference on Very Large Data Bases, 2002.
+       pp 406-417.
+    """
+    _array_names = ["series", "symbols", "ids", "node_symbols", "node_bits", "node_child_bits", "node_parents",
+                    "leaf_starts", "leaf_ends"]
+
+    def __init__(self, n_segments=8, max_bits=8, leaf_size=100, metric="euclidean", metric_params=None):
+        if metric not in ["euclidean", "dtw"]:
+            raise ValueError("Unrecognized time series metric string: %s "
+                             "(should be one of 'dtw' or 'euclidean')" % metric)
+        self.n_segments = n_segments
+        self.max_bits = max_bits
+        self.leaf_size = leaf_size
+        self.metric = metric
+        self.metric_params = metric_params
+        self.sz_ = None
+        self.d_ = None
+        self._series = None
+        self._symbols = None
+        self._ids = None
+        self._n = 0
+        self._next_id = 0
+        # Breakpoints for cardinality 2 ** b are a subset of those for cardinality 2 ** max_bits
+        breakpoints = _breakpoints(2 ** max_bits)
+        self._breakpoints = [numpy.empty((0, ))] + [breakpoints[2 ** (max_bits - b) - 1::2 ** (max_bits - b)]
+                                                     for b in range(1, max_bits + 1)]
+        self._root = None
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def ids_(self):
+        if self._ids is None:
+            return numpy.empty((0, ), dtype=numpy.int)
+        return self._ids[:self._n]
+
+    def _dtw_constraint(self):
+        return KNeighborsTimeSeriesMixin._dtw_constraint(self)
+
+    def _paa(self, X):
+        n_segments = min(self.n_segments, X.shape[1])
+        sz_segment = X.shape[1] // n_segments
+        paa = X[:, :n_segments * sz_segment].reshape((X.shape[0], n_segments, sz_segment, X.shape[2])).mean(axis=2)
+        return paa.reshape((X.shape[0], -1))
+
+    def _new_node(self, symbols, bits):
+        lower = numpy.full(symbols.shape, -numpy.inf)
+        upper = numpy.full(symbols.shape, numpy.inf)
+        for i, (symbol, n_bits) in enumerate(zip(symbols, bits)):
+            if n_bits > 0:
+                if symbol > 0:
+                    lower[i] = self._breakpoints[n_bits][symbol - 1]
+                if symbol < 2 ** n_bits - 1:
+                    upper[i] = self._breakpoints[n_bits][symbol]
+        return _ISAXNode(symbols, bits, lower, upper)
+
+    def _set_children(self, node, child_bits):
+        node.child_bits = child_bits
+        node.children = {}
+        node.children_bounds = None
+
+    def _child(self, node, row):
+        symbols = self._symbols[row] >> (self.max_bits - node.child_bits)
+        key = tuple(symbols)
+        if key not in node.children:
+            node.children[key] = self._new_node(symbols, node.child_bits)
+            node.children_bounds = None
+        return node.children[key]
+
+    def _insert(self, row):
+        node = self._root
+        while node.children is not None:
+            node = self._child(node, row)
+        node.rows.append(row)
+        if len(node.rows) > self.leaf_size:
+            self._split(node)
+
+    def _split(self, node):
+        """Split an overflowing leaf by adding a bit to the segment whose next bit best balances its time series."""
+        candidates = numpy.flatnonzero(node.bits < self.max_bits)
+        if candidates.shape[0] == 0:
+            return
+        rows = numpy.array(node.rows)
+        next_bits = (self._symbols[rows][:, candidates] >> (self.max_bits - node.bits[candidates] - 1)) & 1
+        segment = candidates[numpy.argmin(numpy.abs(next_bits.mean(axis=0) - .5))]
+        child_bits = node.bits.copy()
+        child_bits[segment] += 1
+        self._set_children(node, child_bits)
+        for row in node.rows:
+            self._child(node, row).rows.append(row)
+        node.rows = None
+        for child in list(node.children.values()):
+            if len(child.rows) > self.leaf_size:
+                self._split(child)
+
+    def _reserve(self, n_new):
+        if self._series is not None and self._n + n_new <= self._series.shape[0] and self._series.flags.writeable:
+            return
+        capacity = max(2 * self._n, self._n + n_new, 16)
+        series = numpy.empty((capacity, self.sz_, self.d_))
+        symbols = numpy.empty((capacity, self._root.symbols.shape[0]), dtype=numpy.int)
+        ids = numpy.empty((capacity, ), dtype=numpy.int)
+        if self._series is not None:
+            series[:self._n] = self._series[:self._n]
+            symbols[:self._n] = self._symbols[:self._n]
+            ids[:self._n] = self._ids[:self._n]
+        self._series, self._symbols, self._ids = series, symbols, ids
+
+    def add(self, X):
+        """Add time series to the index.
+
+        Parameters
+        ----------
+        X : array-like, shape (n_ts, sz, d)
+            Time series to be indexed.
+
+        Returns
+        -------
+        numpy.ndarray of shape (n_ts, )
+            Identifiers of the new time series.
+        """
+        X = to_time_series_dataset(X)
+        if not check_equal_size(X) or (self.sz_ is not None and X.shape[1:] != (self.sz_, self.d_)):
+            raise ValueError("ISAXIndex requires a dataset of equal-sized time series")
+        if self._root is None:
+            self.sz_, self.d_ = X.shape[1], X.shape[2]
+            word_size = min(self.n_segments, self.sz_) * self.d_
+            self._root = self._new_node(numpy.zeros((word_size, ), dtype=numpy.int),
+                                        numpy.zeros((word_size, ), dtype=numpy.int))
+            self._set_children(self._root, numpy.ones((word_size, ), dtype=numpy.int))
+            self._root.rows = None
+        n_new = X.shape[0]
+        self._reserve(n_new)
+        rows = numpy.arange(self._n, self._n + n_new)
+        self._series[rows] = X
+        self._symbols[rows] = numpy.searchsorted(self._breakpoints[self.max_bits], self._paa(X), side="right")
+        self._ids[rows] = numpy.arange(self._next_id, self._next_id + n_new)
+        self._n += n_new
+        self._next_id += n_new
+        for row in rows:
+            self._insert(row)
+        return self._ids[rows]
+
+    def _query_bounds(self, ts):
+        """PAA of the lower and upper envelopes of a query (the query itself for the Euclidean distance)."""
+        if self.metric == "dtw":
+            global_constraint, sakoe_chiba_radius = self._dtw_constraint()
+            radius = sakoe_chiba_radius if global_constraint == "sakoe_chiba" else self.sz_
+            envelope_down, envelope_up = _lb_envelope_dataset(ts[numpy.newaxis], radius=radius)
+            return self._paa(envelope_down)[0], self._paa(envelope_up)[0]
+        paa = self._paa(ts[numpy.newaxis])[0]
+        return paa, paa
+
+    def _sorted_children(self, node, paa_down, paa_up):
+        """Children of a node sorted by increasing MINDIST to a query, together with these MINDIST values."""
+        if node.children_bounds is None:
+            children = list(node.children.values())
+            node.children_bounds = (children, numpy.array([child.lower for child in children]),
+                                    numpy.array([child.upper for child in children]))
+        children, lower, upper = node.children_bounds
+        sz_segment = self.sz_ // min(self.n_segments, self.sz_)
+        gaps = numpy.maximum(numpy.maximum(lower - paa_up, paa_down - upper), 0.)
+        # Slightly shrink lower bounds to be robust to rounding errors
+        mindists = numpy.sqrt(sz_segment * numpy.sum(gaps ** 2, axis=1)) * (1. - 1e-9)
+        order = numpy.argsort(mindists, kind="mergesort")
+        return [children[i] for i in order], mindists[order]
+
+    def _search(self, ts, n_neighbors, exact):
+        paa_down, paa_up = self._query_bounds(ts)
+        if self.metric == "dtw":
+            mask = _dtw_mask(self.sz_, self.sz_, *self._dtw_constraint())
+        best_dists, best_ids = numpy.empty((0, )), numpy.empty((0, ), dtype=numpy.int)
+        kth_dist = numpy.inf
+        # Children of a node are pushed lazily: each queue entry is the next child to visit among the children of a
+        # node, sorted by MINDIST, and pushes its next sibling once popped
+        children, mindists = self._sorted_children(self._root, paa_down, paa_up)
+        queue = [(mindists[0], 0, children, mindists, 0)]
+        n_pushed = 1
+        while len(queue) > 0:
+            mindist, _, children, mindists, pos = heapq.heappop(queue)
+            if mindist > kth_dist or (not exact and best_ids.shape[0] == n_neighbors):
+                break
+            if pos + 1 < len(children):
+                heapq.heappush(queue, (mindists[pos + 1], n_pushed, children, mindists, pos + 1))
+                n_pushed += 1
+            node = children[pos]
+            if node.children is not None:
+                node_children, node_mindists = self._sorted_children(node, paa_down, paa_up)
+                heapq.heappush(queue, (node_mindists[0], n_pushed, node_children, node_mindists, 0))
+                n_pushed += 1
+                continue
+            rows = numpy.asarray(node.rows, dtype=numpy.int)
+            if self.metric == "dtw":
+                # Abandon slightly above the k-th distance so that ties are kept and broken by identifier
+                dists = numpy.array([dtw_early_abandon(ts, self._series[row], mask, kth_dist * (1. + 1e-9))
+                                     for row in rows])
+            else:
+                dists = numpy.sqrt(numpy.sum((self._series[rows] - ts) ** 2, axis=(1, 2)))
+            # Current best neighbors are merged with those of the leaf, ties being broken by identifier
+            best_dists = numpy.concatenate((best_dists, dists))
+            best_ids = numpy.concatenate((best_ids, self._ids[rows]))
+            order = numpy.lexsort((best_ids, best_dists))[:n_neighbors]
+            best_dists, best_ids = best_dists[order], best_ids[order]
+            if best_ids.shape[0] == n_neighbors:
+                kth_dist = best_dists[-1]
+        return best_dists, best_ids
+
+    def kneighbors(self, X, n_neighbors=5, return_distance=True, exact=True):
+        """Finds the K-neighbors of query time series.
+
+        Parameters
+        ----------
+        X : array-like, shape (n_ts, sz, d)
+            The query time series.
+        n_neighbors : int (default: 5)
+            Number of neighbors to get.
+        return_distance : boolean, optional. Defaults to True.
+            If False, distances will not be returned
+        exact : boolean (default: True)
+            Whether neighbors should be exact or approximated from the best matching leaf.
+
+        Returns
+        -------
+        dist : array
+            Array representing the distance to points, only present if
+            return_distance=True
+        ind : array
+            Identifiers of the nearest time series in the index.
+        """
+        if self._n == 0:
+            raise ValueError("Cannot search for neighbors in an empty index")
+        X = to_time_series_dataset(X)
+        if X.shape[1:] != (self.sz_, self.d_) or not check_equal_size(X):
+            raise ValueError("Query time series should have the same size as indexed ones")
+        n_neighbors = min(n_neighbors, self._n)
+        dist = numpy.empty((X.shape[0], n_neighbors))
+        ind = numpy.empty((X.shape[0], n_neighbors), dtype=numpy.int)
+        for i in range(X.shape[0]):
+            dist[i], ind[i] = self._search(X[i], n_neighbors, exact)
+        if return_distance:
+            return dist, ind
+        else:
+            return ind
+
+    def _nodes(self):
+        """Nodes of the tree in depth-first order, together with the position of their parent in this order."""
+        nodes, parents = [], []
+        stack = [(self._root, -1)]
+        while len(stack) > 0:
+            node, parent = stack.pop()
+            nodes.append(node)
+            parents.append(parent)
+            if node.children is not None:
+                for key in sorted(node.children.keys(), reverse=True):
+                    stack.append((node.children[key], len(nodes) - 1))
+        return nodes, parents
+
+    def save(self, path):
+        """Save the index to a directory.
+
+        Parameters
+        ----------
+        path : str
+            Path to the directory (created if needed).
+        """
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        replace = getattr(os, "replace", os.rename)
+        if self._root is not None:
+            nodes, parents = self._nodes()
+            word_size = self._root.symbols.shape[0]
+            leaves = [node for node in nodes if node.children is None]
+            order = numpy.array([row for leaf in leaves for row in leaf.rows], dtype=numpy.int)
+            leaf_sizes = [len(node.rows) if node.children is None else 0 for node in nodes]
+            leaf_ends = numpy.cumsum(leaf_sizes)
+            arrays = {"series": self._series[order],
+                      "symbols": self._symbols[order],
+                      "ids": self._ids[order],
+                      "node_symbols": numpy.array([node.symbols for node in nodes]),
+                      "node_bits": numpy.array([node.bits for node in nodes]),
+                      "node_child_bits": numpy.array([node.child_bits if node.children is not None
+                                                      else numpy.full((word_size, ), -1, dtype=numpy.int)
+                                                      for node in nodes]),
+                      "node_parents": numpy.array(parents),
+                      "leaf_starts": leaf_ends - leaf_sizes,
+                      "leaf_ends": leaf_ends}
+            for name in self._array_names:
+                fname = os.path.join(path, name + ".npy")
+                with open(fname + ".tmp", "wb") as f:
+                    numpy.save(f, arrays[name])
+                replace(fname + ".tmp", fname)
+        params = {"n_segments": self.n_segments, "max_bits": self.max_bits, "leaf_size": self.leaf_size,
+                  "metric": self.metric, "metric_params": self.metric_params, "sz": self.sz_, "d": self.d_,
+                  "n_ts": self._n, "next_id": self._next_id}
+        with open(os.path.join(path, "params.json.tmp"), "w") as f:
+            json.dump(params, f)
+        replace(os.path.join(path, "params.json.tmp"), os.path.join(path, "params.json"))
+
+    @classmethod
+    def load(cls, path, mmap_mode="r"):
+        """Load an index saved with `save`.
+
+        Parameters
+        ----------
+        path : str
+            Path to the directory the index has been saved to.
+        mmap_mode : {'r', None} (default: 'r')
+            If 'r', indexed time series are memory-mapped in read-only mode, otherwise they are loaded in memory.
+            Adding time series to a memory-mapped index loads them in memory.
+
+        Returns
+        -------
+        ISAXIndex
+            The loaded index.
+        """
+        with open(os.path.join(path, "params.json"), "r") as f:
+            params = json.load(f)
+        index = cls(n_segments=params["n_segments"], max_bits=params["max_bits"], leaf_size=params["leaf_size"],
+                    metric=params["metric"], metric_params=params["metric_params"])
+        index.sz_, index.d_ = params["sz"], params["d"]
+        index._n, index._next_id = params["n_ts"], params["next_id"]
+        if index.sz_ is None:
+            return index
+        arrays = {}
+        for name in cls._array_names:
+            arrays[name] = numpy.load(os.path.join(path, name + ".npy"),
+                                      mmap_mode=mmap_mode if name == "series" and index._n > 0 else None)
+        index._series, index._symbols, index._ids = arrays["series"], arrays["symbols"], arrays["ids"]
+        nodes = []
+        for i in range(arrays["node_parents"].shape[0]):
+            node = index._new_node(arrays["node_symbols"][i], arrays["node_bits"][i])
+            if arrays["node_child_bits"][i, 0] >= 0:
+                index._set_children(node, arrays["node_child_bits"][i])
+                node.rows = None
+            else:
+                node.rows = list(range(arrays["leaf_starts"][i], arrays["leaf_ends"][i]))
+            if arrays["node_parents"][i] >= 0:
+                nodes[arrays["node_parents"][i]].children[tuple(node.symbols)] = node
+            nodes.append(node)
+        index._root = nodes[0]
+        return index
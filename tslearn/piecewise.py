@@ -3,11 +3,13 @@ The :mod:`tslearn.piecewise` module gathers time series piecewise approximation
 """
 
 import numpy
+from scipy.spatial.distance import cdist
 from scipy.stats import norm
 from sklearn.base import TransformerMixin
+from sklearn.externals.joblib import Parallel, delayed, effective_n_jobs
 
-from tslearn.utils import to_time_series_dataset
-from tslearn.cysax import cydist_sax, cyslopes, cydist_1d_sax, inv_transform_1d_sax, inv_transform_sax, inv_transform_paa
+from tslearn.utils import to_time_series, to_time_series_dataset, bit_length
+from tslearn.cysax import cdist_table_sum
 
 
 __author__ = 'Romain Tavenard romain.tavenard[at]univ-rennes2.fr'
@@ -21,13 +23,76 @@ def _paa_to_symbols(X_paa, breakpoints):
     >>> _paa_to_symbols(X_paa=numpy.array([-1., 0.1, 2.]), breakpoints=numpy.array([0.]))
     array([0, 1, 1])
     """
-    alphabet_size = breakpoints.shape[0] + 1
-    X_symbols = numpy.zeros(X_paa.shape, dtype=numpy.int) - 1
-    for idx_bp, bp in enumerate(breakpoints):
-        indices = numpy.logical_and(X_symbols < 0, X_paa < bp)
-        X_symbols[indices] = idx_bp
-    X_symbols[X_symbols < 0] = alphabet_size - 1
-    return X_symbols
+    return numpy.searchsorted(breakpoints, X_paa, side="right").astype(numpy.int)
+
+
+def _segment_weights(sz, n_segments):
+    """Weight of each time index in each of `n_segments` equal-length segments covering `sz` time indices.
+
+    When `sz` is not a multiple of `n_segments`, time indices that straddle two segments are shared between them
+    according to the overlap. Each row hence sums to `sz / n_segments` and each column sums to 1.
+
+    Example
+    -------
+    >>> _segment_weights(sz=5, n_segments=2)
+    array([[ 1. ,  1. ,  0.5,  0. ,  0. ],
+           [ 0. ,  0. ,  0.5,  1. ,  1. ]])
+    """
+    bounds = numpy.arange(n_segments + 1) * float(sz) / n_segments
+    t = numpy.arange(sz).reshape((1, -1))
+    starts = numpy.maximum(bounds[:-1].reshape((-1, 1)), t)
+    ends = numpy.minimum(bounds[1:].reshape((-1, 1)), t + 1)
+    return numpy.maximum(ends - starts, 0.)
+
+
+def _segment_time_offsets(weights):
+    """Offsets of time indices with respect to the (weighted) middle of each segment.
+
+    Example
+    -------
+    >>> _segment_time_offsets(_segment_weights(sz=4, n_segments=2))
+    array([[-0.5,  0.5,  1.5,  2.5],
+           [-2.5, -1.5, -0.5,  0.5]])
+    """
+    t = numpy.arange(weights.shape[1])
+    t_middle = weights.dot(t) / weights.sum(axis=1)
+    return t.reshape((1, -1)) - t_middle.reshape((-1, 1))
+
+
+def _inv_transform_paa(X_paa, original_size):
+    """Compute time series corresponding to given PAA representations.
+
+    Example
+    -------
+    >>> _inv_transform_paa(numpy.array([[[0.], [1.]]]), original_size=3)[0, :, 0]
+    array([ 0. ,  0.5,  1. ])
+    """
+    n_segments = X_paa.shape[1]
+    if original_size % n_segments == 0:
+        return numpy.repeat(X_paa, original_size // n_segments, axis=1)
+    return numpy.einsum("st,nsd->ntd", _segment_weights(original_size, n_segments), X_paa)
+
+
+def _inv_transform_1d_sax(X_sax, breakpoints_avg_middle, breakpoints_slope_middle, original_size):
+    """Compute time series corresponding to given 1d-SAX representations.
+
+    Example
+    -------
+    >>> _inv_transform_1d_sax(numpy.array([[[0, 1], [1, 0]]]), breakpoints_avg_middle=numpy.array([-1., 1.]),
+    ...                       breakpoints_slope_middle=numpy.array([0., 1.]), original_size=4)[0, :, 0]
+    array([-1.5, -0.5,  1. ,  1. ])
+    """
+    n_ts, n_segments, d = X_sax.shape
+    d //= 2
+    avg = breakpoints_avg_middle[X_sax[:, :, :d]]
+    slope = breakpoints_slope_middle[X_sax[:, :, d:]]
+    weights = _segment_weights(original_size, n_segments)
+    weighted_offsets = weights * _segment_time_offsets(weights)
+    if original_size % n_segments == 0:
+        # Each time index belongs to a single segment
+        offsets = weighted_offsets.sum(axis=0).reshape((1, -1, 1))
+        return _inv_transform_paa(avg, original_size) + _inv_transform_paa(slope, original_size) * offsets
+    return numpy.einsum("st,nsd->ntd", weights, avg) + numpy.einsum("st,nsd->ntd", weighted_offsets, slope)
 
 
 def _breakpoints(n_bins, scale=1.):
@@ -52,6 +117,232 @@ def _bin_medians(n_bins, scale=1.):
     return norm.ppf([float(a) / (2 * n_bins) for a in range(1, 2 * n_bins, 2)], scale=scale)
 
 
+def _check_symbols(X_sax, alphabet_size):
+    """Raise a ValueError if some symbols in X_sax do not belong to an alphabet of the given size.
+
+    Example
+    -------
+    >>> _check_symbols(numpy.array([[[0], [3]]]), alphabet_size=4)
+    >>> _check_symbols(numpy.array([[[0], [4]]]), alphabet_size=4)  # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    ValueError: SAX symbols should be integers in [0, 4), got values in [0, 4]
+    """
+    if X_sax.size > 0 and (X_sax.min() < 0 or X_sax.max() >= alphabet_size):
+        raise ValueError("SAX symbols should be integers in [0, %d), got values in [%d, %d]" %
+                         (alphabet_size, X_sax.min(), X_sax.max()))
+
+
+def _sax_mindist_table(breakpoints):
+    """Squared MINDIST between all pairs of SAX symbols given breakpoints.
+
+    Example
+    -------
+    >>> _sax_mindist_table(breakpoints=numpy.array([-1., 0., 1.]))
+    array([[ 0.,  0.,  1.,  4.],
+           [ 0.,  0.,  0.,  1.],
+           [ 1.,  0.,  0.,  0.],
+           [ 4.,  1.,  0.,  0.]])
+    """
+    symbols = numpy.arange(breakpoints.shape[0] + 1)
+    max_symbols = numpy.maximum.outer(symbols, symbols)
+    min_symbols = numpy.minimum.outer(symbols, symbols)
+    table = numpy.zeros(max_symbols.shape)
+    far = max_symbols - min_symbols > 1
+    table[far] = (breakpoints[max_symbols[far] - 1] - breakpoints[min_symbols[far]]) ** 2
+    return table
+
+
+def cdist_paa(dataset1, dataset2=None, original_size=None):
+    """Compute PAA distances between all pairs of PAA representations from two datasets, as defined in [1]_.
+
+    Parameters
+    ----------
+    dataset1 : array-like of shape (n_ts1, n_segments, d)
+        A dataset of PAA representations.
+    dataset2 : array-like of shape (n_ts2, n_segments, d) or None (default: None)
+        Another dataset of PAA representations. If None, self-similarity of dataset1 is computed.
+    original_size : int
+        Length of the original time series. Required.
+
+    Returns
+    -------
+    numpy.ndarray of shape (n_ts1, n_ts2)
+        PAA distance matrix.
+
+    Example
+    -------
+    >>> cdist_paa([[[0.], [1.]], [[1.], [1.]]], original_size=8)
+    array([[ 0.,  2.],
+           [ 2.,  0.]])
+
+    References
+    ----------
+    .. [1] E. Keogh & M. Pazzani. Scaling up dynamic time warping for datamining applications. SIGKDD 2000,
+       pp. 285--289.
+    """
+    if original_size is None:
+        raise ValueError("cdist_paa requires `original_size`.")
+    dataset1 = to_time_series_dataset(dataset1)
+    dataset2 = dataset1 if dataset2 is None else to_time_series_dataset(dataset2)
+    n_segments = dataset1.shape[1]
+    dists = cdist(dataset1.reshape((dataset1.shape[0], -1)), dataset2.reshape((dataset2.shape[0], -1)))
+    return dists * numpy.sqrt(float(original_size) / n_segments)
+
+
+def cdist_sax(dataset1, dataset2=None, breakpoints=None, original_size=None, n_jobs=None):
+    """Compute SAX distances (MINDIST) between all pairs of SAX representations from two datasets, as defined in
+    [1]_.
+
+    Squared per-symbol distances are read from a precomputed alphabet-by-alphabet table and summed by a compiled
+    kernel that releases the GIL, so that row blocks can be processed in parallel threads.
+
+    Parameters
+    ----------
+    dataset1 : array-like of integers with shape (n_ts1, n_segments, d)
+        A dataset of SAX representations.
+    dataset2 : array-like of integers with shape (n_ts2, n_segments, d) or None (default: None)
+        Another dataset of SAX representations. If None, self-similarity of dataset1 is computed.
+    breakpoints : array-like of shape (alphabet_size - 1, )
+        Breakpoints used to generate SAX symbols. Required.
+    original_size : int
+        Length of the original time series. Required.
+    n_jobs : int or None, optional (default=None)
+        The number of jobs to run in parallel.
+        ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context.
+        ``-1`` means using all processors.
+
+    Returns
+    -------
+    numpy.ndarray of shape (n_ts1, n_ts2)
+        SAX distance matrix.
+
+    Example
+    -------
+    >>> cdist_sax([[[0], [3]], [[3], [3]]], breakpoints=[-1., 0., 1.], original_size=8)
+    array([[ 0.,  4.],
+           [ 4.,  0.]])
+    >>> X_sax = numpy.array([[[0], [3]], [[3], [3]]])
+    >>> X_sax.setflags(write=False)  # Read-only data (e.g. memory-mapped from disk) is supported
+    >>> cdist_sax(X_sax, breakpoints=[-1., 0., 1.], original_size=8)
+    array([[ 0.,  4.],
+           [ 4.,  0.]])
+    >>> cdist_sax([[[0], [7]], [[3], [3]]], breakpoints=[-1., 0., 1.], original_size=8)
+    Traceback (most recent call last):
+    ...
+    ValueError: SAX symbols should be integers in [0, 4), got values in [0, 7]
+    >>> cdist_sax([[[0], [3]], [[3], [3]]], original_size=8)
+    Traceback (most recent call last):
+    ...
+    ValueError: cdist_sax requires `breakpoints` and `original_size`.
+
+    References
+    ----------
+    .. [1] J. Lin, E. Keogh, L. Wei, et al. Experiencing SAX: a novel symbolic representation of time series.
+       Data Mining and Knowledge Discovery, 2007. vol. 15(107)
+    """
+    if breakpoints is None or original_size is None:
+        raise ValueError("cdist_sax requires `breakpoints` and `original_size`.")
+    breakpoints = numpy.asarray(breakpoints, dtype=numpy.float)
+    dataset1 = numpy.asarray(dataset1, dtype=numpy.int)
+    dataset2 = dataset1 if dataset2 is None else numpy.asarray(dataset2, dtype=numpy.int)
+    # The compiled kernel does not check bounds when reading the table
+    _check_symbols(dataset1, breakpoints.shape[0] + 1)
+    _check_symbols(dataset2, breakpoints.shape[0] + 1)
+    n_segments = dataset1.shape[1]
+    table = _sax_mindist_table(breakpoints)
+    words1 = numpy.ascontiguousarray(dataset1.reshape((dataset1.shape[0], -1)))
+    words2 = numpy.ascontiguousarray(dataset2.reshape((dataset2.shape[0], -1)))
+
+    n_blocks = min(effective_n_jobs(n_jobs), words1.shape[0])
+    if n_blocks > 1:
+        sums = numpy.vstack(Parallel(n_jobs=n_jobs, backend="threading")(
+            delayed(cdist_table_sum)(block, words2, table) for block in numpy.array_split(words1, n_blocks)
+        ))
+    else:
+        sums = cdist_table_sum(words1, words2, table)
+    return numpy.sqrt(sums * float(original_size) / n_segments)
+
+
+def cdist_1d_sax(dataset1, dataset2=None, breakpoints_avg_middle=None, breakpoints_slope_middle=None,
+                 original_size=None):
+    """Compute 1d-SAX distances between all pairs of 1d-SAX representations from two datasets, as defined in [1]_.
+
+    On each segment, the squared distance between two reconstructed linear pieces is obtained in closed form from
+    the differences of their average values and slopes, hence the whole distance matrix is computed through a few
+    matrix products. Segments are those of `OneD_SymbolicAggregateApproximation`: if `original_size` is not a
+    multiple of `n_segments`, time indices that straddle two segments contribute to the distance on both,
+    proportionally to their overlap. Otherwise, the distance is the Euclidean distance between reconstructed time
+    series.
+
+    Parameters
+    ----------
+    dataset1 : array-like of integers with shape (n_ts1, n_segments, 2 * d)
+        A dataset of 1d-SAX representations.
+    dataset2 : array-like of integers with shape (n_ts2, n_segments, 2 * d) or None (default: None)
+        Another dataset of 1d-SAX representations. If None, self-similarity of dataset1 is computed.
+    breakpoints_avg_middle : array-like of shape (alphabet_size_avg, )
+        Values associated to SAX symbols for average values. Required.
+    breakpoints_slope_middle : array-like of shape (alphabet_size_slope, )
+        Values associated to SAX symbols for slopes. Required.
+    original_size : int
+        Length of the original time series. Required.
+
+    Returns
+    -------
+    numpy.ndarray of shape (n_ts1, n_ts2)
+        1d-SAX distance matrix.
+
+    Example
+    -------
+    >>> cdist_1d_sax([[[0, 0]], [[1, 0]], [[0, 1]]], breakpoints_avg_middle=[-1., 1.],
+    ...              breakpoints_slope_middle=[0., 1.], original_size=2)
+    array([[ 0.        ,  2.82842712,  0.70710678],
+           [ 2.82842712,  0.        ,  2.91547595],
+           [ 0.70710678,  2.91547595,  0.        ]])
+    >>> cdist_1d_sax([[[0, 0], [0, 0], [0, 0]], [[0, 0], [0, 0], [1, 0]]], breakpoints_avg_middle=[-1., 1.],
+    ...              breakpoints_slope_middle=[0., 1.], original_size=10)
+    array([[ 0.        ,  3.65148372],
+           [ 3.65148372,  0.        ]])
+
+    References
+    ----------
+    .. [1] S. Malinowski, T. Guyet, R. Quiniou, R. Tavenard. 1d-SAX: a Novel Symbolic Representation for Time
+       Series. IDA 2013.
+    """
+    if breakpoints_avg_middle is None or breakpoints_slope_middle is None or original_size is None:
+        raise ValueError("cdist_1d_sax requires `breakpoints_avg_middle`, `breakpoints_slope_middle` and "
+                         "`original_size`.")
+    dataset1 = numpy.asarray(dataset1, dtype=numpy.int)
+    dataset2 = dataset1 if dataset2 is None else numpy.asarray(dataset2, dtype=numpy.int)
+    breakpoints_avg_middle = numpy.asarray(breakpoints_avg_middle, dtype=numpy.float)
+    breakpoints_slope_middle = numpy.asarray(breakpoints_slope_middle, dtype=numpy.float)
+    n_segments = dataset1.shape[1]
+    d = dataset1.shape[2] // 2
+    for dataset in [dataset1, dataset2]:
+        _check_symbols(dataset[:, :, :d], breakpoints_avg_middle.shape[0])
+        _check_symbols(dataset[:, :, d:], breakpoints_slope_middle.shape[0])
+
+    # On segment s, with weights w_t of time indices and offsets u_t from the segment middle,
+    # sum_t w_t (da + ds * u_t) ** 2 = sum_w * da ** 2 + 2 * sum_u * da * ds + sum_u2 * ds ** 2
+    weights = _segment_weights(original_size, n_segments)
+    offsets = _segment_time_offsets(weights)
+    sum_w = numpy.repeat(weights.sum(axis=1), d)
+    sum_u = numpy.repeat((weights * offsets).sum(axis=1), d)
+    sum_u2 = numpy.repeat((weights * offsets ** 2).sum(axis=1), d)
+
+    avg1 = breakpoints_avg_middle[dataset1[:, :, :d]].reshape((dataset1.shape[0], -1))
+    avg2 = breakpoints_avg_middle[dataset2[:, :, :d]].reshape((dataset2.shape[0], -1))
+    slope1 = breakpoints_slope_middle[dataset1[:, :, d:]].reshape((dataset1.shape[0], -1))
+    slope2 = breakpoints_slope_middle[dataset2[:, :, d:]].reshape((dataset2.shape[0], -1))
+
+    cross = ((avg1 * sum_u * slope1).sum(axis=1).reshape((-1, 1)) +
+             (avg2 * sum_u * slope2).sum(axis=1).reshape((1, -1)) -
+             (avg1 * sum_u).dot(slope2.T) - (slope1 * sum_u).dot(avg2.T))
+    sq_dists = (cdist(avg1 * numpy.sqrt(sum_w), avg2 * numpy.sqrt(sum_w), "sqeuclidean") + 2 * cross +
+                cdist(slope1 * numpy.sqrt(sum_u2), slope2 * numpy.sqrt(sum_u2), "sqeuclidean"))
+    return numpy.sqrt(numpy.maximum(sq_dists, 0.))
+
+
 class PiecewiseAggregateApproximation(TransformerMixin):
     """Piecewise Aggregate Approximation (PAA) transformation.
 
@@ -64,7 +355,8 @@ class PiecewiseAggregateApproximation(TransformerMixin):
 
     Note
     ----
-        This method requires a dataset of equal-sized time series.
+        This method requires a dataset of equal-sized time series. If their length is not a multiple of
+        `n_segments`, time indices that straddle two segments contribute to both, proportionally to their overlap.
 
     Example
     -------
@@ -101,6 +393,8 @@ class PiecewiseAggregateApproximation(TransformerMixin):
             [-2.  ],
             [ 0.  ],
             [ 0.  ]]])
+    >>> PiecewiseAggregateApproximation(n_segments=2).fit_transform([[1., 2., 3.]])[0, :, 0]
+    array([ 1.33333333,  2.66666667])
     >>> unfitted_paa = PiecewiseAggregateApproximation(n_segments=3)
     >>> unfitted_paa.distance(data[0], data[1])  # doctest: +IGNORE_EXCEPTION_DETAIL
     Traceback (most recent call last):
@@ -137,13 +431,10 @@ class PiecewiseAggregateApproximation(TransformerMixin):
 
     def _transform(self, X, y=None):
         n_ts, sz, d = X.shape
-        X_transformed = numpy.empty((n_ts, self.n_segments, d))
-        sz_segment = sz // self.n_segments
-        for i_seg in range(self.n_segments):
-            start = i_seg * sz_segment
-            end = start + sz_segment
-            X_transformed[:, i_seg, :] = X[:, start:end, :].mean(axis=1)
-        return X_transformed
+        if sz % self.n_segments == 0:
+            return X.reshape((n_ts, self.n_segments, sz // self.n_segments, d)).mean(axis=2)
+        weights = _segment_weights(sz, self.n_segments)
+        return numpy.einsum("st,ntd->nsd", weights, X) * (float(self.n_segments) / sz)
 
     def transform(self, X, y=None):
         """Transform a dataset of time series into its PAA representation.
@@ -200,7 +491,9 @@ class PiecewiseAggregateApproximation(TransformerMixin):
         if self.size_fitted_ < 0:
             raise ValueError("Model not fitted yet: cannot be used for distance computation.")
         else:
-            return numpy.linalg.norm(paa1 - paa2) * numpy.sqrt(self.size_fitted_ / self.n_segments)
+            return cdist_paa(numpy.asarray(paa1).reshape((1, self.n_segments, -1)),
+                             numpy.asarray(paa2).reshape((1, self.n_segments, -1)),
+                             original_size=self.size_fitted_)[0, 0]
 
     def distance(self, ts1, ts2):
         """Compute distance between PAA representations as defined in [1]_.
@@ -239,7 +532,7 @@ class PiecewiseAggregateApproximation(TransformerMixin):
             A dataset of time series corresponding to the provided representation.
         """
         X_ = to_time_series_dataset(X)
-        return inv_transform_paa(X_, original_size=self.size_fitted_)
+        return _inv_transform_paa(X_, original_size=self.size_fitted_)
 
 
 class SymbolicAggregateApproximation(PiecewiseAggregateApproximation):
@@ -388,7 +681,9 @@ class SymbolicAggregateApproximation(PiecewiseAggregateApproximation):
         if self.size_fitted_ < 0:
             raise ValueError("Model not fitted yet: cannot be used for distance computation.")
         else:
-            return cydist_sax(sax1, sax2, self.breakpoints_avg_, self.size_fitted_)
+            return cdist_sax(numpy.asarray(sax1).reshape((1, self.n_segments, -1)),
+                             numpy.asarray(sax2).reshape((1, self.n_segments, -1)),
+                             breakpoints=self.breakpoints_avg_, original_size=self.size_fitted_)[0, 0]
 
     def distance(self, ts1, ts2):
         """Compute distance between SAX representations as defined in [1]_.
@@ -427,7 +722,7 @@ class SymbolicAggregateApproximation(PiecewiseAggregateApproximation):
             A dataset of time series corresponding to the provided representation.
         """
         X_ = numpy.array(X, dtype=numpy.int)
-        return inv_transform_sax(X_, breakpoints_middle_=self.breakpoints_avg_middle_, original_size=self.size_fitted_)
+        return _inv_transform_paa(self.breakpoints_avg_middle_[X_], original_size=self.size_fitted_)
 
 
 class OneD_SymbolicAggregateApproximation(SymbolicAggregateApproximation):
@@ -558,13 +853,22 @@ class OneD_SymbolicAggregateApproximation(SymbolicAggregateApproximation):
 
     def _get_slopes(self, X):
         n_ts, sz, d = X.shape
-        X_slopes = numpy.empty((n_ts, self.n_segments, d))
-        sz_segment = sz // self.n_segments
-        for i_seg in range(self.n_segments):
-            start = i_seg * sz_segment
-            end = start + sz_segment
-            X_slopes[:, i_seg, :] = cyslopes(X[:, start:end, :], start)
-        return X_slopes
+        # Least-squares slopes: covariance between (centered) time indices and values over variance of time indices
+        if sz % self.n_segments == 0:
+            sz_segment = sz // self.n_segments
+            t_centered = numpy.arange(sz_segment) - .5 * (sz_segment - 1)
+            denom = (t_centered ** 2).sum()
+            if denom == 0.:  # Single-observation segments have a flat fit
+                return numpy.zeros((n_ts, self.n_segments, d))
+            X_segments = X.reshape((n_ts, self.n_segments, sz_segment, d))
+            return numpy.einsum("t,nstd->nsd", t_centered, X_segments) / denom
+        # Otherwise, weighted least squares with weights given by the overlap between time indices and segments
+        weights = _segment_weights(sz, self.n_segments)
+        offsets = _segment_time_offsets(weights)
+        weighted_offsets = weights * offsets
+        denom = (weighted_offsets * offsets).sum(axis=1)
+        denom[denom == 0.] = numpy.inf  # Single-observation segments have a flat fit
+        return numpy.einsum("st,ntd->nsd", weighted_offsets, X) / denom.reshape((1, -1, 1))
 
     def _transform(self, X, y=None):
         if self.size_fitted_ < 0:
@@ -627,8 +931,11 @@ class OneD_SymbolicAggregateApproximation(SymbolicAggregateApproximation):
         if self.size_fitted_ < 0:
             raise ValueError("Model not fitted yet: cannot be used for distance computation.")
         else:
-            return cydist_1d_sax(sax1, sax2, self.breakpoints_avg_middle_, self.breakpoints_slope_middle_,
-                                 self.size_fitted_)
+            return cdist_1d_sax(numpy.asarray(sax1).reshape((1, self.n_segments, -1)),
+                                numpy.asarray(sax2).reshape((1, self.n_segments, -1)),
+                                breakpoints_avg_middle=self.breakpoints_avg_middle_,
+                                breakpoints_slope_middle=self.breakpoints_slope_middle_,
+                                original_size=self.size_fitted_)[0, 0]
 
     def distance(self, ts1, ts2):
         """Compute distance between 1d-SAX representations as defined in [1]_.
@@ -667,7 +974,438 @@ class OneD_SymbolicAggregateApproximation(SymbolicAggregateApproximation):
             A dataset of time series corresponding to the provided representation.
         """
         X_ = numpy.array(X, dtype=numpy.int)
-        return inv_transform_1d_sax(X_,
-                                    breakpoints_avg_middle_=self.breakpoints_avg_middle_,
-                                    breakpoints_slope_middle_=self.breakpoints_slope_middle_,
-                                    original_size=self.size_fitted_)
+        return _inv_transform_1d_sax(X_,
+                                     breakpoints_avg_middle=self.breakpoints_avg_middle_,
+                                     breakpoints_slope_middle=self.breakpoints_slope_middle_,
+                                     original_size=self.size_fitted_)
+
+
+def _symbol_dtype(alphabet_size):
+    """Smallest unsigned integer type able to store symbols from an alphabet of the given size.
+
+    Example
+    -------
+    >>> _symbol_dtype(8)
+    <class 'numpy.uint8'>
+    >>> _symbol_dtype(1000)
+    <class 'numpy.uint16'>
+    """
+    for dtype in [numpy.uint8, numpy.uint16, numpy.uint32]:
+        if alphabet_size - 1 <= numpy.iinfo(dtype).max:
+            return dtype
+    return numpy.uint64
+
+
+class SlidingWindowSymbolicAggregateApproximation(TransformerMixin):
+    """Sliding-window Symbolic Aggregate approXimation (SAX) transformation.
+
+    Each window of `window_size` consecutive observations of a (possibly very long) time series is z-normalized and
+    turned into a SAX word of `n_segments` symbols, as in [1]_. Window means, variances and segment means are obtained
+    from prefix sums of the series, so that windows are never materialized: the cost is linear in the length of the
+    series and does not depend on `window_size`.
+
+    Parameters
+    ----------
+    window_size : int
+        Number of observations per window.
+    n_segments : int
+        Number of PAA segments (symbols) per window. If `window_size` is not a multiple of `n_segments`, observations
+        that straddle two segments contribute to both, proportionally to their overlap.
+    alphabet_size_avg : int
+        Number of SAX symbols to use.
+    step : int (default: 1)
+        Number of observations between the starts of two consecutive windows.
+    numerosity_reduction : bool (default: False)
+        Whether a window should be dropped when its word is identical to that of the previous window.
+
+    Attributes
+    ----------
+    breakpoints_avg_ : numpy.ndarray of shape (alphabet_size_avg - 1, )
+        List of breakpoints used to generate SAX symbols
+    breakpoints_avg_middle_ : numpy.ndarray of shape (alphabet_size_avg, )
+        Values associated to SAX symbols
+
+    Note
+    ----
+        Words are returned as arrays of the smallest unsigned integer type that can store `alphabet_size_avg`
+        symbols (`numpy.uint8` for up to 256 symbols).
+        Windows with (near-)zero variance are only centered, not scaled.
+
+    Example
+    -------
+    >>> sw_sax = SlidingWindowSymbolicAggregateApproximation(window_size=4, n_segments=2, alphabet_size_avg=2)
+    >>> ts = [0., 1., 2., 3., 2., 1., 0., 1.]
+    >>> words = sw_sax.fit_transform(ts)
+    >>> words.shape
+    (5, 2, 1)
+    >>> words.dtype
+    dtype('uint8')
+    >>> words[:, :, 0]
+    array([[0, 1],
+           [0, 1],
+           [1, 0],
+           [1, 0],
+           [1, 0]], dtype=uint8)
+    >>> sw_sax = SlidingWindowSymbolicAggregateApproximation(window_size=4, n_segments=2, alphabet_size_avg=2,
+    ...                                                      numerosity_reduction=True)
+    >>> words, starts = sw_sax.fit_transform(ts, return_starts=True)
+    >>> starts
+    array([0, 2])
+    >>> for block_starts, block_words in sw_sax.iter_transform(ts, block_size=3):
+    ...     print(block_starts, block_words[:, :, 0].tolist())
+    [0 2] [[0, 1], [1, 0]]
+    [] []
+
+    References
+    ----------
+    .. [1] J. Lin, E. Keogh, L. Wei, et al. Experiencing SAX: a novel symbolic representation of time series.
+       Data Mining and Knowledge Discovery, 2007. vol. 15(107)
+    """
+    def __init__(self, window_size, n_segments, alphabet_size_avg, step=1, numerosity_reduction=False):
+        self.window_size = window_size
+        self.n_segments = n_segments
+        self.alphabet_size_avg = alphabet_size_avg
+        self.step = step
+        self.numerosity_reduction = numerosity_reduction
+        self.breakpoints_avg_ = _breakpoints(self.alphabet_size_avg)
+        self.breakpoints_avg_middle_ = _bin_medians(self.alphabet_size_avg)
+
+    def fit(self, X=None, y=None):
+        """Fit the model. Breakpoints only depend on the alphabet size, hence this does nothing.
+
+        Parameters
+        ----------
+        X : array-like of shape (sz, d) or None (default: None)
+            Time series (ignored)
+
+        Returns
+        -------
+        SlidingWindowSymbolicAggregateApproximation
+            self
+        """
+        return self
+
+    def iter_transform(self, ts, block_size=4096):
+        """Iterate over the SAX words of the sliding windows of a time series, by blocks of consecutive windows.
+
+        Parameters
+        ----------
+        ts : array-like of shape (sz, d)
+            A time series
+        block_size : int (default: 4096)
+            Number of windows processed at a time. Memory usage is proportional to `block_size * n_segments * d`
+            on top of the prefix sums of the series. With numerosity reduction, blocks can be smaller (or even empty)
+            since repeated words are dropped.
+
+        Yields
+        ------
+        numpy.ndarray of shape (n_block_words, )
+            Start indices of the windows
+        numpy.ndarray of unsigned integers with shape (n_block_words, n_segments, d)
+            SAX words of the windows
+        """
+        ts = to_time_series(ts)
+        sz, d = ts.shape
+        dtype = _symbol_dtype(self.alphabet_size_avg)
+        all_starts = numpy.arange(0, sz - self.window_size + 1, self.step)
+
+        # Centering the whole series first keeps prefix sums of squares accurate on long recordings
+        centered = ts - ts.mean(axis=0)
+        csum = numpy.vstack((numpy.zeros((1, d)), numpy.cumsum(centered, axis=0)))
+        csum2 = numpy.vstack((numpy.zeros((1, d)), numpy.cumsum(centered ** 2, axis=0)))
+
+        # Prefix sums at (possibly fractional) segment boundaries are interpolated between integer positions
+        offsets = numpy.arange(self.n_segments + 1) * float(self.window_size) / self.n_segments
+        offsets_int = numpy.floor(offsets).astype(numpy.int)
+        offsets_frac = (offsets - offsets_int).reshape((1, -1, 1))
+
+        previous_word = None
+        for block_start in range(0, all_starts.shape[0], block_size):
+            starts = all_starts[block_start:block_start + block_size]
+            ends = starts + self.window_size
+            mean = (csum[ends] - csum[starts]) / self.window_size
+            std = numpy.sqrt(numpy.maximum((csum2[ends] - csum2[starts]) / self.window_size - mean ** 2, 0.))
+            std[std < 1e-8] = 1.
+
+            positions = starts.reshape((-1, 1)) + offsets_int.reshape((1, -1))
+            boundary_sums = csum[positions] + offsets_frac * centered[numpy.minimum(positions, sz - 1)]
+            segment_means = numpy.diff(boundary_sums, axis=1) * (float(self.n_segments) / self.window_size)
+            segment_means = (segment_means - mean.reshape((-1, 1, d))) / std.reshape((-1, 1, d))
+            words = _paa_to_symbols(segment_means, self.breakpoints_avg_).astype(dtype)
+
+            if self.numerosity_reduction:
+                keep = numpy.ones(words.shape[0], dtype=bool)
+                keep[1:] = numpy.any(words[1:] != words[:-1], axis=(1, 2))
+                if previous_word is not None:
+                    keep[0] = numpy.any(words[0] != previous_word)
+                previous_word = words[-1]
+                starts, words = starts[keep], words[keep]
+            yield starts, words
+
+    def transform(self, X, y=None, return_starts=False):
+        """Transform a time series into the SAX words of its sliding windows.
+
+        Parameters
+        ----------
+        X : array-like of shape (sz, d)
+            A time series
+        return_starts : bool (default: False)
+            Whether start indices of the windows should be returned as well (useful with numerosity reduction).
+
+        Returns
+        -------
+        numpy.ndarray of unsigned integers with shape (n_words, n_segments, d)
+            SAX words of the windows
+        numpy.ndarray of shape (n_words, )
+            Start indices of the windows. Only returned if `return_starts` is True.
+        """
+        d = to_time_series(X).shape[1]
+        blocks = list(self.iter_transform(X))
+        starts = numpy.concatenate([numpy.zeros((0, ), dtype=numpy.int)] + [s for s, w in blocks])
+        words = numpy.concatenate([numpy.zeros((0, self.n_segments, d), dtype=_symbol_dtype(self.alphabet_size_avg))] +
+                                  [w for s, w in blocks])
+        if return_starts:
+            return words, starts
+        return words
+
+    def fit_transform(self, X, y=None, return_starts=False, **fit_params):
+        """Transform a time series into the SAX words of its sliding windows.
+
+        Parameters
+        ----------
+        X : array-like of shape (sz, d)
+            A time series
+        return_starts : bool (default: False)
+            Whether start indices of the windows should be returned as well (useful with numerosity reduction).
+
+        Returns
+        -------
+        numpy.ndarray of unsigned integers with shape (n_words, n_segments, d)
+            SAX words of the windows
+        numpy.ndarray of shape (n_words, )
+            Start indices of the windows. Only returned if `return_starts` is True.
+        """
+        return self.fit(X, y).transform(X, return_starts=return_starts)
+
+
+def pack_sax_words(X_sax, alphabet_size):
+    """Pack SAX words into compact keys.
+
+    Symbols are stored on `bit_length(alphabet_size - 1)` bits each, in segment-major order with the first segment in
+    the most significant bits. If a whole word fits in 64 bits, keys are `numpy.uint64` integers. Otherwise, keys are
+    fixed-size byte strings holding one symbol per byte (or per pair of bytes for alphabets of more than 256 symbols).
+    In both cases, words that share their first segments share a key prefix (see `sax_word_prefixes`).
+
+    Parameters
+    ----------
+    X_sax : array-like of integers with shape (n_ts, n_segments, d)
+        A dataset of SAX words.
+    alphabet_size : int
+        Number of SAX symbols.
+
+    Returns
+    -------
+    numpy.ndarray of shape (n_ts, )
+        Packed keys, of dtype `numpy.uint64` or fixed-size bytes.
+
+    Example
+    -------
+    >>> pack_sax_words([[[1], [0], [3]], [[3], [3], [3]]], alphabet_size=4)
+    array([19, 63], dtype=uint64)
+    >>> pack_sax_words([[[1], [0], [3]]], alphabet_size=4).nbytes
+    8
+    >>> pack_sax_words(numpy.ones((1, 40, 1), dtype=numpy.int), alphabet_size=8).dtype
+    dtype('S40')
+    """
+    X_sax = numpy.asarray(X_sax)
+    words = X_sax.reshape((X_sax.shape[0], -1))
+    n_symbols = words.shape[1]
+    n_bits = max(bit_length(alphabet_size - 1), 1)
+    if n_bits * n_symbols <= 64:
+        shifts = (n_bits * numpy.arange(n_symbols - 1, -1, -1)).astype(numpy.uint64)
+        return numpy.bitwise_or.reduce(words.astype(numpy.uint64) << shifts, axis=1)
+    words = numpy.ascontiguousarray(words.astype(_symbol_dtype(alphabet_size)))
+    return words.view("S%d" % (n_symbols * words.itemsize)).reshape((-1, ))
+
+
+def unpack_sax_words(keys, alphabet_size, n_segments, d=1):
+    """Recover SAX words from keys produced by `pack_sax_words`.
+
+    Parameters
+    ----------
+    keys : numpy.ndarray of shape (n_ts, )
+        Packed keys.
+    alphabet_size : int
+        Number of SAX symbols.
+    n_segments : int
+        Number of segments per word.
+    d : int (default: 1)
+        Dimension of the words.
+
+    Returns
+    -------
+    numpy.ndarray of integers with shape (n_ts, n_segments, d)
+        SAX words.
+
+    Example
+    -------
+    >>> unpack_sax_words(numpy.array([19, 63], dtype=numpy.uint64), alphabet_size=4, n_segments=3)[:, :, 0]
+    array([[1, 0, 3],
+           [3, 3, 3]])
+    """
+    n_symbols = n_segments * d
+    if keys.dtype == numpy.uint64:
+        n_bits = max(bit_length(alphabet_size - 1), 1)
+        shifts = (n_bits * numpy.arange(n_symbols - 1, -1, -1)).astype(numpy.uint64)
+        words = (keys.reshape((-1, 1)) >> shifts) & numpy.uint64((1 << n_bits) - 1)
+    else:
+        words = numpy.ascontiguousarray(keys).view(_symbol_dtype(alphabet_size)).reshape((-1, n_symbols))
+    return words.astype(numpy.int).reshape((-1, n_segments, d))
+
+
+def sax_word_prefixes(keys, alphabet_size, n_segments, prefix_length, d=1):
+    """Keys of the first `prefix_length` segments of SAX words packed by `pack_sax_words`.
+
+    Parameters
+    ----------
+    keys : numpy.ndarray of shape (n_ts, )
+        Packed keys.
+    alphabet_size : int
+        Number of SAX symbols.
+    n_segments : int
+        Number of segments per word.
+    prefix_length : int
+        Number of leading segments to keep.
+    d : int (default: 1)
+        Dimension of the words.
+
+    Returns
+    -------
+    numpy.ndarray of shape (n_ts, )
+        Prefix keys, of the same kind as `keys`.
+
+    Example
+    -------
+    >>> keys = pack_sax_words([[[1], [0], [3]], [[1], [0], [2]], [[3], [3], [3]]], alphabet_size=4)
+    >>> sax_word_prefixes(keys, alphabet_size=4, n_segments=3, prefix_length=2)
+    array([ 4,  4, 15], dtype=uint64)
+    """
+    if keys.dtype == numpy.uint64:
+        n_bits = max(bit_length(alphabet_size - 1), 1)
+        return keys >> numpy.uint64(n_bits * d * (n_segments - prefix_length))
+    n_bytes = prefix_length * d * numpy.dtype(_symbol_dtype(alphabet_size)).itemsize
+    key_bytes = numpy.ascontiguousarray(keys).view(numpy.uint8).reshape((keys.shape[0], -1))
+    return numpy.ascontiguousarray(key_bytes[:, :n_bytes]).view("S%d" % n_bytes).reshape((-1, ))
+
+
+class SAXWordBuckets(object):
+    """Hash buckets grouping identical (or prefix-identical) SAX words.
+
+    Words are stored as packed keys (see `pack_sax_words`), which takes 8 bytes per word for words of up to 64 bits
+    instead of 8 bytes per symbol. Buckets map a key to the indices of all words sharing that key. They are built
+    on first use for each prefix length and then cached, so that retrieving candidates for a query word is a
+    dictionary lookup rather than a distance scan.
+
+    Parameters
+    ----------
+    alphabet_size : int
+        Number of SAX symbols.
+
+    Attributes
+    ----------
+    keys_ : numpy.ndarray of shape (n_ts, )
+        Packed keys of the fitted words.
+    n_segments_ : int
+        Number of segments per word.
+    d_ : int
+        Dimension of the words.
+
+    Example
+    -------
+    >>> sax = SymbolicAggregateApproximation(n_segments=2, alphabet_size_avg=4)
+    >>> X_sax = sax.fit_transform([[-2., -2., 2., 2.], [-2., -2., 2., 1.9], [-2., -2., 0.1, 0.1], [2., 2., 2., 2.]])
+    >>> buckets = SAXWordBuckets(alphabet_size=4).fit(X_sax)
+    >>> buckets.query(X_sax[0])
+    array([0, 1])
+    >>> buckets.query(X_sax[0], prefix_length=1)
+    array([0, 1, 2])
+    >>> buckets.query([[1], [1]])
+    array([], dtype=int64)
+    >>> sorted(len(indices) for indices in buckets.buckets().values())
+    [1, 1, 2]
+    """
+    def __init__(self, alphabet_size):
+        self.alphabet_size = alphabet_size
+        self.keys_ = None
+        self.n_segments_ = None
+        self.d_ = None
+        self._buckets = {}
+
+    def fit(self, X, y=None):
+        """Pack SAX words and reset buckets.
+
+        Parameters
+        ----------
+        X : array-like of integers with shape (n_ts, n_segments, d)
+            A dataset of SAX words.
+
+        Returns
+        -------
+        SAXWordBuckets
+            self
+        """
+        X_ = numpy.asarray(X)
+        self.n_segments_, self.d_ = X_.shape[1], X_.shape[2]
+        self.keys_ = pack_sax_words(X_, self.alphabet_size)
+        self._buckets = {}
+        return self
+
+    def _prefix_keys(self, keys, prefix_length):
+        if prefix_length is None or prefix_length == self.n_segments_:
+            return keys
+        return sax_word_prefixes(keys, self.alphabet_size, self.n_segments_, prefix_length, d=self.d_)
+
+    def buckets(self, prefix_length=None):
+        """Buckets of words sharing the same first `prefix_length` segments.
+
+        Parameters
+        ----------
+        prefix_length : int or None (default: None)
+            Number of leading segments words should share. If None, whole words are used.
+
+        Returns
+        -------
+        dict
+            Mapping from (prefix) keys to sorted arrays of word indices.
+        """
+        if self.keys_ is None:
+            raise ValueError("Model not fitted yet: cannot be used for querying.")
+        if prefix_length is None:
+            prefix_length = self.n_segments_
+        if prefix_length not in self._buckets:
+            keys = self._prefix_keys(self.keys_, prefix_length)
+            order = numpy.argsort(keys, kind="mergesort")
+            sorted_keys = keys[order]
+            starts = numpy.flatnonzero(numpy.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1])))
+            self._buckets[prefix_length] = dict(zip(sorted_keys[starts].tolist(), numpy.split(order, starts[1:])))
+        return self._buckets[prefix_length]
+
+    def query(self, word, prefix_length=None):
+        """Indices of the fitted words identical to `word` (on their first `prefix_length` segments).
+
+        Parameters
+        ----------
+        word : array-like of integers with shape (n_segments, d)
+            A SAX word.
+        prefix_length : int or None (default: None)
+            Number of leading segments words should share. If None, whole words are used.
+
+        Returns
+        -------
+        numpy.ndarray of integers
+            Sorted indices of matching words (possibly empty).
+        """
+        buckets = self.buckets(prefix_length)
+        key = pack_sax_words(numpy.asarray(word).reshape((1, self.n_segments_, self.d_)), self.alphabet_size)
+        key = self._prefix_keys(key, prefix_length)[0]
+        return buckets.get(key.item(), numpy.zeros((0, ), dtype=numpy.int))
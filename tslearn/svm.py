@@ -3,10 +3,12 @@ The :mod:`tslearn.svm` module contains Support Vector Classifier (SVC) and Suppo
 for time series.
 """
 
+from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.svm import SVC as BaseSVC, SVR as BaseSVR
+from collections import OrderedDict
 import numpy
 
-from tslearn.metrics import cdist_gak, gamma_soft_dtw
+from tslearn.metrics import cdist_gak, gamma_soft_dtw, sigma_gak, _dataset_fingerprint, _nystroem_landmarks
 from tslearn.utils import to_time_series_dataset
 
 
@@ -27,10 +29,110 @@ def _prepare_ts_datasets_sklearn(X):
     return sklearn_X.reshape((n_ts, -1))
 
 
-def _kernel_func_gak(sz, d, gamma):
-    if gamma == "auto":
-        gamma = 1.
-    return lambda x, y: cdist_gak(x.reshape((-1, sz, d)), y.reshape((-1, sz, d)), sigma=numpy.sqrt(gamma / 2.))
+# Gram matrices of recently fitted training sets, keyed by their content and by kernel parameters, so that fitting
+# several models on the same data (e.g. in a grid search over C) computes the Gram matrix only once. The cache is
+# disabled unless a memory budget is set through `set_gram_cache_size`.
+_gram_cache = OrderedDict()
+_gram_cache_max_bytes = 0
+
+
+def set_gram_cache_size(max_bytes):
+    """Set the memory budget of the cache of GAK Gram matrices shared by time series SVMs.
+
+    When the budget is positive, Gram matrices computed when fitting `TimeSeriesSVC` or `TimeSeriesSVR` models with
+    the 'gak' kernel are kept (least recently used first out) as long as they fit in the budget, so that fitting
+    other models with the same kernel parameters on the same data (e.g. in a grid search over C) reuses them.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Maximum total size (in bytes) of cached Gram matrices. 0 (the default) disables the cache and frees it.
+
+    Examples
+    --------
+    >>> from tslearn.generators import random_walk_blobs
+    >>> X, y = random_walk_blobs(n_ts_per_blob=10, sz=16, d=1, n_blobs=2, random_state=0)
+    >>> set_gram_cache_size(2 ** 20)  # Keep up to 1MB of Gram matrices
+    >>> for C in [.1, 1., 10.]:  # The Gram matrix of X is only computed for the first model
+    ...     clf = TimeSeriesSVC(sz=16, d=1, kernel="gak", gamma=.1, C=C).fit(X, y)
+    >>> clf.predict(X).shape
+    (20,)
+    >>> clear_gram_cache()
+    >>> set_gram_cache_size(0)  # Disable the cache again
+    """
+    global _gram_cache_max_bytes
+    _gram_cache_max_bytes = max_bytes
+    _evict_gram_cache()
+
+
+def clear_gram_cache():
+    """Remove all Gram matrices from the cache of GAK Gram matrices shared by time series SVMs.
+
+    See Also
+    --------
+    set_gram_cache_size : Set the memory budget of the cache
+    """
+    _gram_cache.clear()
+
+
+def _evict_gram_cache():
+    while _gram_cache and sum(gram.nbytes for gram in _gram_cache.values()) > _gram_cache_max_bytes:
+        _gram_cache.popitem(last=False)
+
+
+class _GAKKernel(object):
+    """GAK kernel on time series given in scikit-learn format, for use as a callable kernel in SVMs.
+
+    When called with the same array as both arguments (which is what scikit-learn does at fit time) and if the Gram
+    matrix cache is enabled (see `set_gram_cache_size`), the Gram matrix is looked up in (and added to) that cache.
+
+    Examples
+    --------
+    >>> X = _prepare_ts_datasets_sklearn([[1, 2, 3], [2, 2, 3], [3, 2, 1]])
+    >>> kernel = _GAKKernel(sz=3, d=1, gamma=1.)
+    >>> numpy.allclose(kernel(X, X), cdist_gak(X, X, sigma=numpy.sqrt(.5)))
+    True
+    >>> kernel(X, X) is kernel(X, X)
+    False
+    >>> set_gram_cache_size(2 ** 20)
+    >>> kernel(X, X) is kernel(X, X)
+    True
+    >>> set_gram_cache_size(0)
+    """
+    def __init__(self, sz, d, gamma, n_jobs=None):
+        self.sz = sz
+        self.d = d
+        self.sigma = numpy.sqrt((1. if gamma == "auto" else gamma) / 2.)
+        self.n_jobs = n_jobs
+
+    def _gram(self, x, y):
+        return cdist_gak(x.reshape((-1, self.sz, self.d)), y.reshape((-1, self.sz, self.d)), sigma=self.sigma,
+                         n_jobs=self.n_jobs)
+
+    def __call__(self, x, y):
+        if x is not y or _gram_cache_max_bytes <= 0:
+            return self._gram(x, y)
+        key = (_dataset_fingerprint(x), self.sz, self.d, self.sigma)
+        if key in _gram_cache:
+            _gram_cache[key] = _gram_cache.pop(key)  # Move to the end (most recently used)
+            return _gram_cache[key]
+        gram = self._gram(x, x)
+        if gram.nbytes <= _gram_cache_max_bytes:
+            _gram_cache[key] = gram
+            _evict_gram_cache()
+        return gram
+
+
+def _kernel_func_gak(sz, d, gamma, n_jobs=None):
+    return _GAKKernel(sz=sz, d=d, gamma=gamma, n_jobs=n_jobs)
+
+
+def _support_vectors_kernel(kernel, X, X_support, support, n_fit):
+    """Kernel matrix between X and the training set, in which only columns of support vectors (the only ones used for
+    predictions) are computed."""
+    K = numpy.zeros((X.shape[0], n_fit))
+    K[:, support] = kernel(X, X_support)
+    return K
 
 
 class TimeSeriesSVC(BaseSVC):
@@ -94,6 +196,16 @@ class TimeSeriesSVC(BaseSVC):
         generator; If RandomState instance, random_state is the random number
         generator; If None, the random number generator is the RandomState
         instance used by `np.random`.
+    n_jobs : int or None, optional (default=None)
+        The number of jobs to run in parallel for GAK computations. ``None`` means 1 unless in a
+        :obj:`joblib.parallel_backend` context. ``-1`` means using all processors.
+
+    Note
+    ----
+        When a callable kernel (such as 'gak') is used, predictions only require kernel values between test time
+        series and support vectors. Gram matrices computed at fit time with the 'gak' kernel can be cached (see
+        `set_gram_cache_size`), so that fitting several models on the same training set (e.g. during a grid search
+        over `C`) only computes the Gram matrix once.
 
     Attributes
     ----------
@@ -135,6 +247,11 @@ class TimeSeriesSVC(BaseSVC):
     (20, 2)
     >>> clf.predict_proba(X).shape
     (20, 2)
+    >>> from sklearn.svm import SVC
+    >>> clf = TimeSeriesSVC(sz=64, d=2, kernel="gak", gamma=.1).fit(X, y)
+    >>> ref = SVC(kernel="precomputed").fit(cdist_gak(X, sigma=clf.kernel.sigma), y)
+    >>> numpy.allclose(clf.decision_function(X), ref.decision_function(cdist_gak(X, sigma=clf.kernel.sigma)))
+    True
 
     References
     ----------
@@ -144,11 +261,12 @@ class TimeSeriesSVC(BaseSVC):
     """
     def __init__(self, sz, d, C=1.0, kernel="gak", degree=3, gamma="auto", coef0=0.0, shrinking=True,
                  probability=False, tol=0.001, cache_size=200, class_weight=None, verbose=False, max_iter=-1,
-                 decision_function_shape="ovr", random_state=None):
+                 decision_function_shape="ovr", random_state=None, n_jobs=None):
         self.sz = sz
         self.d = d
+        self.n_jobs = n_jobs
         if kernel == "gak":
-            kernel = _kernel_func_gak(sz=sz, d=d, gamma=gamma)
+            kernel = _kernel_func_gak(sz=sz, d=d, gamma=gamma, n_jobs=n_jobs)
         super(TimeSeriesSVC, self).__init__(C=C, kernel=kernel, degree=degree, gamma=gamma, coef0=coef0,
                                             shrinking=shrinking, probability=probability, tol=tol,
                                             cache_size=cache_size, class_weight=class_weight, verbose=verbose,
@@ -167,10 +285,19 @@ class TimeSeriesSVC(BaseSVC):
 
     def fit(self, X, y, sample_weight=None):
         sklearn_X = _prepare_ts_datasets_sklearn(X)
-        if self.kernel == "gak" and self.gamma == "auto":
+        if isinstance(self.kernel, _GAKKernel) and self.gamma == "auto":
             self.gamma = gamma_soft_dtw(to_time_series_dataset(X))
-            self.kernel = _kernel_func_gak(sz=self.sz, d=self.d, gamma=self.gamma)
-        return super(TimeSeriesSVC, self).fit(sklearn_X, y, sample_weight=sample_weight)
+            self.kernel = _kernel_func_gak(sz=self.sz, d=self.d, gamma=self.gamma, n_jobs=self.n_jobs)
+        self._X_support = None
+        super(TimeSeriesSVC, self).fit(sklearn_X, y, sample_weight=sample_weight)
+        if callable(self.kernel):
+            self._X_support = sklearn_X[self.support_]
+        return self
+
+    def _compute_kernel(self, X):
+        if getattr(self, "_X_support", None) is not None:
+            return _support_vectors_kernel(self.kernel, X, self._X_support, self.support_, self.shape_fit_[0])
+        return super(TimeSeriesSVC, self)._compute_kernel(X)
 
     def predict(self, X):
         sklearn_X = _prepare_ts_datasets_sklearn(X)
@@ -237,6 +364,16 @@ class TimeSeriesSVR(BaseSVR):
         properly in a multithreaded context.
     max_iter : int, optional (default=-1)
         Hard limit on iterations within solver, or -1 for no limit.
+    n_jobs : int or None, optional (default=None)
+        The number of jobs to run in parallel for GAK computations. ``None`` means 1 unless in a
+        :obj:`joblib.parallel_backend` context. ``-1`` means using all processors.
+
+    Note
+    ----
+        When a callable kernel (such as 'gak') is used, predictions only require kernel values between test time
+        series and support vectors. Gram matrices computed at fit time with the 'gak' kernel can be cached (see
+        `set_gram_cache_size`), so that fitting several models on the same training set (e.g. during a grid search
+        over `C`) only computes the Gram matrix once.
 
     Attributes
     ----------
@@ -277,11 +414,12 @@ class TimeSeriesSVR(BaseSVR):
     ICML 2011.
     """
     def __init__(self, sz, d, kernel="gak", degree=3, gamma="auto", coef0=0.0, tol=0.001, C=1.0, epsilon=0.1,
-                 shrinking=True, cache_size=200, verbose=False, max_iter=-1):
+                 shrinking=True, cache_size=200, verbose=False, max_iter=-1, n_jobs=None):
         self.sz = sz
         self.d = d
+        self.n_jobs = n_jobs
         if kernel == "gak":
-            kernel = _kernel_func_gak(sz=sz, d=d, gamma=gamma)
+            kernel = _kernel_func_gak(sz=sz, d=d, gamma=gamma, n_jobs=n_jobs)
         super(TimeSeriesSVR, self).__init__(C=C, kernel=kernel, degree=degree, gamma=gamma, coef0=coef0,
                                             shrinking=shrinking, tol=tol, cache_size=cache_size, epsilon=epsilon,
                                             verbose=verbose, max_iter=max_iter)
@@ -292,10 +430,19 @@ class TimeSeriesSVR(BaseSVR):
 
     def fit(self, X, y, sample_weight=None):
         sklearn_X = _prepare_ts_datasets_sklearn(X)
-        if self.kernel == "gak" and self.gamma == "auto":
+        if isinstance(self.kernel, _GAKKernel) and self.gamma == "auto":
             self.gamma = gamma_soft_dtw(to_time_series_dataset(X))
-            self.kernel = _kernel_func_gak(sz=self.sz, d=self.d, gamma=self.gamma)
-        return super(TimeSeriesSVR, self).fit(sklearn_X, y, sample_weight=sample_weight)
+            self.kernel = _kernel_func_gak(sz=self.sz, d=self.d, gamma=self.gamma, n_jobs=self.n_jobs)
+        self._X_support = None
+        super(TimeSeriesSVR, self).fit(sklearn_X, y, sample_weight=sample_weight)
+        if callable(self.kernel):
+            self._X_support = sklearn_X[self.support_]
+        return self
+
+    def _compute_kernel(self, X):
+        if getattr(self, "_X_support", None) is not None:
+            return _support_vectors_kernel(self.kernel, X, self._X_support, self.support_, self.shape_fit_[0])
+        return super(TimeSeriesSVR, self)._compute_kernel(X)
 
     def predict(self, X):
         sklearn_X = _prepare_ts_datasets_sklearn(X)
@@ -303,3 +450,102 @@ class TimeSeriesSVR(BaseSVR):
 
     def score(self, X, y, sample_weight=None):
         return super(TimeSeriesSVR, self).score(X, y, sample_weight=sample_weight)
+
+
+class GlobalAlignmentKernelNystroem(BaseEstimator, TransformerMixin):
+    """Explicit feature map approximating the Global Alignment kernel (GAK) through the Nystroem method.
+
+    The kernel is only evaluated between time series and `n_components` landmark time series sampled from the training
+    set, and embeddings are such that their dot products approximate GAK [1]_. Linear models (e.g.
+    ``sklearn.svm.LinearSVC``) trained on these embeddings then approximate kernel machines using GAK, at a cost that
+    is linear in the number of time series.
+
+    Parameters
+    ----------
+    n_components : int (default: 100)
+        Number of landmark time series (and dimension of the embeddings).
+    sigma : float or "auto" (default: 1.)
+        Bandwidth of the internal gaussian kernel used for GAK. If "auto", it is estimated from the training set
+        (cf :func:`tslearn.metrics.sigma_gak`).
+    random_state : integer or numpy.RandomState or None (default: None)
+        Generator used to sample landmarks. If an integer is given, it fixes the seed. Defaults to the global
+        numpy random number generator.
+    n_jobs : int or None, optional (default=None)
+        The number of jobs to run in parallel for GAK computations. ``None`` means 1 unless in a
+        :obj:`joblib.parallel_backend` context. ``-1`` means using all processors.
+
+    Attributes
+    ----------
+    components_ : numpy.ndarray of shape (n_components, sz, d)
+        Landmark time series.
+    component_indices_ : numpy.ndarray of shape (n_components, )
+        Indices of the landmark time series in the training set.
+    normalization_ : numpy.ndarray of shape (n_components, n_components)
+        Normalization matrix, such that embeddings are obtained by multiplying it with GAK values to the landmarks.
+    sigma_ : float
+        Bandwidth used for GAK.
+
+    Examples
+    --------
+    >>> from tslearn.generators import random_walk_blobs
+    >>> X, y = random_walk_blobs(n_ts_per_blob=10, sz=32, d=1, n_blobs=2, random_state=0)
+    >>> features = GlobalAlignmentKernelNystroem(n_components=20, sigma=2., random_state=0).fit(X)
+    >>> Z = features.transform(X)
+    >>> Z.shape
+    (20, 20)
+    >>> numpy.allclose(numpy.dot(Z, Z.T), cdist_gak(X, sigma=2.))
+    True
+    >>> from sklearn.pipeline import make_pipeline
+    >>> from sklearn.svm import LinearSVC
+    >>> clf = make_pipeline(GlobalAlignmentKernelNystroem(n_components=10, sigma="auto", random_state=0),
+    ...                     LinearSVC()).fit(X, y)
+    >>> clf.predict(X).shape
+    (20,)
+
+    References
+    ----------
+    .. [1] C. K. I. Williams & M. Seeger. Using the Nystroem Method to Speed Up Kernel Machines. NIPS 2001.
+    """
+    def __init__(self, n_components=100, sigma=1., random_state=None, n_jobs=None):
+        self.n_components = n_components
+        self.sigma = sigma
+        self.random_state = random_state
+        self.n_jobs = n_jobs
+
+    def fit(self, X, y=None):
+        """Sample landmark time series and compute the normalization matrix.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_ts, sz, d)
+            Time series dataset.
+
+        Returns
+        -------
+        GlobalAlignmentKernelNystroem
+            self
+        """
+        X_ = to_time_series_dataset(X)
+        self.sigma_ = sigma_gak(X_, random_state=self.random_state) if self.sigma == "auto" else self.sigma
+        self.component_indices_, self.normalization_ = _nystroem_landmarks(
+            X_, self.n_components, lambda Z: cdist_gak(Z, sigma=self.sigma_, n_jobs=self.n_jobs),
+            random_state=self.random_state
+        )
+        self.components_ = X_[self.component_indices_]
+        return self
+
+    def transform(self, X, y=None):
+        """Embed time series into the approximate GAK feature space.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_ts, sz, d)
+            Time series dataset.
+
+        Returns
+        -------
+        numpy.ndarray of shape (n_ts, n_components)
+            Embeddings.
+        """
+        X_ = to_time_series_dataset(X)
+        return numpy.dot(cdist_gak(X_, self.components_, sigma=self.sigma_, n_jobs=self.n_jobs), self.normalization_)